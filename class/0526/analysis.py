@@ -3,27 +3,51 @@
 아이리스 데이터셋 분석 스크립트
 - 분류 문제 해결
 - 다양한 모델 비교 (Tree 계열, LogReg, 앙상블)
-- 하이퍼파라미터 튜닝 (RandomSearchCV)
+- 하이퍼파라미터 튜닝 (RandomSearchCV / Successive Halving / Hyperband)
 - 시각화 (Plotly)
 - 모델 저장 (Pickle)
-"""-
+"""
 
 import pandas as pd
 import numpy as np
 import pickle
 import os
+import argparse
 from datetime import datetime
 
 # 머신러닝 라이브러리
+from sklearn.base import clone
 from sklearn.model_selection import train_test_split, RandomizedSearchCV, cross_val_score
 from sklearn.preprocessing import StandardScaler, LabelEncoder
 from sklearn.tree import DecisionTreeClassifier
-from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier, StackingClassifier
+from sklearn.ensemble import (
+    RandomForestClassifier, GradientBoostingClassifier, HistGradientBoostingClassifier, StackingClassifier
+)
 from sklearn.linear_model import LogisticRegression
 from sklearn.svm import SVC
 from sklearn.metrics import classification_report, confusion_matrix, accuracy_score
 from sklearn.pipeline import Pipeline
 
+# 튜닝 전략 (random / halving / hyperband)
+from tuning import build_search, tune_models_shared, TUNING_STRATEGIES, TUNING_RESOURCES, TUNING_SCHEDULERS
+# 학습 결과 디스크 캐시
+from fit_cache import FitCache
+# OOF 예측 기반 스태킹
+from stacking import OOFStackingClassifier, stack_features
+# 단계별 체크포인트
+from checkpoint import StageCheckpointer
+# 모델 아티팩트 저장 형식 (pickle / mmap + manifest)
+from artifacts import save_object, write_manifest, ARTIFACT_FORMATS, MANIFEST_NAME
+from tree_export import FlatTreeEnsemble, remove_tables, table_path
+# 시각화 그림 일괄 저장 (png / html / skip)
+from figure_export import FigureExporter, FIGURE_FORMATS
+# 단계별 시간/메모리/학습 횟수 기록
+from run_log import RunLogger, search_fit_seconds, RUN_LOG_FORMATS
+# 분산 튜닝 작업 큐
+from distributed import FileTaskQueue
+# 병렬 순열 특성 중요도
+from importance import permutation_importance_parallel
+
 # 시각화 라이브러리
 import plotly.express as px
 import plotly.graph_objects as go
@@ -34,12 +58,152 @@ import plotly.figure_factory as ff
 import warnings
 warnings.filterwarnings('ignore')
 
+# memory_lean 모드에서 prepare_data 이후 기본 시각화용으로 self.df에 남기는 최대 행 수
+LEAN_SAMPLE_ROWS = 10_000
+# 기본 시각화(분포, 산점도 매트릭스, 박스플롯)에 그리는 최대 특성 수
+BASIC_PLOT_FEATURES = 4
+
+class _LeanSplit:
+    """
+    memory_lean 모드에서 X_train, X_val_scaled, y_test 같은 분할 속성을
+    하나의 float32 특성 배열과 분할 인덱스로부터 접근할 때마다 만들어 주는 디스크립터.
+    일반 모드(split_index가 없을 때)에는 보통 인스턴스 속성처럼 저장된 값을 돌려줍니다.
+    """
+
+    def __init__(self, source, split=None, scaled=False):
+        self.source = source
+        self.split = split
+        self.scaled = scaled
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        if instance.__dict__.get('split_index') is None:
+            return instance.__dict__.get(self.name)
+        return instance._lean_view(self.source, self.split, self.scaled)
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.name] = value
+
+
+# 부스팅 엔진: exact(GradientBoostingClassifier), histogram(HistGradientBoostingClassifier), both(둘 다 비교)
+BOOSTING_ENGINES = ('exact', 'histogram', 'both')
+# 스태킹 베이스 모델 (이름, 모델) - 정의된 모델만 사용
+STACKING_BASE_MODELS = [('dt', 'DecisionTree'), ('rf', 'RandomForest'), ('gb', 'GradientBoosting'),
+                        ('hgb', 'HistGradientBoosting')]
+
+
 class IrisAnalysis:
-    def __init__(self, data_path='datasets/Iris.csv'):
+    # memory_lean 모드에서 특성 배열 + 인덱스로 만들어지는 속성 (일반 모드에서는 일반 속성)
+    X = _LeanSplit('X')
+    X_temp = _LeanSplit('X', 'temp')
+    X_train = _LeanSplit('X', 'train')
+    X_val = _LeanSplit('X', 'val')
+    X_test = _LeanSplit('X', 'test')
+    X_train_scaled = _LeanSplit('X', 'train', scaled=True)
+    X_val_scaled = _LeanSplit('X', 'val', scaled=True)
+    X_test_scaled = _LeanSplit('X', 'test', scaled=True)
+    y_temp = _LeanSplit('y', 'temp')
+    y_train = _LeanSplit('y', 'train')
+    y_val = _LeanSplit('y', 'val')
+    y_test = _LeanSplit('y', 'test')
+    
+    # 체크포인트에 저장할 load/prepare/evaluate 단계 출력 속성
+    LOADED_ATTRIBUTES = ['df']
+    PREPARED_ATTRIBUTES = ['X', 'y', 'X_temp', 'X_test', 'y_temp', 'y_test', 'X_train', 'X_val', 'y_train', 'y_val',
+                           'X_train_scaled', 'X_val_scaled', 'X_test_scaled', 'scaler', 'label_encoder',
+                           'feature_names']
+    LEAN_PREPARED_ATTRIBUTES = ['features', 'split_index', 'y', 'scaler', 'label_encoder', 'feature_names', 'df']
+    EVALUATED_ATTRIBUTES = ['test_results', 'best_model_name']
+    # ID / 타겟 컬럼 (OutOfCoreAnalysis는 --id-column, --target-column으로 지정)
+    id_column = 'Id'
+    target_column = 'Species'
+    
+    def __init__(self, data_path='datasets/Iris.csv', tuning_strategy='random',
+                 tuning_resource='n_samples', halving_factor=3, tuning_scheduler='sequential',
+                 n_jobs=-1, fit_cache_dir=None, fit_cache_max_mb=1024, reuse_cv_results=False,
+                 checkpoint_dir=None, memory_lean=False, artifact_format='pickle', figure_format='png',
+                 figure_workers=1, boosting_engine='exact', run_log_format='json', n_iter=50,
+                 queue_dir='cache/queue', local_workers=0, heartbeat_timeout=30.0,
+                 importance_repeats=5, importance_max_samples=None):
         """
         아이리스 분석 클래스 초기화
+
+        Args:
+            data_path: 데이터셋 CSV 경로
+            tuning_strategy: 하이퍼파라미터 튜닝 전략 ('random', 'halving', 'hyperband', 'warm_start':
+                n_estimators를 탐색하는 앙상블은 warm_start로 트리를 추가하며 크기마다 평가, 그 밖의 모델은 'random'과 동일)
+            tuning_resource: halving/hyperband에서 늘려가는 자원 ('n_samples', 'n_estimators')
+            halving_factor: 반복마다 남길 후보 비율의 역수 (3이면 1/3만 다음 단계로)
+            tuning_scheduler: 'sequential'(모델별 차례대로 탐색), 'shared'(모든 모델의 후보 학습을
+                하나의 워커 풀에서 실행, random 전략 전용) 또는 'distributed'(shared와 같은 작업을
+                파일 작업 큐에 올려 여러 노드의 워커가 실행)
+            n_jobs: 튜닝에 사용할 전체 코어 수 (-1이면 모든 코어)
+            fit_cache_dir: 학습된 추정기와 CV 점수를 저장할 캐시 디렉토리 (None이면 캐시 사용 안 함)
+            fit_cache_max_mb: 캐시 최대 용량 (MB, 넘으면 오래 사용하지 않은 항목부터 삭제)
+            reuse_cv_results: 튜닝의 cv_results_와 out-of-fold 예측을 CV 통계와 스태킹에 재사용
+                (기본 False: 최적 모델 CV와 StackingClassifier를 다시 학습)
+            checkpoint_dir: 단계별 체크포인트 디렉토리 (None이면 매번 모든 단계 실행)
+            memory_lean: 특성을 하나의 float32 배열과 분할 인덱스로만 보관하고,
+                스케일링은 모델 Pipeline 안에서 학습 fold마다 수행 (분할/스케일링된 사본을 미리 만들지 않음).
+                원본 df는 LEAN_SAMPLE_ROWS행 시각화 표본으로 줄임
+            artifact_format: save_models 저장 형식 ('pickle' 또는 'mmap': 큰 배열을 압축 없이 두고
+                mmap으로 불러와 서빙 프로세스 간에 공유, 트리 모델은 노드 테이블도 저장)
+            figure_format: 시각화 저장 형식 ('png', 'html': 이미지 렌더링 없이 빠르게 저장, 'skip': 저장 안 함)
+            figure_workers: PNG 렌더링 프로세스 수 (kaleido 0.2.x에서 그림을 나눠 렌더링)
+            boosting_engine: 부스팅 모델 엔진 ('exact': GradientBoostingClassifier,
+                'histogram': 히스토그램 분할·멀티스레드·조기 종료 HistGradientBoostingClassifier, 'both': 둘 다 비교)
+            run_log_format: 단계별 실행 기록(models/run_log.*) 형식 ('json' 또는 'parquet')
+            n_iter: 모델별로 시도할 하이퍼파라미터 조합 수 (큰 데이터 벤치마크에서는 줄여서 사용)
+            queue_dir: distributed 스케줄러의 작업 큐 디렉토리 (여러 노드에서 쓰려면 공유 파일시스템 경로)
+            local_workers: distributed 스케줄러에서 이 호스트에 띄울 워커 프로세스 수
+                (0이면 다른 곳에서 실행한 워커만 사용)
+            heartbeat_timeout: 이 시간(초) 동안 heartbeat가 없는 워커의 작업은 다른 워커에게 다시 배정
+            importance_repeats: 최고 모델의 순열 특성 중요도에서 특성마다 섞는 횟수
+            importance_max_samples: 순열 중요도에 사용할 검증 세트 행 수(int) 또는 비율(0~1 float)
+                (None이면 전체, 큰 검증 세트에서 비용을 줄일 때 사용)
         """
+        if tuning_strategy not in TUNING_STRATEGIES:
+            raise ValueError(f"지원하지 않는 튜닝 전략입니다: {tuning_strategy}")
+        if tuning_resource not in TUNING_RESOURCES:
+            raise ValueError(f"지원하지 않는 튜닝 자원입니다: {tuning_resource}")
+        if tuning_scheduler not in TUNING_SCHEDULERS:
+            raise ValueError(f"지원하지 않는 튜닝 스케줄러입니다: {tuning_scheduler}")
+        if tuning_scheduler in ('shared', 'distributed') and tuning_strategy != 'random':
+            raise ValueError(f"{tuning_scheduler} 스케줄러는 random 튜닝 전략에서만 사용할 수 있습니다")
+        if boosting_engine not in BOOSTING_ENGINES:
+            raise ValueError(f"지원하지 않는 부스팅 엔진입니다: {boosting_engine}")
+        if artifact_format not in ARTIFACT_FORMATS:
+            raise ValueError(f"지원하지 않는 저장 형식입니다: {artifact_format}")
+        if run_log_format not in RUN_LOG_FORMATS:
+            raise ValueError(f"지원하지 않는 실행 기록 형식입니다: {run_log_format}")
+
         self.data_path = data_path
+        self.tuning_strategy = tuning_strategy
+        self.tuning_resource = tuning_resource
+        self.halving_factor = halving_factor
+        self.tuning_scheduler = tuning_scheduler
+        self.n_jobs = n_jobs
+        self.n_iter = n_iter
+        self.queue_dir = queue_dir
+        self.local_workers = local_workers
+        self.heartbeat_timeout = heartbeat_timeout
+        self.importance_repeats = importance_repeats
+        self.importance_max_samples = importance_max_samples
+        self.fit_cache = FitCache(fit_cache_dir, max_bytes=fit_cache_max_mb * 1024 * 1024)
+        self.reuse_cv_results = reuse_cv_results
+        self.checkpointer = StageCheckpointer(checkpoint_dir)
+        self.memory_lean = memory_lean
+        self.artifact_format = artifact_format
+        self.boosting_engine = boosting_engine
+        self.figure_exporter = FigureExporter('visualizations', figure_format, figure_workers)
+        self.run_log_format = run_log_format
+        self.run_log = RunLogger(fit_counter=lambda: self.fit_cache.fits)
+        self.features = None
+        self.split_index = None
         self.df = None
         self.X = None
         self.y = None
@@ -54,14 +218,18 @@ class IrisAnalysis:
         self.models = {}
         self.best_models = {}
         self.results = {}
+        self.oof_probas = {}
         
         # 결과 저장 폴더 생성
         os.makedirs('models', exist_ok=True)
         os.makedirs('visualizations', exist_ok=True)
         
-    def load_and_explore_data(self):
+    def load_and_explore_data(self, visualize=True):
         """
         데이터 로드 및 탐색적 데이터 분석
+
+        Args:
+            visualize: 기본 시각화까지 생성할지 여부 (파이프라인에서는 visualize 단계에서 생성)
         """
         print("=" * 50)
         print("1. 데이터 로드 및 탐색")
@@ -75,77 +243,76 @@ class IrisAnalysis:
         print(f"\n기본 통계:")
         print(self.df.describe())
         print(f"\n클래스 분포:")
-        print(self.df['Species'].value_counts())
+        print(self.df[self.target_column].value_counts())
         print(f"\n결측값:")
         print(self.df.isnull().sum())
         
         # 기본 시각화
-        self.create_basic_visualizations()
+        if visualize:
+            self.create_basic_visualizations()
         
     def create_basic_visualizations(self):
         """
         기본 데이터 시각화 생성
+        특성은 feature_names(없으면 ID/타겟을 뺀 df 컬럼) 중 앞의 BASIC_PLOT_FEATURES개, 색은 타겟 클래스로 구분합니다.
         """
         print("\n기본 시각화 생성 중...")
         
-        # 1. 특성별 분포 히스토그램
-        fig = make_subplots(
-            rows=2, cols=2,
-            subplot_titles=['Sepal Length', 'Sepal Width', 'Petal Length', 'Petal Width']
-        )
+        features = getattr(self, 'feature_names', None) or [
+            c for c in self.df.columns if c not in (self.id_column, self.target_column)
+        ]
+        features = features[:BASIC_PLOT_FEATURES]
+        # 숫자 레이블도 연속 색상이 아닌 클래스별 색으로 표시
+        target = self.df[self.target_column].astype(str)
+        classes = target.unique()
+        n_rows = -(-len(features) // 2)
+        positions = [(i // 2 + 1, i % 2 + 1) for i in range(len(features))]
         
-        features = ['SepalLengthCm', 'SepalWidthCm', 'PetalLengthCm', 'PetalWidthCm']
-        positions = [(1,1), (1,2), (2,1), (2,2)]
+        # 1. 특성별 분포 히스토그램
+        fig = make_subplots(rows=n_rows, cols=2, subplot_titles=features)
         
         for feature, pos in zip(features, positions):
-            for species in self.df['Species'].unique():
-                data = self.df[self.df['Species'] == species][feature]
+            for label in classes:
+                data = self.df[target == label][feature]
                 fig.add_trace(
-                    go.Histogram(x=data, name=f'{species}', opacity=0.7, nbinsx=15),
+                    go.Histogram(x=data, name=f'{label}', opacity=0.7, nbinsx=15),
                     row=pos[0], col=pos[1]
                 )
         
         fig.update_layout(
-            title="아이리스 특성별 분포",
-            height=600,
+            title="특성별 분포",
+            height=300 * n_rows,
             showlegend=True
         )
-        fig.write_image("visualizations/feature_distributions.png")
-        print("✓ 특성별 분포 히스토그램 저장: visualizations/feature_distributions.png")
+        self.figure_exporter.add(fig, "feature_distributions", "특성별 분포 히스토그램")
         
         # 2. 산점도 매트릭스
         fig = px.scatter_matrix(
             self.df,
-            dimensions=['SepalLengthCm', 'SepalWidthCm', 'PetalLengthCm', 'PetalWidthCm'],
-            color='Species',
-            title="아이리스 특성 간 상관관계"
+            dimensions=features,
+            color=target,
+            labels={'color': self.target_column},
+            title="특성 간 상관관계"
         )
-        fig.write_image("visualizations/scatter_matrix.png")
-        print("✓ 산점도 매트릭스 저장: visualizations/scatter_matrix.png")
+        self.figure_exporter.add(fig, "scatter_matrix", "산점도 매트릭스")
         
         # 3. 박스플롯
-        fig = make_subplots(
-            rows=2, cols=2,
-            subplot_titles=['Sepal Length', 'Sepal Width', 'Petal Length', 'Petal Width']
-        )
+        fig = make_subplots(rows=n_rows, cols=2, subplot_titles=features)
         
-        for i, feature in enumerate(features):
-            row = (i // 2) + 1
-            col = (i % 2) + 1
-            
-            for species in self.df['Species'].unique():
-                data = self.df[self.df['Species'] == species][feature]
+        for i, (feature, pos) in enumerate(zip(features, positions)):
+            for label in classes:
+                data = self.df[target == label][feature]
                 fig.add_trace(
-                    go.Box(y=data, name=f'{species}', showlegend=(i==0)),
-                    row=row, col=col
+                    go.Box(y=data, name=f'{label}', showlegend=(i==0)),
+                    row=pos[0], col=pos[1]
                 )
         
         fig.update_layout(
-            title="아이리스 특성별 박스플롯",
-            height=600
+            title="특성별 박스플롯",
+            height=300 * n_rows
         )
-        fig.write_image("visualizations/boxplots.png")
-        print("✓ 박스플롯 저장: visualizations/boxplots.png")
+        self.figure_exporter.add(fig, "boxplots", "박스플롯")
+        self.figure_exporter.flush()
         
     def prepare_data(self):
         """
@@ -156,8 +323,12 @@ class IrisAnalysis:
         print("=" * 50)
         
         # 특성과 타겟 분리
-        self.X = self.df.drop(['Id', 'Species'], axis=1)
-        self.y = self.df['Species']
+        if self.memory_lean:
+            self._prepare_lean()
+            return
+        self.X = self.df.drop(columns=[c for c in (self.id_column, self.target_column) if c in self.df.columns])
+        self.y = self.df[self.target_column]
+        self.feature_names = list(self.X.columns)
         
         # 레이블 인코딩
         self.y = self.label_encoder.fit_transform(self.y)
@@ -180,6 +351,44 @@ class IrisAnalysis:
         print(f"검증 세트: {self.X_val.shape}")
         print(f"테스트 세트: {self.X_test.shape}")
         
+    def _prepare_lean(self):
+        """
+        memory_lean 모드 전처리: 특성은 연속된 float32 배열 하나로, 분할은 정수 인덱스 배열로만 보관합니다.
+        분할 결과(행 선택과 순서)는 일반 모드의 train_test_split과 같습니다.
+        원본 df는 기본 시각화용 결정적 표본(최대 LEAN_SAMPLE_ROWS행)으로 줄여 float64 사본을 남기지 않습니다.
+        """
+        self.feature_names = [c for c in self.df.columns if c not in (self.id_column, self.target_column)]
+        self.features = np.ascontiguousarray(self.df[self.feature_names].to_numpy(dtype=np.float32))
+        self.y = self.label_encoder.fit_transform(self.df[self.target_column])
+        
+        index_dtype = np.int32 if len(self.y) < 2 ** 31 else np.int64
+        positions = np.arange(len(self.y), dtype=index_dtype)
+        temp, test = train_test_split(positions, test_size=0.2, random_state=42, stratify=self.y)
+        train, val = train_test_split(temp, test_size=0.25, random_state=42, stratify=self.y[temp])
+        # 스케일러는 저장/배치 추론용으로 학습 행 통계만 계산 (스케일링된 사본은 만들지 않음)
+        self.scaler.fit(self.features[train])
+        self.split_index = {'temp': temp, 'train': train, 'val': val, 'test': test}
+        if len(self.df) > LEAN_SAMPLE_ROWS:
+            self.df = self.df.sample(n=LEAN_SAMPLE_ROWS, random_state=42).sort_index().reset_index(drop=True)
+        
+        n_features = len(self.feature_names)
+        print(f"특성 배열: {self.features.shape} float32 ({self.features.nbytes / 1024:.1f} KB, 분할은 인덱스로 보관)")
+        print(f"훈련 세트: ({len(train)}, {n_features})")
+        print(f"검증 세트: ({len(val)}, {n_features})")
+        print(f"테스트 세트: ({len(test)}, {n_features})")
+        
+    def _lean_view(self, source, split, scaled):
+        """memory_lean 모드에서 분할 속성 값을 필요할 때 만듭니다 (행 선택 사본은 호출한 쪽이 쓰고 버림)"""
+        index = None if split is None else self.split_index[split]
+        if source == 'y':
+            return self.y[index]
+        if index is None:
+            # 전체 특성은 복사 없이 배열 위의 DataFrame으로 반환
+            return pd.DataFrame(self.features, columns=self.feature_names, copy=False)
+        if scaled:
+            return self.scaler.transform(self.features[index])
+        return pd.DataFrame(self.features[index], columns=self.feature_names, index=index)
+        
     def define_models(self):
         """
         모델 정의 및 하이퍼파라미터 그리드 설정
@@ -231,10 +440,68 @@ class IrisAnalysis:
             }
         }
         
+        if self.boosting_engine in ('histogram', 'both'):
+            # 특성 값을 최대 255개 구간으로 나눈 히스토그램으로 분할을 찾고(OpenMP 멀티스레드),
+            # 학습 데이터의 10%를 떼어 낸 검증 점수가 10회 연속 나아지지 않으면 반복을 멈춤
+            self.models['HistGradientBoosting'] = {
+                'model': HistGradientBoostingClassifier(
+                    max_iter=500,
+                    early_stopping=True,
+                    validation_fraction=0.1,
+                    n_iter_no_change=10,
+                    random_state=42
+                ),
+                'params': {
+                    'learning_rate': [0.01, 0.1, 0.2],
+                    'max_depth': [3, 5, 7, None],
+                    'max_leaf_nodes': [15, 31, 63],
+                    'l2_regularization': [0.0, 0.1, 1.0]
+                },
+                'use_scaling': False
+            }
+        if self.boosting_engine == 'histogram':
+            del self.models['GradientBoosting']
+        
+        if self.memory_lean:
+            # 스케일링이 필요한 모델은 Pipeline 안에서 학습 fold마다 스케일링 (미리 스케일링된 사본 불필요)
+            for model_info in self.models.values():
+                if model_info['use_scaling']:
+                    model_info['model'] = Pipeline([('scaler', StandardScaler()), ('model', model_info['model'])])
+                    model_info['params'] = {f'model__{k}': v for k, v in model_info['params'].items()}
+                    model_info['use_scaling'] = False
+        
         print("정의된 모델들:")
         for name in self.models.keys():
             print(f"- {name}")
             
+    def _select_data(self, model_info):
+        """
+        모델의 스케일링 여부에 맞는 (훈련, 검증) 데이터 반환
+        """
+        if model_info['use_scaling']:
+            return self.X_train_scaled, self.X_val_scaled
+        return self.X_train, self.X_val
+        
+    def _tune_shared(self, task_queue=None):
+        """
+        모든 모델의 (후보, fold) 학습을 한 번에 실행 (task_queue가 있으면 작업 큐의 워커가 실행)
+        """
+        return tune_models_shared(
+            {
+                name: (model_info['model'], model_info['params'], self._select_data(model_info)[0])
+                for name, model_info in self.models.items()
+            },
+            self.y_train,
+            n_iter=self.n_iter,
+            cv=5,
+            scoring='accuracy',
+            random_state=42,
+            n_jobs=self.n_jobs,
+            fit_cache=self.fit_cache,
+            return_oof=self.reuse_cv_results,
+            task_queue=task_queue
+        )
+
     def train_and_tune_models(self):
         """
         모델 훈련 및 하이퍼파라미터 튜닝
@@ -242,51 +509,93 @@ class IrisAnalysis:
         print("\n" + "=" * 50)
         print("4. 모델 훈련 및 하이퍼파라미터 튜닝")
         print("=" * 50)
+        print(f"튜닝 전략: {self.tuning_strategy} (자원: {self.tuning_resource}, 스케줄러: {self.tuning_scheduler})")
+        
+        # shared 스케줄러: 모든 모델의 (후보, fold) 학습을 하나의 워커 풀에서 한 번에 실행
+        # distributed 스케줄러: 같은 학습 작업을 파일 작업 큐에 올려 큐를 보는 워커들이 실행
+        shared_searches = {}
+        if self.tuning_scheduler == 'shared':
+            print(f"\n모든 모델 동시 튜닝 중 (공유 워커 풀)...")
+            with self.run_log.model('(shared pool)'):
+                shared_searches = self._tune_shared()
+        elif self.tuning_scheduler == 'distributed':
+            print(f"\n모든 모델 동시 튜닝 중 (작업 큐: {self.queue_dir}, 로컬 워커 {self.local_workers}개)...")
+            with self.run_log.model('(distributed queue)'), \
+                    FileTaskQueue(self.queue_dir, heartbeat_timeout=self.heartbeat_timeout,
+                                  local_workers=self.local_workers) as task_queue:
+                shared_searches = self._tune_shared(task_queue)
         
         for name, model_info in self.models.items():
-            print(f"\n{name} 모델 튜닝 중...")
+            # 모델별 튜닝 시간과 fit 횟수 기록 (shared 스케줄러는 공유 풀 전체를 따로 기록)
+            with self.run_log.model(name) as record:
+                # 데이터 선택 (스케일링 여부에 따라)
+                X_train, X_val = self._select_data(model_info)
             
-            # 데이터 선택 (스케일링 여부에 따라)
-            if model_info['use_scaling']:
-                X_train = self.X_train_scaled
-                X_val = self.X_val_scaled
-            else:
-                X_train = self.X_train
-                X_val = self.X_val
+                if name in shared_searches:
+                    print(f"\n{name} 모델 튜닝 결과")
+                    search = shared_searches[name]
+                else:
+                    print(f"\n{name} 모델 튜닝 중...")
+                    # 튜닝 전략에 맞는 탐색으로 하이퍼파라미터 튜닝 (random이면 n_iter(기본 50)번의 랜덤 조합 시도)
+                    search = build_search(
+                        model_info['model'],
+                        model_info['params'],
+                        strategy=self.tuning_strategy,
+                        resource=self.tuning_resource,
+                        n_iter=self.n_iter,
+                        cv=5,
+                        factor=self.halving_factor,
+                        scoring='accuracy',
+                        random_state=42,
+                        n_jobs=self.n_jobs,
+                        return_oof=self.reuse_cv_results
+                    )
+                    search = self.fit_cache.fit(search, X_train, self.y_train)
             
-            # RandomizedSearchCV로 하이퍼파라미터 튜닝
-            random_search = RandomizedSearchCV(
-                model_info['model'],
-                model_info['params'],
-                n_iter=50,  # 50번의 랜덤 조합 시도
-                cv=5,
-                scoring='accuracy',
-                random_state=42,
-                n_jobs=-1
-            )
+                record['candidates'] = len(search.cv_results_['params'])
+                record['fit_seconds'] = round(search_fit_seconds(search), 4)
             
-            random_search.fit(X_train, self.y_train)
+                # 최적 모델 저장
+                self.best_models[name] = search.best_estimator_
             
-            # 최적 모델 저장
-            self.best_models[name] = random_search.best_estimator_
+                # 검증 세트에서 성능 평가
+                val_score = search.best_estimator_.score(X_val, self.y_val)
             
-            # 검증 세트에서 성능 평가
-            val_score = random_search.best_estimator_.score(X_val, self.y_val)
+                # 교차 검증 점수
+                if self.reuse_cv_results:
+                    # 탐색이 같은 5-fold로 이미 계산한 최적 후보의 fold별 점수 재사용
+                    cv_mean = search.cv_results_['mean_test_score'][search.best_index_]
+                    cv_std = search.cv_results_['std_test_score'][search.best_index_]
+                    # 스태킹 메타 모델 학습용 out-of-fold 예측 (random / warm_start / shared는 탐색 중에 이미 수집)
+                    oof_proba = getattr(search, 'oof_proba_', None)
+                    if oof_proba is None:
+                        # halving / hyperband는 fold 모델을 남기지 않으므로 최적 모델로 5-fold CV를 한 번 더 실행
+                        print("  (halving/hyperband: 최적 후보 OOF 예측을 위해 5-fold CV 1회 추가 학습)")
+                        record['oof_extra_cv'] = True
+                        oof_proba = self.fit_cache.cross_val_predict(
+                            search.best_estimator_, X_train, self.y_train, cv=5, method='predict_proba'
+                        )
+                    self.oof_probas[name] = oof_proba
+                else:
+                    cv_scores = self.fit_cache.cross_val_score(search.best_estimator_, X_train, self.y_train, cv=5)
+                    cv_mean, cv_std = cv_scores.mean(), cv_scores.std()
             
-            # 교차 검증 점수
-            cv_scores = cross_val_score(random_search.best_estimator_, X_train, self.y_train, cv=5)
+                self.results[name] = {
+                    'best_params': search.best_params_,
+                    'best_cv_score': search.best_score_,
+                    'val_score': val_score,
+                    'cv_mean': cv_mean,
+                    'cv_std': cv_std,
+                    'tuning_strategy': self.tuning_strategy
+                }
             
-            self.results[name] = {
-                'best_params': random_search.best_params_,
-                'best_cv_score': random_search.best_score_,
-                'val_score': val_score,
-                'cv_mean': cv_scores.mean(),
-                'cv_std': cv_scores.std()
-            }
-            
-            print(f"✓ 최적 파라미터: {random_search.best_params_}")
-            print(f"✓ CV 점수: {random_search.best_score_:.4f}")
-            print(f"✓ 검증 점수: {val_score:.4f}")
+                print(f"✓ 최적 파라미터: {search.best_params_}")
+                if getattr(search.best_estimator_, 'do_early_stopping_', False):
+                    print(f"✓ 조기 종료 반복 수: {search.best_estimator_.n_iter_} (최대 {search.best_estimator_.max_iter})")
+                if hasattr(search, 'n_trees_built_'):
+                    print(f"✓ warm_start 학습 트리: {search.n_trees_built_:,}개 (후보별로 처음부터 학습 시 {search.n_trees_from_scratch_:,}개)")
+                print(f"✓ CV 점수: {search.best_score_:.4f}")
+                print(f"✓ 검증 점수: {val_score:.4f}")
             
     def create_stacking_ensemble(self):
         """
@@ -296,30 +605,43 @@ class IrisAnalysis:
         print("5. 스태킹 앙상블 모델 생성")
         print("=" * 50)
         
-        # 베이스 모델들 (스케일링이 필요한 모델과 아닌 모델 분리)
-        base_models = [
-            ('dt', self.best_models['DecisionTree']),
-            ('rf', self.best_models['RandomForest']),
-            ('gb', self.best_models['GradientBoosting'])
-        ]
+        # 베이스 모델들 (트리 기반 모델, 부스팅 엔진 설정에 따라 정의된 모델만)
+        base_names = [(alias, name) for alias, name in STACKING_BASE_MODELS if name in self.best_models]
+        base_models = [(alias, self.best_models[name]) for alias, name in base_names]
         
         # 메타 모델 (로지스틱 회귀)
         meta_model = LogisticRegression(random_state=42)
         
-        # 스태킹 분류기 생성
-        stacking_clf = StackingClassifier(
-            estimators=base_models,
-            final_estimator=meta_model,
-            cv=5,
-            stack_method='predict_proba'
-        )
-        
-        # 훈련
-        stacking_clf.fit(self.X_train, self.y_train)
+        if self.reuse_cv_results:
+            # 튜닝에서 얻은 OOF 예측으로 메타 모델만 학습 (베이스 모델은 이미 전체 훈련 데이터로 학습됨)
+            oof_probas = [self.oof_probas[name] for _, name in base_names]
+            oof_features = stack_features(oof_probas)
+            # 메타 모델 학습 (학습 캐시를 거치므로 실제로 학습한 경우에만 fit 횟수에 포함)
+            fitted_meta = self.fit_cache.fit(clone(meta_model), oof_features, self.y_train)
+            stacking_clf = OOFStackingClassifier(
+                estimators=base_models,
+                final_estimator=meta_model
+            ).fit_from_oof(oof_probas, self.y_train, fitted_final_estimator=fitted_meta)
+            # 고정된 OOF 특성 위에서 메타 모델만 교차 검증 (베이스 모델은 fold마다 다시 튜닝/학습하지 않음)
+            # 베이스 모델 선택이 같은 fold를 이미 보았으므로 5x5 중첩 CV보다 낙관적인 추정치
+            cv_scores = self.fit_cache.cross_val_score(meta_model, oof_features, self.y_train, cv=5)
+            cv_scope = 'meta_only'
+        else:
+            # 스태킹 분류기 생성
+            stacking_clf = StackingClassifier(
+                estimators=base_models,
+                final_estimator=meta_model,
+                cv=5,
+                stack_method='predict_proba'
+            )
+            
+            # 훈련
+            stacking_clf = self.fit_cache.fit(stacking_clf, self.X_train, self.y_train)
+            cv_scores = self.fit_cache.cross_val_score(stacking_clf, self.X_train, self.y_train, cv=5)
+            cv_scope = 'nested'
         
         # 검증 세트에서 성능 평가
         val_score = stacking_clf.score(self.X_val, self.y_val)
-        cv_scores = cross_val_score(stacking_clf, self.X_train, self.y_train, cv=5)
         
         self.best_models['StackingEnsemble'] = stacking_clf
         self.results['StackingEnsemble'] = {
@@ -327,10 +649,16 @@ class IrisAnalysis:
             'best_cv_score': cv_scores.mean(),
             'val_score': val_score,
             'cv_mean': cv_scores.mean(),
-            'cv_std': cv_scores.std()
+            'cv_std': cv_scores.std(),
+            # meta_only: OOF 특성 고정, 메타 모델만 CV (낙관적) / nested: 베이스 모델까지 fold마다 재학습
+            'cv_scope': cv_scope
         }
         
-        print(f"✓ 스태킹 앙상블 CV 점수: {cv_scores.mean():.4f} ± {cv_scores.std():.4f}")
+        if cv_scope == 'meta_only':
+            print(f"✓ 스태킹 앙상블 CV 점수 (메타 모델만 CV, OOF 특성 고정 - 낙관적 추정): "
+                  f"{cv_scores.mean():.4f} ± {cv_scores.std():.4f}")
+        else:
+            print(f"✓ 스태킹 앙상블 CV 점수: {cv_scores.mean():.4f} ± {cv_scores.std():.4f}")
         print(f"✓ 스태킹 앙상블 검증 점수: {val_score:.4f}")
         
     def evaluate_models(self):
@@ -345,7 +673,7 @@ class IrisAnalysis:
         
         for name, model in self.best_models.items():
             # 테스트 데이터 선택
-            if name == 'LogisticRegression':
+            if self.models.get(name, {}).get('use_scaling'):
                 X_test = self.X_test_scaled
             else:
                 X_test = self.X_test
@@ -363,7 +691,7 @@ class IrisAnalysis:
             print(f"테스트 정확도: {test_score:.4f}")
             print("분류 리포트:")
             print(classification_report(self.y_test, y_pred, 
-                                      target_names=self.label_encoder.classes_))
+                                      target_names=self.label_encoder.classes_.astype(str)))
         
         # 최고 성능 모델 찾기
         best_model_name = max(test_results.keys(), 
@@ -403,17 +731,16 @@ class IrisAnalysis:
             yaxis_title='정확도',
             barmode='group'
         )
-        fig.write_image("visualizations/model_performance_comparison.png")
-        print("✓ 모델 성능 비교 차트 저장: visualizations/model_performance_comparison.png")
+        if self.results.get('StackingEnsemble', {}).get('cv_scope') == 'meta_only':
+            fig.add_annotation(
+                text="StackingEnsemble CV: 메타 모델만 교차 검증 (OOF 특성 고정, 낙관적 추정)",
+                xref='paper', yref='paper', x=0, y=1.08, showarrow=False
+            )
+        self.figure_exporter.add(fig, "model_performance_comparison", "모델 성능 비교 차트")
         
-        # 2. 혼동 행렬 (최고 성능 모델)
+        # 2. 혼동 행렬 (최고 성능 모델, evaluate_models에서 구한 예측 재사용)
         best_model = self.best_models[self.best_model_name]
-        if self.best_model_name == 'LogisticRegression':
-            X_test = self.X_test_scaled
-        else:
-            X_test = self.X_test
-            
-        y_pred = best_model.predict(X_test)
+        y_pred = self.test_results[self.best_model_name]['predictions']
         cm = confusion_matrix(self.y_test, y_pred)
         
         # 클래스 이름을 리스트로 변환
@@ -432,12 +759,11 @@ class IrisAnalysis:
             xaxis_title='예측값',
             yaxis_title='실제값'
         )
-        fig.write_image("visualizations/confusion_matrix_best_model.png")
-        print("✓ 혼동 행렬 저장: visualizations/confusion_matrix_best_model.png")
+        self.figure_exporter.add(fig, "confusion_matrix_best_model", "혼동 행렬")
         
         # 3. 특성 중요도 (트리 기반 모델인 경우)
         if hasattr(best_model, 'feature_importances_'):
-            feature_names = self.X.columns
+            feature_names = self.feature_names
             importances = best_model.feature_importances_
             
             fig = go.Figure(data=[
@@ -449,67 +775,216 @@ class IrisAnalysis:
                 xaxis_title='특성',
                 yaxis_title='중요도'
             )
-            fig.write_image("visualizations/feature_importance_best_model.png")
-            print("✓ 특성 중요도 차트 저장: visualizations/feature_importance_best_model.png")
+            self.figure_exporter.add(fig, "feature_importance_best_model", "특성 중요도 차트")
+        
+        # 4. 순열 특성 중요도 (검증 세트, 모든 모델에 적용 가능)
+        self._add_permutation_importance(best_model)
+        
+        self.figure_exporter.flush()
         
     def save_models(self):
         """
-        훈련된 모델들을 pickle 파일로 저장
+        훈련된 모델들을 저장 (artifact_format: 'pickle' 또는 'mmap', 형식 버전과 체크섬은 manifest.json에 기록)
         """
         print("\n" + "=" * 50)
         print("8. 모델 저장")
         print("=" * 50)
         
+        objects = {}
+        tree_tables = []
+        # 이전 실행의 노드 테이블은 새 모델과 맞지 않으므로 지움 (mmap 형식이면 아래에서 다시 저장)
+        remove_tables("models")
+        
         # 각 모델 저장
         for name, model in self.best_models.items():
-            filename = f"models/{name.lower()}_model.pkl"
-            with open(filename, 'wb') as f:
-                pickle.dump(model, f)
-            print(f"✓ {name} 모델 저장: {filename}")
+            key = f"{name.lower()}_model"
+            objects[key] = save_object(model, "models", key, self.artifact_format)
+            print(f"✓ {name} 모델 저장: models/{objects[key]}")
+            if self.artifact_format == 'mmap':
+                # 트리 모델은 프로세스 간 복사 없이 mmap으로 공유되는 노드 테이블도 함께 저장
+                try:
+                    table = FlatTreeEnsemble.from_estimator(model)
+                except ValueError:
+                    continue
+                table.save(table_path("models", name))
+                tree_tables.append(os.path.basename(table_path("models", name)))
         
         # 스케일러와 레이블 인코더 저장
-        with open("models/scaler.pkl", 'wb') as f:
-            pickle.dump(self.scaler, f)
-        print("✓ 스케일러 저장: models/scaler.pkl")
+        objects['scaler'] = save_object(self.scaler, "models", 'scaler', self.artifact_format)
+        print(f"✓ 스케일러 저장: models/{objects['scaler']}")
         
-        with open("models/label_encoder.pkl", 'wb') as f:
-            pickle.dump(self.label_encoder, f)
-        print("✓ 레이블 인코더 저장: models/label_encoder.pkl")
+        objects['label_encoder'] = save_object(self.label_encoder, "models", 'label_encoder', self.artifact_format)
+        print(f"✓ 레이블 인코더 저장: models/{objects['label_encoder']}")
         
         # 결과 요약 저장
         results_summary = {
             'model_results': self.results,
             'test_results': self.test_results,
             'best_model': self.best_model_name,
+            # 배치 추론(batch_score.py)에서 입력 컬럼 선택과 스케일러 적용 여부를 정하는 데 사용
+            'feature_names': self.feature_names,
+            'target_column': self.target_column,
+            'scaled_models': [name for name, model_info in self.models.items() if model_info['use_scaling']],
             'timestamp': datetime.now().isoformat()
         }
         
-        with open("models/results_summary.pkl", 'wb') as f:
-            pickle.dump(results_summary, f)
-        print("✓ 결과 요약 저장: models/results_summary.pkl")
+        objects['results_summary'] = save_object(results_summary, "models", 'results_summary', self.artifact_format)
+        print(f"✓ 결과 요약 저장: models/{objects['results_summary']}")
+        
+        write_manifest("models", objects, self.artifact_format, tree_tables)
+        print(f"✓ 매니페스트 저장: models/{MANIFEST_NAME} (형식 {self.artifact_format}, 파일 {len(objects) + len(tree_tables)}개)")
+        
+    def _add_permutation_importance(self, best_model):
+        """
+        최고 모델의 검증 세트 순열 특성 중요도 차트 추가
+        """
+        X_val, y_val, max_samples = self._importance_data()
+        if X_val is None or len(y_val) == 0:
+            print("순열 특성 중요도 생략 (메모리에 올린 검증 데이터 없음)")
+            return
+        importance = permutation_importance_parallel(
+            best_model, X_val, y_val,
+            n_repeats=self.importance_repeats,
+            max_samples=max_samples,
+            n_jobs=self.n_jobs,
+            random_state=42
+        )
+        print(f"순열 특성 중요도 ({self.best_model_name}, 검증 {importance['n_samples']}행 × {self.importance_repeats}회):")
+        for feature, mean, std in zip(self.feature_names, importance['importances_mean'], importance['importances_std']):
+            print(f"  {feature}: {mean:.4f} ± {std:.4f}")
+        
+        fig = go.Figure(data=[
+            go.Bar(
+                x=self.feature_names,
+                y=importance['importances_mean'],
+                error_y=dict(type='data', array=importance['importances_std'])
+            )
+        ])
+        
+        fig.update_layout(
+            title=f'{self.best_model_name} 모델의 순열 특성 중요도 (검증 정확도 감소)',
+            xaxis_title='특성',
+            yaxis_title='정확도 감소'
+        )
+        self.figure_exporter.add(fig, "permutation_importance_best_model", "순열 특성 중요도 차트")
+        
+    def _importance_data(self):
+        """
+        순열 특성 중요도에 사용할 (검증 특성, 검증 레이블, 표본 크기) - 최고 모델의 입력 형식에 맞춤
+        (메모리에 올린 검증 데이터가 없으면 검증 특성이 None)
+        """
+        if self.best_model_name in self.models:
+            X_val = self._select_data(self.models[self.best_model_name])[1]
+        else:
+            # 스태킹 앙상블은 스케일링하지 않은 데이터로 학습
+            X_val = self.X_val
+        return X_val, self.y_val, self.importance_max_samples
+        
+    def _load_stage(self):
+        self.load_and_explore_data(visualize=False)
+        
+    def _visualize_stage(self):
+        if self.figure_exporter.figure_format == 'skip':
+            print("\n시각화 저장 생략 (--figure-format skip)")
+            return
+        # 두 단계의 그림을 모아 한 번에 저장 (kaleido 세션/프로세스 풀 한 번만 사용)
+        with self.figure_exporter.batch():
+            self.create_basic_visualizations()
+            self.create_performance_visualizations()
+        self.figure_exporter.close()
+        
+    def _tuning_config(self):
+        """tune 단계 결과에 영향을 주는 설정 (체크포인트 키에 포함)"""
+        return {
+            'tuning_strategy': self.tuning_strategy,
+            'tuning_resource': self.tuning_resource,
+            'halving_factor': self.halving_factor,
+            'tuning_scheduler': self.tuning_scheduler,
+            'reuse_cv_results': self.reuse_cv_results,
+            'n_iter': self.n_iter
+        }
+        
+    def _pipeline_stages(self):
+        """
+        파이프라인 단계 정의: (이름, 함수, 의존 단계, 출력 속성, 결과에 영향을 주는 설정, 추가 키 옵션)
+        추가 키 옵션의 modules는 단계가 사용하는 모듈로, 모듈 파일이 바뀌면 체크포인트를 다시 만듭니다.
+        """
+        return [
+            ('load', self._load_stage, [], self.LOADED_ATTRIBUTES, {}, {
+                'input_files': [self.data_path], 'code': [self.load_and_explore_data]
+            }),
+            ('prepare', self.prepare_data, ['load'],
+             self.LEAN_PREPARED_ATTRIBUTES if self.memory_lean else self.PREPARED_ATTRIBUTES,
+             {'memory_lean': self.memory_lean}, {'code': [self._prepare_lean]}),
+            ('define', self.define_models, [], ['models'],
+             {'memory_lean': self.memory_lean, 'boosting_engine': self.boosting_engine}, {}),
+            ('tune', self.train_and_tune_models, ['prepare', 'define'],
+             ['best_models', 'results', 'oof_probas'], self._tuning_config(),
+             {'modules': ['tuning', 'fit_cache', 'distributed']}),
+            ('stack', self.create_stacking_ensemble, ['prepare', 'tune'], ['best_models', 'results'],
+             {'reuse_cv_results': self.reuse_cv_results}, {'modules': ['stacking', 'fit_cache']}),
+            ('evaluate', self.evaluate_models, ['prepare', 'stack'], self.EVALUATED_ATTRIBUTES, {}, {}),
+            ('visualize', self._visualize_stage, ['load', 'prepare', 'stack', 'evaluate'], [],
+             {'figure_format': self.figure_exporter.figure_format, 'importance_repeats': self.importance_repeats,
+              'importance_max_samples': self.importance_max_samples}, {
+                'output_dirs': ['visualizations'],
+                'code': [self.create_basic_visualizations, self.create_performance_visualizations],
+                'modules': ['importance', 'figure_export']
+            }),
+            ('save', self.save_models, ['prepare', 'stack', 'evaluate'], [],
+             {'artifact_format': self.artifact_format},
+             {'output_dirs': ['models'], 'modules': ['artifacts', 'tree_export']}),
+        ]
+        
+    def _write_run_log(self):
+        """단계별 실행 기록을 results_summary와 같은 models/ 디렉토리에 저장"""
+        config = {
+            'data_path': self.data_path,
+            'n_jobs': self.n_jobs,
+            'memory_lean': self.memory_lean,
+            'boosting_engine': self.boosting_engine,
+            'artifact_format': self.artifact_format,
+            'figure_format': self.figure_exporter.figure_format,
+            'fit_cache': self.fit_cache.enabled,
+            'checkpoint': self.checkpointer.enabled,
+            **self._tuning_config()
+        }
+        return self.run_log.write("models", self.run_log_format, config)
         
     def run_complete_analysis(self):
         """
         전체 분석 파이프라인 실행
+
+        checkpoint_dir가 설정되어 있으면 입력이 바뀌지 않은 단계는 체크포인트에서 복원하고 건너뜁니다.
         """
         print("🌸 아이리스 데이터셋 분석 시작 🌸")
         print(f"시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
         try:
-            self.load_and_explore_data()
-            self.prepare_data()
-            self.define_models()
-            self.train_and_tune_models()
-            self.create_stacking_ensemble()
-            best_model = self.evaluate_models()
-            self.create_performance_visualizations()
-            self.save_models()
+            for name, func, depends, outputs, config, options in self._pipeline_stages():
+                with self.run_log.stage(name) as record:
+                    if not self.checkpointer.run(self, name, func, depends=depends, outputs=outputs,
+                                                 config=config, **options):
+                        record['status'] = 'skipped'
+            if self.checkpointer.enabled:
+                # 건너뛴 단계의 체크포인트 출력 복원 시간도 기록
+                with self.run_log.stage('restore'):
+                    self.checkpointer.finish(self)
+            run_log_path = self._write_run_log()
+            best_model = self.best_model_name
             
             print("\n" + "=" * 50)
             print("🎉 분석 완료!")
             print("=" * 50)
             print(f"최고 성능 모델: {best_model}")
             print(f"테스트 정확도: {self.test_results[best_model]['test_accuracy']:.4f}")
+            if self.checkpointer.enabled:
+                print(f"체크포인트: 실행 {self.checkpointer.executed}, 건너뜀 {self.checkpointer.skipped} ({self.checkpointer.checkpoint_dir})")
+            if self.fit_cache.enabled:
+                print(f"학습 캐시: 적중 {self.fit_cache.hits}회, 미스 {self.fit_cache.misses}회 ({self.fit_cache.cache_dir})")
+            print("\n단계별 실행 기록:")
+            self.run_log.print_report()
+            print(f"실행 기록: {run_log_path}")
             print(f"완료 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
             print("\n저장된 파일들:")
             print("📁 models/ - 훈련된 모델들")
@@ -517,9 +992,82 @@ class IrisAnalysis:
             
         except Exception as e:
             print(f"❌ 오류 발생: {str(e)}")
+            # 실패한 단계까지의 기록도 남김 (status: failed)
+            print(f"실행 기록: {self._write_run_log()}")
+            if self.checkpointer.enabled and self.checkpointer.executed:
+                print(f"완료된 단계 체크포인트는 유지됩니다: {self.checkpointer.executed}")
             raise
 
+def parse_max_samples(value):
+    """--importance-max-samples 값: 1 이상이면 행 수(int, 예: 10000, 1e4), 1 미만이면 비율(float, 예: 0.1)"""
+    number = float(value)
+    return int(number) if number >= 1 else number
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="아이리스 데이터셋 분석")
+    parser.add_argument("--data-path", default="datasets/Iris.csv", help="데이터셋 CSV 경로")
+    parser.add_argument("--tuning-strategy", choices=TUNING_STRATEGIES, default="random",
+                        help="하이퍼파라미터 튜닝 전략")
+    parser.add_argument("--tuning-resource", choices=TUNING_RESOURCES, default="n_samples",
+                        help="halving/hyperband에서 늘려가는 자원")
+    parser.add_argument("--halving-factor", type=int, default=3, help="successive halving 감소 비율")
+    parser.add_argument("--tuning-scheduler", choices=TUNING_SCHEDULERS, default="sequential",
+                        help="sequential: 모델별 차례대로 탐색, shared: 모든 모델을 하나의 워커 풀에서 동시 탐색, "
+                             "distributed: 파일 작업 큐의 워커들이 동시 탐색")
+    parser.add_argument("--queue-dir", default="cache/queue",
+                        help="distributed 스케줄러 작업 큐 디렉토리 (여러 노드에서 쓰려면 공유 파일시스템 경로)")
+    parser.add_argument("--local-workers", type=int, default=0,
+                        help="distributed 스케줄러에서 이 호스트에 띄울 워커 수 (0이면 외부 워커만 사용)")
+    parser.add_argument("--heartbeat-timeout", type=float, default=30.0,
+                        help="이 시간(초) 동안 heartbeat가 없는 워커의 작업을 다시 배정")
+    parser.add_argument("--n-jobs", type=int, default=-1, help="튜닝에 사용할 코어 수 (-1이면 모든 코어)")
+    parser.add_argument("--n-iter", type=int, default=50, help="모델별로 시도할 하이퍼파라미터 조합 수")
+    parser.add_argument("--fit-cache-dir", help="학습 결과 캐시 디렉토리 (지정하면 변경되지 않은 후보는 다시 학습하지 않음)")
+    parser.add_argument("--fit-cache-max-mb", type=int, default=1024, help="학습 결과 캐시 최대 용량 (MB)")
+    parser.add_argument("--reuse-cv-results", action="store_true",
+                        help="튜닝 CV 결과/OOF 예측을 최적 모델 CV와 스태킹에 재사용 (스태킹 CV는 메타 모델만 교차 검증)")
+    parser.add_argument("--checkpoint-dir", help="단계별 체크포인트 디렉토리 (지정하면 입력이 바뀌지 않은 단계는 건너뜀)")
+    parser.add_argument("--memory-lean", action="store_true",
+                        help="특성을 float32 배열 하나와 분할 인덱스로 보관하고 스케일링은 모델 Pipeline 안에서 수행")
+    parser.add_argument("--artifact-format", choices=ARTIFACT_FORMATS, default="pickle",
+                        help="모델 저장 형식 (mmap: 배열을 mmap으로 공유하는 형식 + 트리 노드 테이블)")
+    parser.add_argument("--figure-format", choices=FIGURE_FORMATS, default="png",
+                        help="시각화 저장 형식 (html: 이미지 렌더링 없이 빠르게 저장, skip: 저장 안 함)")
+    parser.add_argument("--figure-workers", type=int, default=1, help="PNG 렌더링 프로세스 수")
+    parser.add_argument("--boosting-engine", choices=BOOSTING_ENGINES, default="exact",
+                        help="부스팅 엔진 (histogram: HistGradientBoostingClassifier, both: 둘 다 비교)")
+    parser.add_argument("--importance-repeats", type=int, default=5,
+                        help="순열 특성 중요도에서 특성마다 섞는 횟수")
+    parser.add_argument("--importance-max-samples", type=parse_max_samples,
+                        help="순열 특성 중요도에 사용할 검증 세트 행 수 또는 비율 (예: 10000, 0.1)")
+    parser.add_argument("--run-log-format", choices=RUN_LOG_FORMATS, default="json",
+                        help="단계별 실행 기록 형식 (models/run_log.json 또는 models/run_log.parquet)")
+    args = parser.parse_args()
+
     # 분석 실행
-    analyzer = IrisAnalysis()
+    analyzer = IrisAnalysis(
+        data_path=args.data_path,
+        tuning_strategy=args.tuning_strategy,
+        tuning_resource=args.tuning_resource,
+        halving_factor=args.halving_factor,
+        tuning_scheduler=args.tuning_scheduler,
+        n_jobs=args.n_jobs,
+        n_iter=args.n_iter,
+        queue_dir=args.queue_dir,
+        local_workers=args.local_workers,
+        heartbeat_timeout=args.heartbeat_timeout,
+        importance_repeats=args.importance_repeats,
+        importance_max_samples=args.importance_max_samples,
+        fit_cache_dir=args.fit_cache_dir,
+        fit_cache_max_mb=args.fit_cache_max_mb,
+        reuse_cv_results=args.reuse_cv_results,
+        checkpoint_dir=args.checkpoint_dir,
+        memory_lean=args.memory_lean,
+        artifact_format=args.artifact_format,
+        figure_format=args.figure_format,
+        figure_workers=args.figure_workers,
+        boosting_engine=args.boosting_engine,
+        run_log_format=args.run_log_format
+    )
     analyzer.run_complete_analysis() 
\ No newline at end of file
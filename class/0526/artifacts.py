@@ -0,0 +1,212 @@
+"""
+모델 아티팩트 저장 형식 모듈
+
+save_models가 만드는 models/ 디렉토리의 파일을 기록하고 불러옵니다.
+
+- 'pickle' 형식: 기존과 같은 {이름}.pkl
+- 'mmap' 형식: {이름}.mmap 파일 하나에 pickle(protocol 5) 골격과 큰 numpy 배열 버퍼를 64바이트 정렬로
+  압축 없이 이어 붙입니다. 불러올 때 파일을 읽기 전용 mmap으로 열고 배열을 복사 없이 그 위에 만들므로
+  여러 서빙 프로세스가 같은 페이지 캐시를 공유하고, 불러오는 시간이 배열 크기와 거의 무관합니다.
+
+두 형식 모두 manifest.json에 형식 버전, 라이브러리 버전, 파일별 크기와 blake2b 체크섬을 기록합니다.
+불러올 때는 버전과 크기를 확인하고, verify=True이면 체크섬까지 확인합니다.
+manifest.json이 없는 이전 모델 디렉토리는 {이름}.pkl을 그대로 읽습니다.
+
+주의: sklearn 트리(Tree)는 pickle 복원 시 노드 배열을 자체 메모리로 복사하므로
+mmap 형식으로도 포레스트 노드는 프로세스마다 복사됩니다. 트리 모델은 함께 내보내는
+노드 테이블(tree_export.py, {이름}_trees.bin)을 사용하면 복사 없이 공유되며, batch_score.py의 워커는
+manifest에 기록된 테이블을 기본으로 사용합니다.
+"""
+
+import json
+import os
+import pickle
+from datetime import datetime
+
+import numpy as np
+
+from checkpoint import file_fingerprint
+
+ARTIFACT_VERSION = 1
+ARTIFACT_FORMATS = ['pickle', 'mmap']
+MANIFEST_NAME = "manifest.json"
+MAGIC = b"ARTPKL01"
+ALIGNMENT = 64
+# 이보다 작은 배열은 pickle 골격 안에 그대로 둠
+MIN_BUFFER_BYTES = 64 * 1024
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def dump_mmap(obj, path: str):
+    """객체를 pickle 골격 + 정렬된 배열 버퍼 형식으로 저장합니다"""
+    buffers = []
+
+    def out_of_band(buffer):
+        raw = buffer.raw()
+        if raw.nbytes < MIN_BUFFER_BYTES:
+            return True
+        buffers.append(raw)
+        return False
+
+    skeleton = pickle.dumps(obj, protocol=5, buffer_callback=out_of_band)
+    # 헤더: MAGIC, 골격 길이, 버퍼 수, 버퍼별 (오프셋, 길이)
+    header_size = len(MAGIC) + 16 + 16 * len(buffers)
+    offset = _aligned(header_size + len(skeleton))
+    layout = []
+    for raw in buffers:
+        layout.append((offset, raw.nbytes))
+        offset = _aligned(offset + raw.nbytes)
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(len(skeleton).to_bytes(8, 'little'))
+        f.write(len(buffers).to_bytes(8, 'little'))
+        for buffer_offset, nbytes in layout:
+            f.write(buffer_offset.to_bytes(8, 'little'))
+            f.write(nbytes.to_bytes(8, 'little'))
+        f.write(skeleton)
+        for (buffer_offset, _), raw in zip(layout, buffers):
+            f.seek(buffer_offset)
+            f.write(raw)
+    os.replace(tmp_path, path)
+
+
+def load_mmap(path: str, mmap: bool = True):
+    """
+    dump_mmap으로 저장한 객체를 불러옵니다.
+    mmap=True이면 배열이 읽기 전용 mmap 위에 만들어집니다 (복사 없음).
+    """
+    data = np.memmap(path, dtype=np.uint8, mode='r') if mmap else np.fromfile(path, dtype=np.uint8)
+    if bytes(data[:len(MAGIC)]) != MAGIC:
+        raise ValueError(f"mmap 아티팩트 파일이 아닙니다: {path}")
+    position = len(MAGIC)
+    skeleton_size = int.from_bytes(bytes(data[position:position + 8]), 'little')
+    n_buffers = int.from_bytes(bytes(data[position + 8:position + 16]), 'little')
+    position += 16
+    buffers = []
+    for _ in range(n_buffers):
+        buffer_offset = int.from_bytes(bytes(data[position:position + 8]), 'little')
+        nbytes = int.from_bytes(bytes(data[position + 8:position + 16]), 'little')
+        buffers.append(data[buffer_offset:buffer_offset + nbytes])
+        position += 16
+    return pickle.loads(bytes(data[position:position + skeleton_size]), buffers=buffers)
+
+
+def save_object(obj, model_dir: str, name: str, artifact_format: str = 'pickle') -> str:
+    """객체를 지정한 형식으로 저장하고 파일 이름을 반환합니다"""
+    if artifact_format == 'mmap':
+        filename = f"{name}.mmap"
+        dump_mmap(obj, os.path.join(model_dir, filename))
+    else:
+        filename = f"{name}.pkl"
+        with open(os.path.join(model_dir, filename), 'wb') as f:
+            pickle.dump(obj, f)
+    return filename
+
+
+def write_manifest(model_dir: str, objects: dict, artifact_format: str, extra_files=()):
+    """
+    저장한 파일의 체크섬과 크기를 manifest.json에 기록합니다.
+
+    Args:
+        objects: {객체 이름: 파일 이름}
+        extra_files: 객체 외에 함께 기록할 파일 이름 (트리 노드 테이블 등)
+    """
+    import sklearn
+    files = {}
+    for filename in [*objects.values(), *extra_files]:
+        path = os.path.join(model_dir, filename)
+        files[filename] = {'size': os.path.getsize(path), 'blake2b': file_fingerprint(path)}
+    manifest = {
+        'version': ARTIFACT_VERSION,
+        'format': artifact_format,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'libraries': {'numpy': np.__version__, 'sklearn': sklearn.__version__},
+        'objects': objects,
+        'files': files
+    }
+    with open(os.path.join(model_dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return manifest
+
+
+def add_manifest_files(model_dir: str, filenames):
+    """이미 저장한 모델 디렉토리의 manifest.json에 파일(트리 노드 테이블 등)의 크기와 체크섬을 추가합니다"""
+    manifest = read_manifest(model_dir)
+    if manifest is None:
+        raise FileNotFoundError(
+            f"{os.path.join(model_dir, MANIFEST_NAME)}이 없습니다. save_models로 모델을 다시 저장하세요"
+        )
+    for filename in filenames:
+        path = os.path.join(model_dir, filename)
+        manifest['files'][filename] = {'size': os.path.getsize(path), 'blake2b': file_fingerprint(path)}
+    with open(os.path.join(model_dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return manifest
+
+
+def read_manifest(model_dir: str):
+    """manifest.json을 읽습니다 (없으면 None)"""
+    path = os.path.join(model_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('version') != ARTIFACT_VERSION:
+        raise ValueError(f"지원하지 않는 아티팩트 버전입니다: {manifest.get('version')} (지원: {ARTIFACT_VERSION})")
+    return manifest
+
+
+def check_file(model_dir: str, filename: str, manifest, verify: bool = False):
+    """manifest에 기록된 크기(verify=True이면 체크섬까지)와 파일이 같은지 확인합니다"""
+    if manifest is None or filename not in manifest['files']:
+        return
+    path = os.path.join(model_dir, filename)
+    entry = manifest['files'][filename]
+    if os.path.getsize(path) != entry['size'] or (verify and file_fingerprint(path) != entry['blake2b']):
+        raise ValueError(f"아티팩트 파일이 manifest와 다릅니다 (손상 또는 덮어쓰기): {path}")
+
+
+def object_filename(model_dir: str, name: str, manifest=None) -> str:
+    manifest = manifest if manifest is not None else read_manifest(model_dir)
+    if manifest is not None and name in manifest['objects']:
+        return manifest['objects'][name]
+    return f"{name}.pkl"
+
+
+def has_object(model_dir: str, name: str) -> bool:
+    return os.path.exists(os.path.join(model_dir, object_filename(model_dir, name)))
+
+
+def load_object(model_dir: str, name: str, mmap: bool = True, verify: bool = False, manifest=None):
+    """
+    save_object로 저장한 객체를 불러옵니다.
+    manifest가 있으면 기록된 파일(.mmap 또는 .pkl)을 확인 후 읽고, 없으면 {name}.pkl을 읽습니다.
+    """
+    manifest = manifest if manifest is not None else read_manifest(model_dir)
+    filename = object_filename(model_dir, name, manifest)
+    check_file(model_dir, filename, manifest, verify)
+    path = os.path.join(model_dir, filename)
+    if filename.endswith('.mmap'):
+        return load_mmap(path, mmap)
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+def verify_artifacts(model_dir: str) -> dict:
+    """manifest의 모든 파일 체크섬을 확인하고 {파일 이름: 일치 여부}를 반환합니다"""
+    manifest = read_manifest(model_dir)
+    if manifest is None:
+        raise FileNotFoundError(f"{os.path.join(model_dir, MANIFEST_NAME)}이 없습니다")
+    results = {}
+    for filename, entry in manifest['files'].items():
+        path = os.path.join(model_dir, filename)
+        results[filename] = (
+            os.path.exists(path) and os.path.getsize(path) == entry['size']
+            and file_fingerprint(path) == entry['blake2b']
+        )
+    return results
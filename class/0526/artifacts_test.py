@@ -0,0 +1,166 @@
+"""
+artifacts.py 저장 형식과 manifest 검사, batch_score.load_artifacts의 노드 테이블 선택 테스트
+
+실행:
+    python -m pytest artifacts_test.py -q
+"""
+
+import json
+import os
+
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+
+import artifacts
+from artifacts import (
+    add_manifest_files, load_mmap, load_object, read_manifest, save_object, verify_artifacts, write_manifest
+)
+from batch_score import load_artifacts
+from tree_export import FlatTreeEnsemble, export_models, table_path
+
+
+def _objects():
+    rng = np.random.RandomState(0)
+    return {
+        # MIN_BUFFER_BYTES보다 큰 배열은 별도 버퍼로, 작은 배열은 pickle 골격 안에 저장됨
+        'large': rng.rand(300, 100),
+        'small': np.arange(10),
+        'ints': rng.randint(0, 1000, size=50000).astype(np.int32),
+        'label': 'setosa',
+    }
+
+
+def _save(model_dir, objects, artifact_format):
+    filenames = {name: save_object(obj, str(model_dir), name, artifact_format) for name, obj in objects.items()}
+    return write_manifest(str(model_dir), filenames, artifact_format)
+
+
+def _assert_same(loaded, expected):
+    assert loaded.keys() == expected.keys()
+    for key, value in expected.items():
+        if isinstance(value, np.ndarray):
+            np.testing.assert_array_equal(loaded[key], value)
+            assert loaded[key].dtype == value.dtype
+        else:
+            assert loaded[key] == value
+
+
+@pytest.mark.parametrize("artifact_format", artifacts.ARTIFACT_FORMATS)
+def test_round_trip(tmp_path, artifact_format):
+    """두 형식 모두 저장한 객체를 그대로 불러오고 체크섬 검사를 통과"""
+    objects = {'data': _objects()}
+    manifest = _save(tmp_path, objects, artifact_format)
+    assert manifest['objects']['data'] == ('data.mmap' if artifact_format == 'mmap' else 'data.pkl')
+    _assert_same(load_object(str(tmp_path), 'data', verify=True), objects['data'])
+    assert all(verify_artifacts(str(tmp_path)).values())
+
+
+def test_mmap_arrays_are_aligned_read_only_views(tmp_path):
+    """mmap 형식의 큰 배열은 파일 위에 복사 없이 만든 읽기 전용 배열이고 64바이트 정렬"""
+    path = str(tmp_path / "data.mmap")
+    artifacts.dump_mmap(_objects(), path)
+    loaded = load_mmap(path, mmap=True)
+    for key in ('large', 'ints'):
+        assert not loaded[key].flags.writeable
+        assert loaded[key].ctypes.data % artifacts.ALIGNMENT == 0
+    _assert_same(load_mmap(path, mmap=False), _objects())
+
+
+@pytest.mark.parametrize("artifact_format", artifacts.ARTIFACT_FORMATS)
+def test_size_mismatch_is_rejected(tmp_path, artifact_format):
+    """파일 크기가 manifest와 다르면 verify 없이도 ValueError"""
+    manifest = _save(tmp_path, {'data': _objects()}, artifact_format)
+    with open(tmp_path / manifest['objects']['data'], 'ab') as f:
+        f.write(b"\0")
+    with pytest.raises(ValueError, match="manifest와 다릅니다"):
+        load_object(str(tmp_path), 'data')
+
+
+@pytest.mark.parametrize("artifact_format", artifacts.ARTIFACT_FORMATS)
+def test_checksum_mismatch_is_rejected_with_verify(tmp_path, artifact_format):
+    """크기는 같고 내용만 바뀐 파일은 verify=True일 때 ValueError, verify_artifacts는 False"""
+    manifest = _save(tmp_path, {'data': _objects()}, artifact_format)
+    path = tmp_path / manifest['objects']['data']
+    content = bytearray(path.read_bytes())
+    content[-1] ^= 0xFF
+    path.write_bytes(bytes(content))
+    with pytest.raises(ValueError, match="manifest와 다릅니다"):
+        load_object(str(tmp_path), 'data', verify=True)
+    assert verify_artifacts(str(tmp_path)) == {manifest['objects']['data']: False}
+
+
+def test_version_mismatch_is_rejected(tmp_path):
+    _save(tmp_path, {'data': _objects()}, 'mmap')
+    manifest_path = tmp_path / artifacts.MANIFEST_NAME
+    manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+    manifest['version'] = artifacts.ARTIFACT_VERSION + 1
+    manifest_path.write_text(json.dumps(manifest), encoding='utf-8')
+    with pytest.raises(ValueError, match="아티팩트 버전"):
+        load_object(str(tmp_path), 'data')
+
+
+def test_wrong_magic_is_rejected(tmp_path):
+    path = tmp_path / "data.mmap"
+    path.write_bytes(b"NOTMMAP0" + bytes(64))
+    with pytest.raises(ValueError, match="mmap 아티팩트 파일이 아닙니다"):
+        load_mmap(str(path))
+
+
+def test_directory_without_manifest_reads_pickle(tmp_path):
+    """manifest.json이 없는 이전 모델 디렉토리는 {이름}.pkl을 읽음"""
+    save_object(_objects(), str(tmp_path), 'data', 'pickle')
+    assert read_manifest(str(tmp_path)) is None
+    _assert_same(load_object(str(tmp_path), 'data'), _objects())
+    with pytest.raises(FileNotFoundError):
+        add_manifest_files(str(tmp_path), ['data.pkl'])
+
+
+@pytest.fixture
+def model_dir(tmp_path):
+    """save_models와 같은 파일 구성의 모델 디렉토리 (RandomForest 하나)"""
+    rng = np.random.RandomState(0)
+    X = rng.rand(200, 4)
+    labels = np.array(['setosa', 'versicolor', 'virginica'])[rng.randint(0, 3, size=200)]
+    label_encoder = LabelEncoder().fit(labels)
+    model = RandomForestClassifier(n_estimators=10, random_state=0).fit(X, label_encoder.transform(labels))
+    objects = {
+        'results_summary': {'best_model': 'RandomForest', 'model_results': {'RandomForest': {}},
+                            'feature_names': ['a', 'b', 'c', 'd'], 'target_column': 'Species',
+                            'scaled_models': []},
+        'randomforest_model': model,
+        'scaler': StandardScaler().fit(X),
+        'label_encoder': label_encoder,
+    }
+    _save(tmp_path, objects, 'mmap')
+    return str(tmp_path), model, X
+
+
+def test_load_artifacts_uses_listed_table(model_dir):
+    directory, model, X = model_dir
+    assert list(export_models(directory)) == ['RandomForest']
+    assert os.path.basename(table_path(directory, 'RandomForest')) in read_manifest(directory)['files']
+
+    loaded = load_artifacts(directory, compiled_trees=True, verify=True)
+    assert isinstance(loaded['model'], FlatTreeEnsemble)
+    np.testing.assert_array_equal(loaded['model'].predict_proba(X), model.predict_proba(X))
+    assert isinstance(load_artifacts(directory, compiled_trees=False)['model'], RandomForestClassifier)
+
+
+def test_load_artifacts_rejects_unlisted_table(model_dir):
+    """manifest에 없는 테이블(이전 실행에서 남은 파일)은 compiled_trees=True일 때 ValueError"""
+    directory, model, _ = model_dir
+    FlatTreeEnsemble.from_estimator(model).save(table_path(directory, 'RandomForest'))
+    with pytest.raises(ValueError, match="기록되지 않은 트리 테이블"):
+        load_artifacts(directory, compiled_trees=True)
+    assert isinstance(load_artifacts(directory, compiled_trees=False)['model'], RandomForestClassifier)
+
+
+def test_load_artifacts_rejects_modified_table(model_dir):
+    directory, _, _ = model_dir
+    path = export_models(directory)['RandomForest']
+    with open(path, 'ab') as f:
+        f.write(b"\0")
+    with pytest.raises(ValueError, match="manifest와 다릅니다"):
+        load_artifacts(directory, compiled_trees=True)
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+저장된 모델로 대용량 CSV/Parquet 배치 추론
+
+analysis.py(또는 out_of_core.py)의 save_models가 만든 models/ 디렉토리에서
+스케일러, 레이블 인코더, 모델을 워커마다 한 번만 불러온 뒤
+입력 파일을 청크 단위로 읽어 프로세스 풀에서 청크별 벡터화 predict를 실행하고,
+예측 결과를 입력 순서대로 출력 파일에 바로바로 추가합니다 (전체 입력/출력을 메모리에 올리지 않음).
+manifest.json에 트리 노드 테이블(tree_export.py)이 기록된 트리 모델은 워커마다 테이블을 mmap으로 열어
+포레스트를 프로세스마다 복사하지 않고 같은 페이지 캐시를 공유합니다 (--no-compiled-trees이면 sklearn 모델 사용).
+--load-report는 워커별 모델 불러오기 시간과 메모리(RSS, 공유 페이지를 나눠 센 PSS)를 출력합니다.
+
+실행 예:
+    python batch_score.py --input datasets/large.csv --output predictions.parquet
+    python batch_score.py --input datasets/large.parquet --output predictions.csv --model RandomForest --proba
+    python batch_score.py --model RandomForest --workers 4 --load-report
+"""
+
+import argparse
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from joblib import cpu_count
+
+from artifacts import check_file, load_object, read_manifest
+from tree_export import FlatTreeEnsemble, table_path
+
+# save_models가 results_summary에 스케일링 정보와 타겟 컬럼을 기록하기 전의 모델 디렉토리용 기본값
+DEFAULT_SCALED_MODELS = ['LogisticRegression']
+DEFAULT_TARGET_COLUMN = 'Species'
+
+# 워커 프로세스마다 한 번만 불러오는 모델 상태
+_WORKER = {}
+
+
+def load_artifacts(model_dir: str, model_name: str = None, compiled_trees: bool = False, verify: bool = False) -> dict:
+    """
+    모델 디렉토리에서 결과 요약, 스케일러, 레이블 인코더, 모델을 불러옵니다.
+    model_name이 없으면 결과 요약의 최고 성능 모델을 사용합니다.
+    compiled_trees=True이면 manifest.json에 기록된 노드 테이블(tree_export.py)이 있는 모델은 테이블을 mmap으로 불러옵니다.
+    manifest에 없는 테이블 파일은 다른 실행에서 남은 것일 수 있으므로 ValueError를 냅니다.
+    verify=True이면 manifest.json의 체크섬까지 확인합니다 (mmap 형식 파일은 항상 mmap으로 불러옴).
+    """
+    manifest = read_manifest(model_dir)
+    summary = load_object(model_dir, "results_summary", verify=verify, manifest=manifest)
+    model_name = model_name or summary['best_model']
+    table_file = table_path(model_dir, model_name)
+    table_listed = manifest is not None and os.path.basename(table_file) in manifest['files']
+    if compiled_trees and os.path.exists(table_file) and not table_listed:
+        raise ValueError(
+            f"manifest.json에 기록되지 않은 트리 테이블입니다 (이전 실행에서 남은 파일일 수 있음): {table_file}"
+        )
+    if compiled_trees and table_listed:
+        check_file(model_dir, os.path.basename(table_file), manifest, verify)
+        model = FlatTreeEnsemble.load(table_file)
+    else:
+        model = load_object(model_dir, f"{model_name.lower()}_model", verify=verify, manifest=manifest)
+    scaler = load_object(model_dir, "scaler", verify=verify, manifest=manifest)
+    label_encoder = load_object(model_dir, "label_encoder", verify=verify, manifest=manifest)
+    return {
+        'model_name': model_name,
+        'model': model,
+        'scaler': scaler,
+        'label_encoder': label_encoder,
+        'model_names': list(summary['model_results']),
+        'feature_names': summary.get('feature_names'),
+        'target_column': summary.get('target_column', DEFAULT_TARGET_COLUMN),
+        'use_scaling': model_name in summary.get('scaled_models', DEFAULT_SCALED_MODELS)
+    }
+
+
+def _init_worker(model_dir, model_name, threads, compiled_trees=True):
+    """프로세스 풀 워커 초기화: 모델을 한 번만 불러오고 BLAS 스레드 수를 제한"""
+    from threadpoolctl import threadpool_limits
+    threadpool_limits(limits=threads)
+    start = time.perf_counter()
+    _WORKER.update(load_artifacts(model_dir, model_name, compiled_trees))
+    _WORKER['load_seconds'] = time.perf_counter() - start
+    # 트리 앙상블의 predict 내부 병렬화가 프로세스 풀과 겹치지 않도록 고정 (노드 테이블은 단일 스레드)
+    model = _WORKER['model']
+    if hasattr(model, 'get_params') and 'n_jobs' in model.get_params():
+        model.set_params(n_jobs=1)
+
+
+def _process_memory() -> dict:
+    """현재 프로세스의 RSS와 PSS (MB). PSS는 공유 페이지를 공유한 프로세스 수로 나눠 센 값 (Linux 전용, 없으면 None)"""
+    memory = {'rss_mb': None, 'pss_mb': None}
+    try:
+        with open('/proc/self/smaps_rollup') as f:
+            for line in f:
+                key, value = line.split(':', 1)
+                if key in ('Rss', 'Pss'):
+                    memory[f'{key.lower()}_mb'] = int(value.split()[0]) / 1024
+    except OSError:
+        pass
+    return memory
+
+
+def _worker_report(X):
+    """워커의 모델 불러오기 시간과, 한 청크를 예측해 모델 페이지를 읽은 뒤의 메모리"""
+    score_features(_WORKER, X)
+    # 모든 워커가 모델을 불러온 상태에서 재도록 잠시 붙잡아 둠 (작업이 워커마다 하나씩 배정되도록)
+    time.sleep(0.5)
+    return {'pid': os.getpid(), 'load_ms': _WORKER['load_seconds'] * 1000, **_process_memory()}
+
+
+def worker_load_report(model_dir='models', model_name=None, workers=4, compiled_trees=True, rows=1000) -> dict:
+    """
+    batch_score와 같은 방식으로 프로세스 풀 워커를 띄워 워커별 모델 불러오기 시간과 메모리를 잽니다.
+    노드 테이블(compiled_trees)은 mmap 페이지를 워커가 공유하므로 PSS가 RSS보다 작고,
+    pickle/mmap 형식의 sklearn 포레스트는 복원할 때 노드 배열을 복사하므로 워커마다 RSS가 늘어납니다.
+    """
+    artifacts = load_artifacts(model_dir, model_name, compiled_trees)
+    n_features = len(artifacts['feature_names'] or []) or artifacts['model'].n_features_in_
+    X = pd.DataFrame(np.random.default_rng(0).normal(size=(rows, n_features)).astype(np.float32),
+                     columns=artifacts['feature_names'])
+    threads = max(1, cpu_count() // workers)
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker,
+        initargs=(model_dir, artifacts['model_name'], threads, compiled_trees)
+    ) as executor:
+        reports = list(executor.map(_worker_report, [X] * workers))
+    by_pid = {report['pid']: report for report in reports}
+    return {
+        'model': artifacts['model_name'],
+        'model_type': type(artifacts['model']).__name__,
+        'workers': list(by_pid.values())
+    }
+
+
+def _matching_input(estimator, X):
+    """추정기가 특성 이름과 함께 학습되었으면 DataFrame, 아니면 배열로 전달합니다 (sklearn 특성 이름 경고 방지)"""
+    return X if hasattr(estimator, 'feature_names_in_') else np.asarray(X)
+
+
+def score_features(artifacts: dict, X: pd.DataFrame, proba: bool = False):
+    """특성 한 청크를 예측합니다 (인코딩된 레이블, 선택적으로 클래스별 확률 반환)"""
+    if artifacts['use_scaling']:
+        X = artifacts['scaler'].transform(_matching_input(artifacts['scaler'], X))
+    X = _matching_input(artifacts['model'], X)
+    predictions = artifacts['model'].predict(X)
+    probabilities = artifacts['model'].predict_proba(X) if proba else None
+    return predictions, probabilities
+
+
+def _score_task(X, proba):
+    start = time.perf_counter()
+    predictions, probabilities = score_features(_WORKER, X, proba)
+    return predictions, probabilities, time.perf_counter() - start
+
+
+def iter_input_chunks(path: str, chunksize: int):
+    """CSV/Parquet 입력을 chunksize 행씩 DataFrame으로 읽습니다"""
+    if path.endswith('.parquet'):
+        import pyarrow.parquet as pq
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunksize)
+
+
+class PredictionWriter:
+    """예측 결과 청크를 CSV 또는 Parquet 파일에 차례로 추가합니다"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.is_parquet = path.endswith('.parquet')
+        self._writer = None
+        self._first = True
+
+    def write(self, frame: pd.DataFrame):
+        if self.is_parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.path, table.schema, compression='zstd')
+            self._writer.write_table(table)
+        else:
+            frame.to_csv(self.path, mode='w' if self._first else 'a', header=self._first, index=False)
+        self._first = False
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+def batch_score(input_path, output_path, model_dir='models', model_name=None, chunksize=100_000,
+                workers=None, proba=False, id_column='Id', compiled_trees=True) -> dict:
+    """
+    입력 파일 전체를 배치 추론하고 처리량 통계를 반환합니다.
+
+    Args:
+        input_path: 입력 CSV/Parquet 경로
+        output_path: 출력 CSV/Parquet 경로 (확장자로 형식 결정)
+        model_dir: save_models가 만든 모델 디렉토리
+        model_name: 사용할 모델 이름 (None이면 최고 성능 모델)
+        chunksize: 청크당 행 수
+        workers: 프로세스 풀 크기 (None이면 CPU 수, 0이면 현재 프로세스에서 실행)
+        proba: 클래스별 확률 컬럼도 출력할지 여부
+        id_column: 입력에 있으면 출력에 함께 기록할 ID 컬럼
+        compiled_trees: manifest에 기록된 트리 노드 테이블이 있으면 sklearn 모델 대신 사용 (워커 간 메모리 공유)
+    """
+    artifacts = load_artifacts(model_dir, model_name, compiled_trees)
+    label_encoder = artifacts['label_encoder']
+    feature_names = artifacts['feature_names']
+    target_column = artifacts['target_column']
+    # cgroup / CPU affinity 제한을 반영한 코어 수
+    workers = cpu_count() if workers is None else workers
+
+    writer = PredictionWriter(output_path)
+    rows = chunks = 0
+    score_seconds = []
+    start = time.perf_counter()
+
+    def write_result(frame, predictions, probabilities):
+        output = pd.DataFrame({'prediction': label_encoder.inverse_transform(predictions)})
+        if id_column in frame.columns:
+            output.insert(0, id_column, frame[id_column].to_numpy())
+        if probabilities is not None:
+            for i, label in enumerate(label_encoder.classes_):
+                output[f'proba_{label}'] = probabilities[:, i]
+        writer.write(output)
+
+    def features_of(frame):
+        columns = feature_names or [c for c in frame.columns if c not in (id_column, target_column)]
+        return frame[columns]
+
+    try:
+        if workers == 0:
+            for frame in iter_input_chunks(input_path, chunksize):
+                chunk_start = time.perf_counter()
+                predictions, probabilities = score_features(artifacts, features_of(frame), proba)
+                score_seconds.append(time.perf_counter() - chunk_start)
+                write_result(frame, predictions, probabilities)
+                rows += len(frame)
+                chunks += 1
+        else:
+            # 워커 수의 2배까지만 청크를 미리 제출하여 메모리를 일정하게 유지하고, 제출 순서대로 기록
+            threads = max(1, cpu_count() // workers)
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker,
+                initargs=(model_dir, artifacts['model_name'], threads, compiled_trees)
+            ) as executor:
+                in_flight = deque()
+
+                def drain_one():
+                    nonlocal rows, chunks
+                    frame_ids, future = in_flight.popleft()
+                    predictions, probabilities, seconds = future.result()
+                    score_seconds.append(seconds)
+                    write_result(frame_ids, predictions, probabilities)
+                    rows += len(frame_ids)
+                    chunks += 1
+
+                for frame in iter_input_chunks(input_path, chunksize):
+                    # 워커에는 특성 배열만 보내고, 출력에 필요한 ID 컬럼만 남겨 둠
+                    frame_ids = frame[[id_column]] if id_column in frame.columns else frame.iloc[:, :0]
+                    in_flight.append((frame_ids, executor.submit(_score_task, features_of(frame), proba)))
+                    if len(in_flight) >= workers * 2:
+                        drain_one()
+                while in_flight:
+                    drain_one()
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - start
+    score_ms = np.array(score_seconds or [0.0]) * 1000
+    return {
+        'model': artifacts['model_name'],
+        'input': input_path,
+        'output': output_path,
+        'rows': rows,
+        'chunks': chunks,
+        'chunksize': chunksize,
+        'workers': workers,
+        'elapsed_seconds': elapsed,
+        'rows_per_second': rows / elapsed if elapsed else 0.0,
+        'chunk_score_p50_ms': float(np.percentile(score_ms, 50)),
+        'chunk_score_p99_ms': float(np.percentile(score_ms, 99))
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="저장된 모델로 대용량 CSV/Parquet 배치 추론")
+    parser.add_argument("--input", help="입력 CSV/Parquet 경로")
+    parser.add_argument("--output", help="출력 경로 (.csv 또는 .parquet)")
+    parser.add_argument("--model-dir", default="models", help="save_models가 만든 모델 디렉토리")
+    parser.add_argument("--model", help="사용할 모델 이름 (기본: 결과 요약의 최고 성능 모델)")
+    parser.add_argument("--chunksize", type=int, default=100_000, help="청크당 행 수")
+    parser.add_argument("--workers", type=int, help="프로세스 풀 크기 (기본: CPU 수, 0이면 단일 프로세스)")
+    parser.add_argument("--proba", action="store_true", help="클래스별 확률 컬럼도 출력")
+    parser.add_argument("--id-column", default="Id", help="출력에 함께 기록할 ID 컬럼")
+    parser.add_argument("--stats-json", help="처리량 통계를 저장할 JSON 경로")
+    parser.add_argument("--no-compiled-trees", dest="compiled_trees", action="store_false",
+                        help="manifest에 트리 노드 테이블이 있어도 sklearn 모델로 예측")
+    parser.add_argument("--load-report", action="store_true",
+                        help="추론 대신 워커별 모델 불러오기 시간과 메모리(RSS/PSS)를 출력")
+    args = parser.parse_args()
+
+    if args.load_report:
+        report = worker_load_report(args.model_dir, args.model, args.workers or cpu_count(), args.compiled_trees)
+        print(f"{report['model']} ({report['model_type']}) 워커 {len(report['workers'])}개:")
+        for worker in report['workers']:
+            memory = (f"RSS {worker['rss_mb']:.1f}MB, PSS {worker['pss_mb']:.1f}MB"
+                      if worker['rss_mb'] is not None else "메모리 정보 없음 (/proc 없음)")
+            print(f"  pid {worker['pid']}: 불러오기 {worker['load_ms']:.1f}ms, {memory}")
+        raise SystemExit(0)
+    if not args.input or not args.output:
+        parser.error("--input과 --output이 필요합니다 (--load-report 제외)")
+
+    stats = batch_score(
+        args.input, args.output,
+        model_dir=args.model_dir,
+        model_name=args.model,
+        chunksize=args.chunksize,
+        workers=args.workers,
+        proba=args.proba,
+        id_column=args.id_column,
+        compiled_trees=args.compiled_trees
+    )
+    print(f"✓ {stats['model']} 모델로 {stats['rows']:,}행 ({stats['chunks']}개 청크) 예측: {stats['output']}")
+    print(f"  소요 시간 {stats['elapsed_seconds']:.2f}초, 처리량 {stats['rows_per_second']:,.0f}행/초, "
+          f"청크 예측 p50 {stats['chunk_score_p50_ms']:.1f}ms / p99 {stats['chunk_score_p99_ms']:.1f}ms")
+
+    if args.stats_json:
+        with open(args.stats_json, 'w', encoding='utf-8') as f:
+            json.dump(stats, f, ensure_ascii=False, indent=2)
+        print(f"✓ 통계 저장: {args.stats_json}")
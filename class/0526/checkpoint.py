@@ -0,0 +1,204 @@
+"""
+분석 파이프라인 단계별 체크포인트 모듈
+
+각 단계(load → prepare → define → tune → stack → evaluate → visualize → save)의
+입력(의존 단계의 출력 지문, 단계 메서드 소스 코드, 단계가 사용하는 모듈 파일(tuning.py 등) 내용,
+결과에 영향을 주는 설정, 입력 파일 내용)을 해시하여 키를 만들고,
+단계가 끝날 때마다 출력 속성과 생성한 파일의 지문을 디스크에 기록합니다.
+같은 키의 체크포인트가 있으면 단계를 건너뛰고, 출력은 뒤 단계가 실제로 실행될 때만 불러옵니다.
+단계마다 바로 기록하므로 시각화 단계가 실패해도 앞서 끝난 튜닝 결과는 남습니다.
+파일 지문은 체크포인트 디렉토리의 fingerprints.json에 (크기, 수정 시각)과 함께 저장하여, 바뀌지 않은 입력 파일과
+출력 파일(out-of-core 샤드 등)은 실행할 때마다 다시 읽지 않습니다.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+
+def file_fingerprint(path: str) -> str:
+    """파일 내용 해시"""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+FINGERPRINTS_NAME = "fingerprints.json"
+
+
+def _write_atomic(path: str, data: bytes):
+    """임시 파일에 쓴 뒤 교체하여 중간에 실패해도 깨진 체크포인트가 남지 않게 합니다"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class StageCheckpointer:
+    """
+    단계 체크포인트 저장소
+
+    checkpoint_dir가 None이면 비활성화되어 모든 단계를 그대로 실행합니다.
+    """
+
+    def __init__(self, checkpoint_dir=None):
+        self.checkpoint_dir = checkpoint_dir
+        # 단계 이름 → 출력 지문 (뒤 단계의 키 계산에 사용)
+        self.output_hashes = {}
+        self.executed = []
+        self.skipped = []
+        # 건너뛴 단계 중 아직 출력을 불러오지 않은 단계 (이름, 체크포인트 경로)
+        self._pending_loads = []
+        # 파일 경로 → [크기, 수정 시각(ns), 지문]
+        self._fingerprints = {}
+        self._fingerprints_dirty = False
+        if checkpoint_dir:
+            os.makedirs(checkpoint_dir, exist_ok=True)
+            try:
+                with open(os.path.join(checkpoint_dir, FINGERPRINTS_NAME), 'r', encoding='utf-8') as f:
+                    self._fingerprints = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                pass
+
+    @property
+    def enabled(self):
+        return bool(self.checkpoint_dir)
+
+    def fingerprint(self, path: str) -> str:
+        """파일 지문. 크기와 수정 시각이 기록과 같으면 파일을 다시 읽지 않고 저장된 지문을 사용합니다"""
+        stat = os.stat(path)
+        key = os.path.abspath(path)
+        cached = self._fingerprints.get(key)
+        if cached is not None and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+        fingerprint = file_fingerprint(path)
+        self._fingerprints[key] = [stat.st_size, stat.st_mtime_ns, fingerprint]
+        self._fingerprints_dirty = True
+        return fingerprint
+
+    def _save_fingerprints(self):
+        if self._fingerprints_dirty:
+            _write_atomic(os.path.join(self.checkpoint_dir, FINGERPRINTS_NAME),
+                          json.dumps(self._fingerprints).encode('utf-8'))
+            self._fingerprints_dirty = False
+
+    def stage_key(self, name, code=(), depends=(), config=None, input_files=(), modules=()) -> str:
+        """단계 코드, 사용하는 모듈 파일, 의존 단계 출력 지문, 설정, 입력 파일 내용으로 단계 키 생성"""
+        source = "".join(inspect.getsource(func) for func in code)
+        description = {
+            'stage': name,
+            'code': hashlib.blake2b(source.encode(), digest_size=16).hexdigest(),
+            'modules': {module: self.fingerprint(sys.modules[module].__file__) for module in modules},
+            'depends': {dep: self.output_hashes[dep] for dep in depends},
+            'config': {k: repr(v) for k, v in sorted((config or {}).items())},
+            'input_files': {path: self.fingerprint(path) for path in input_files}
+        }
+        return hashlib.blake2b(json.dumps(description, sort_keys=True).encode(), digest_size=20).hexdigest()
+
+    def _paths(self, name, key):
+        base = os.path.join(self.checkpoint_dir, f"{name}-{key[:16]}")
+        return base + ".json", base + ".pkl"
+
+    def _load_manifest(self, manifest_path, state_path):
+        """체크포인트 메타데이터를 읽고, 저장된 출력과 기록된 출력 파일이 그대로 남아 있는지 확인합니다"""
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if manifest['outputs'] and not os.path.exists(state_path):
+            return None
+        for path, fingerprint in manifest['files'].items():
+            if not os.path.exists(path) or self.fingerprint(path) != fingerprint:
+                return None
+        return manifest
+
+    def _materialize(self, target):
+        """건너뛴 단계들의 출력을 순서대로 불러와 target 객체 속성으로 복원합니다"""
+        for name, state_path in self._pending_loads:
+            with open(state_path, 'rb') as f:
+                for attr, value in pickle.load(f).items():
+                    setattr(target, attr, value)
+        self._pending_loads = []
+
+    def run(self, target, name, func, depends=(), outputs=(), config=None, input_files=(), output_dirs=(), code=(),
+            modules=()):
+        """
+        단계 하나를 실행하거나 체크포인트에서 복원합니다.
+
+        Args:
+            target: 단계가 속성을 읽고 쓰는 객체 (IrisAnalysis)
+            name: 단계 이름
+            func: 단계 함수 (인자 없이 호출)
+            depends: 의존 단계 이름 목록
+            outputs: 단계가 만드는 target 속성 이름 목록
+            config: 결과에 영향을 주는 설정 {이름: 값}
+            input_files: 내용을 키에 포함할 입력 파일 경로
+            output_dirs: 단계가 파일을 쓰는 디렉토리 (실행 중 수정된 파일의 지문을 기록)
+            code: func가 호출하는 메서드 중 키에 소스를 포함할 함수 목록
+            modules: 단계 결과에 영향을 주는 모듈 이름 (불러온 모듈의 파일 내용을 키에 포함)
+
+        Returns:
+            실행했으면 True, 체크포인트로 건너뛰었으면 False
+        """
+        if not self.enabled:
+            func()
+            self.executed.append(name)
+            return True
+
+        key = self.stage_key(name, (func, *code), depends, config, input_files, modules)
+        manifest_path, state_path = self._paths(name, key)
+        manifest = self._load_manifest(manifest_path, state_path)
+        self._save_fingerprints()
+        if manifest is not None:
+            self.output_hashes[name] = manifest['output_hash']
+            if outputs:
+                self._pending_loads.append((name, state_path))
+            self.skipped.append(name)
+            print(f"\n⏭  {name} 단계 건너뜀 (체크포인트 {key[:16]}, {manifest['created']})")
+            return False
+
+        # 앞 단계 중 건너뛴 단계의 출력이 이 단계의 입력이므로 실행 직전에 복원
+        self._materialize(target)
+        start_ns = time.time_ns()
+        func()
+
+        state = pickle.dumps({attr: getattr(target, attr) for attr in outputs}, protocol=pickle.HIGHEST_PROTOCOL)
+        files = {}
+        for output_dir in output_dirs:
+            for root, _, file_names in os.walk(output_dir):
+                for file_name in file_names:
+                    path = os.path.join(root, file_name)
+                    if os.stat(path).st_mtime_ns >= start_ns:
+                        files[path] = self.fingerprint(path)
+        # 파일만 만드는 단계는 파일 지문으로 출력 지문을 정함
+        output_hash = hashlib.blake2b(
+            state + json.dumps(files, sort_keys=True).encode(), digest_size=20
+        ).hexdigest()
+        self.output_hashes[name] = output_hash
+
+        if outputs:
+            _write_atomic(state_path, state)
+        _write_atomic(manifest_path, json.dumps({
+            'stage': name,
+            'key': key,
+            'output_hash': output_hash,
+            'outputs': list(outputs),
+            'files': files,
+            'created': datetime.now().isoformat(timespec='seconds')
+        }, ensure_ascii=False, indent=2).encode('utf-8'))
+        self._save_fingerprints()
+        self.executed.append(name)
+        return True
+
+    def finish(self, target):
+        """마지막에 건너뛴 단계들의 출력도 복원하여 target 속성을 완전한 상태로 만듭니다"""
+        self._materialize(target)
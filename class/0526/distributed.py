@@ -0,0 +1,421 @@
+"""
+분산 튜닝 작업 큐 모듈
+
+공유 디렉토리(로컬 디스크 또는 여러 노드가 마운트한 NFS 등)를 작업 큐로 사용하여
+코디네이터가 (모델, 후보, fold) 학습 작업을 올리고, 어느 호스트에서든 실행한 워커 프로세스가
+작업을 가져가 학습하고 결과를 돌려줍니다.
+
+디렉토리 구조 (queue_dir):
+    tasks/      대기 중인 작업 ({배치}-{번호}.{시도}.task, pickle로 직렬화한 (함수, 인자))
+    claimed/    워커가 가져간 작업 (tasks/에서 rename하여 가져가므로 한 작업은 한 워커만 가져감)
+    results/    작업 결과 ({배치}-{번호}.result, (성공 여부, 값))
+    workers/    워커 heartbeat 파일 (작업 중 주기적으로 갱신)
+    clock       코디네이터가 현재 시각을 읽으려고 갱신하는 파일
+    batches/    진행 중인 배치 표시 (끝난 배치의 늦은 결과는 버림)
+    data/       세션별 공유 데이터 (numpy 배열은 .npy로 저장하여 워커가 mmap으로 읽음)
+
+heartbeat가 heartbeat_timeout 동안 갱신되지 않은 워커가 가져간 작업은 tasks/로 되돌려 다른 워커가
+다시 실행합니다 (최대 max_retries번). 같은 작업 결과가 두 번 오면 먼저 온 결과를 사용합니다.
+heartbeat 경과 시간은 코디네이터의 시계가 아니라 큐 파일 시스템의 시각(clock 파일을 갱신한 mtime)과 비교하므로
+노드 간 시계가 어긋나도 작업을 잘못 되돌리거나 영영 되돌리지 못하는 일이 없습니다.
+살아 있는 워커가 worker_wait_timeout 동안 하나도 없으면 작업을 기다리지 않고 RuntimeError를 냅니다.
+작업 함수는 모듈 이름으로 직렬화되므로 워커는 같은 코드(이 디렉토리)가 있는 곳에서 실행해야 합니다.
+
+워커 실행:
+    python distributed.py worker --queue-dir /shared/queue
+    python distributed.py worker --queue-dir /shared/queue --idle-timeout 600
+"""
+
+import argparse
+import os
+import pickle
+import socket
+import subprocess
+import sys
+import threading
+import time
+import traceback
+import uuid
+
+import numpy as np
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+QUEUE_SUBDIRS = ('tasks', 'claimed', 'results', 'workers', 'batches', 'data')
+
+
+def _write_atomic(path: str, data: bytes):
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _parse_task_file(filename):
+    """'{작업 id}.{시도}.task' 또는 '{작업 id}.{시도}.{워커 id}.task' → (작업 id, 시도, 워커 id)"""
+    parts = filename[:-len('.task')].split('.', 2)
+    return parts[0], int(parts[1]), parts[2] if len(parts) > 2 else None
+
+
+def worker_id_for(name=None):
+    """
+    워커 이름을 큐 파일 이름에 쓸 수 있는 형태로 바꿉니다 (기본: 호스트 이름-PID).
+    작업 파일 이름은 '.'으로 필드를 나누므로 '.'은 '_'로 바꿉니다. 워커와 코디네이터가 모두 이 함수를 사용해야
+    heartbeat 파일 경로가 일치합니다.
+    """
+    return (name or f"{socket.gethostname()}-{os.getpid()}").replace('.', '_')
+
+
+class SharedRef:
+    """큐 디렉토리에 저장된 공유 데이터 참조 (워커가 작업 인자로 받으면 실제 값으로 바꿈)"""
+
+    def __init__(self, path):
+        self.path = path
+
+
+def _resolve(value, queue_dir, cache):
+    """SharedRef를 실제 값으로 바꿉니다 (cache는 워커가 배치 단위로 비우는 {경로: 값})"""
+    if not isinstance(value, SharedRef):
+        return value
+    path = os.path.join(queue_dir, value.path)
+    if path not in cache:
+        if path.endswith('.npy'):
+            cache[path] = np.load(path, mmap_mode='r')
+        else:
+            with open(path, 'rb') as f:
+                cache[path] = pickle.load(f)
+    return cache[path]
+
+
+class FileTaskQueue:
+    """
+    파일 기반 작업 큐의 코디네이터
+
+    Args:
+        queue_dir: 큐 디렉토리 (모든 워커가 같은 경로로 접근할 수 있어야 함)
+        heartbeat_timeout: 이 시간(초) 동안 heartbeat가 없는 워커의 작업을 다시 대기열로 돌림
+        max_retries: 워커 손실로 작업을 다시 실행하는 최대 횟수
+        local_workers: 코디네이터가 직접 띄울 로컬 워커 프로세스 수 (0이면 외부 워커만 사용)
+        poll_interval: 결과 확인 간격 (초)
+        worker_wait_timeout: 살아 있는 워커가 이 시간(초) 동안 없으면 map이 RuntimeError를 냄
+            (None이면 heartbeat_timeout의 4배)
+    """
+
+    def __init__(self, queue_dir, heartbeat_timeout=30.0, max_retries=3, local_workers=0, poll_interval=0.1,
+                 worker_wait_timeout=None):
+        self.queue_dir = queue_dir
+        self.heartbeat_timeout = heartbeat_timeout
+        self.worker_wait_timeout = heartbeat_timeout * 4 if worker_wait_timeout is None else worker_wait_timeout
+        self.max_retries = max_retries
+        self.local_workers = local_workers
+        self.poll_interval = poll_interval
+        self.session = uuid.uuid4().hex[:12]
+        self.requeued = 0
+        self._processes = []
+        self._shared = []
+        for subdir in QUEUE_SUBDIRS:
+            os.makedirs(os.path.join(queue_dir, subdir), exist_ok=True)
+
+    def __enter__(self):
+        self.start_local_workers()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def _path(self, *parts):
+        return os.path.join(self.queue_dir, *parts)
+
+    def _local_worker_id(self, index):
+        return worker_id_for(f"{socket.gethostname()}-local{index}-{self.session}")
+
+    def start_local_workers(self):
+        """로컬 워커 프로세스 시작 (테스트나 단일 노드 실행용)"""
+        for i in range(self.local_workers - len(self._processes)):
+            self._processes.append(subprocess.Popen([
+                sys.executable, os.path.join(SCRIPT_DIR, 'distributed.py'), 'worker',
+                '--queue-dir', self.queue_dir,
+                '--worker-id', self._local_worker_id(len(self._processes)),
+                '--heartbeat-interval', str(max(self.heartbeat_timeout / 4, 0.05))
+            ]))
+
+    def share(self, name, value) -> SharedRef:
+        """
+        여러 작업이 함께 쓰는 데이터를 한 번만 저장합니다.
+        numpy 배열은 .npy로 저장하여 워커가 복사 없이 mmap으로 읽고, 그 밖의 값은 pickle로 저장합니다.
+        """
+        os.makedirs(self._path('data', self.session), exist_ok=True)
+        if isinstance(value, np.ndarray):
+            relative = os.path.join('data', self.session, f"{name}.npy")
+            tmp_path = self._path(relative) + ".tmp.npy"
+            np.save(tmp_path, value)
+            os.replace(tmp_path, self._path(relative))
+        else:
+            relative = os.path.join('data', self.session, f"{name}.pkl")
+            _write_atomic(self._path(relative), pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        self._shared.append(relative)
+        return SharedRef(relative)
+
+    def _fs_now(self):
+        """
+        큐 파일 시스템의 현재 시각. heartbeat와 같은 방식(os.utime)으로 clock 파일을 갱신하고 mtime을 읽으므로
+        NFS에서는 서버 시각이 되어, 다른 호스트가 갱신한 heartbeat mtime과 시계 차이 없이 비교할 수 있습니다.
+        """
+        path = self._path('clock')
+        with open(path, 'a'):
+            os.utime(path)
+        return os.path.getmtime(path)
+
+    def _requeue_lost(self, batch):
+        """heartbeat가 끊긴 워커가 가져간 이 배치의 작업을 다시 대기열에 넣습니다"""
+        now = self._fs_now()
+        for filename in os.listdir(self._path('claimed')):
+            if not filename.startswith(batch):
+                continue
+            task_id, attempt, worker_id = _parse_task_file(filename)
+            try:
+                last_beat = os.path.getmtime(self._path('workers', worker_id))
+            except FileNotFoundError:
+                last_beat = 0.0
+            if now - last_beat < self.heartbeat_timeout:
+                continue
+            if attempt >= self.max_retries:
+                raise RuntimeError(f"작업 {task_id}가 워커 손실로 {attempt + 1}번 실패했습니다 (max_retries={self.max_retries})")
+            try:
+                os.rename(self._path('claimed', filename), self._path('tasks', f"{task_id}.{attempt + 1}.task"))
+            except FileNotFoundError:
+                # 그 사이 워커가 작업을 끝냄
+                continue
+            self.requeued += 1
+            print(f"⚠ 워커 {worker_id} 응답 없음: 작업 {task_id} 재시도 ({attempt + 1}/{self.max_retries})")
+
+    def _check_local_workers(self):
+        if self._processes and all(process.poll() is not None for process in self._processes):
+            raise RuntimeError("로컬 워커가 모두 종료되었습니다")
+
+    def _count_live_workers(self):
+        """heartbeat_timeout 안에 heartbeat를 갱신한 워커 수"""
+        now = self._fs_now()
+        n_live = 0
+        for worker_id in os.listdir(self._path('workers')):
+            try:
+                if now - os.path.getmtime(self._path('workers', worker_id)) < self.heartbeat_timeout:
+                    n_live += 1
+            except FileNotFoundError:
+                continue
+        return n_live
+
+    def map(self, func, arg_list):
+        """
+        func(*args)를 작업으로 올리고 결과를 인자 순서대로 하나씩 반환합니다 (생성기).
+        인자 중 SharedRef는 워커에서 실제 값으로 바뀝니다. 워커에서 예외가 나거나
+        살아 있는 워커가 worker_wait_timeout 동안 없으면 RuntimeError를 냅니다.
+        """
+        arg_list = list(arg_list)
+        batch = f"{self.session}{uuid.uuid4().hex[:8]}"
+        task_ids = [f"{batch}-{i:07d}" for i in range(len(arg_list))]
+        _write_atomic(self._path('batches', batch), b"")
+        try:
+            for task_id, args in zip(task_ids, arg_list):
+                _write_atomic(self._path('tasks', f"{task_id}.0.task"), pickle.dumps((func, args), protocol=pickle.HIGHEST_PROTOCOL))
+            results = {}
+            next_index = 0
+            last_check = 0.0
+            last_live = time.time()
+            while next_index < len(task_ids):
+                for filename in os.listdir(self._path('results')):
+                    task_id = filename[:-len('.result')]
+                    # 아직 쓰는 중인 임시 파일과 다른 배치의 결과는 건너뜀
+                    if not (filename.startswith(batch) and filename.endswith('.result')) or task_id in results:
+                        continue
+                    with open(self._path('results', filename), 'rb') as f:
+                        results[task_id] = pickle.load(f)
+                    os.remove(self._path('results', filename))
+                # 순서대로 도착한 결과는 바로 반환하여 호출 측이 메모리를 정리할 수 있게 함
+                while next_index < len(task_ids) and task_ids[next_index] in results:
+                    ok, value = results.pop(task_ids[next_index])
+                    results[task_ids[next_index]] = None
+                    if not ok:
+                        raise RuntimeError(f"작업 {task_ids[next_index]} 실패:\n{value}")
+                    yield value
+                    next_index += 1
+                if next_index == len(task_ids):
+                    break
+                if time.time() - last_check >= min(self.heartbeat_timeout / 2, 1.0):
+                    self._requeue_lost(batch)
+                    self._check_local_workers()
+                    last_check = time.time()
+                    if self._count_live_workers():
+                        last_live = last_check
+                    elif last_check - last_live > self.worker_wait_timeout:
+                        raise RuntimeError(
+                            f"살아 있는 워커가 {self.worker_wait_timeout:.0f}초 동안 없습니다 "
+                            f"(큐: {self.queue_dir}, 남은 작업 {len(task_ids) - next_index}개). "
+                            f"워커를 실행하세요: python distributed.py worker --queue-dir {self.queue_dir}"
+                        )
+                time.sleep(self.poll_interval)
+        finally:
+            os.remove(self._path('batches', batch))
+            # 재시도로 중복된 작업이나 중단된 배치의 남은 파일 정리
+            for subdir in ('tasks', 'claimed', 'results'):
+                for filename in os.listdir(self._path(subdir)):
+                    if filename.startswith(batch):
+                        try:
+                            os.remove(self._path(subdir, filename))
+                        except FileNotFoundError:
+                            pass
+
+    def close(self):
+        """로컬 워커를 종료하고 이 세션의 공유 데이터를 지웁니다"""
+        for process in self._processes:
+            process.terminate()
+        for process in self._processes:
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        # 강제 종료된 로컬 워커는 heartbeat 파일을 지우지 못하므로 대신 정리
+        for i in range(len(self._processes)):
+            try:
+                os.remove(self._path('workers', self._local_worker_id(i)))
+            except FileNotFoundError:
+                pass
+        self._processes = []
+        for relative in self._shared:
+            try:
+                os.remove(self._path(relative))
+            except FileNotFoundError:
+                pass
+        self._shared = []
+        try:
+            os.rmdir(self._path('data', self.session))
+        except OSError:
+            pass
+
+
+class _Heartbeat:
+    """작업 중에도 heartbeat 파일을 주기적으로 갱신하는 스레드"""
+
+    def __init__(self, path, interval):
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def beat(self):
+        with open(self.path, 'a'):
+            os.utime(self.path)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.beat()
+
+    def start(self):
+        self.beat()
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def _claim(queue_dir, worker_id):
+    """대기 중인 작업 중 번호가 가장 앞선 것을 가져갑니다 (다른 워커가 먼저 가져가면 다음 작업)"""
+    for filename in sorted(os.listdir(os.path.join(queue_dir, 'tasks'))):
+        if not filename.endswith('.task'):
+            continue
+        claimed = f"{filename[:-len('.task')]}.{worker_id}.task"
+        try:
+            os.rename(os.path.join(queue_dir, 'tasks', filename), os.path.join(queue_dir, 'claimed', claimed))
+        except FileNotFoundError:
+            continue
+        return filename, claimed
+    return None
+
+
+def run_worker(queue_dir, worker_id=None, heartbeat_interval=5.0, idle_timeout=None, poll_interval=0.2):
+    """
+    큐에서 작업을 가져와 실행하는 워커 루프
+
+    Args:
+        worker_id: 워커 이름 (기본: 호스트 이름-PID, worker_id_for로 정리)
+        heartbeat_interval: heartbeat 갱신 간격 (코디네이터 heartbeat_timeout보다 충분히 짧게)
+        idle_timeout: 이 시간(초) 동안 작업이 없으면 종료 (None이면 계속 대기)
+
+    Returns:
+        실행한 작업 수
+    """
+    worker_id = worker_id_for(worker_id)
+    for subdir in QUEUE_SUBDIRS:
+        os.makedirs(os.path.join(queue_dir, subdir), exist_ok=True)
+    heartbeat = _Heartbeat(os.path.join(queue_dir, 'workers', worker_id), heartbeat_interval)
+    heartbeat.start()
+    n_tasks = 0
+    idle_since = time.time()
+    # 공유 데이터 캐시는 배치 단위로 유지 (다른 배치의 작업을 가져오거나 배치가 끝나면 비움)
+    resolved = {}
+    resolved_batch = None
+    print(f"워커 {worker_id} 시작 (큐: {queue_dir})", flush=True)
+    try:
+        while True:
+            claimed = _claim(queue_dir, worker_id)
+            if claimed is None:
+                if resolved_batch is not None and not os.path.exists(os.path.join(queue_dir, 'batches', resolved_batch)):
+                    resolved.clear()
+                    resolved_batch = None
+                if idle_timeout is not None and time.time() - idle_since > idle_timeout:
+                    break
+                time.sleep(poll_interval)
+                continue
+            filename, claimed_name = claimed
+            task_id, _, _ = _parse_task_file(filename)
+            claimed_path = os.path.join(queue_dir, 'claimed', claimed_name)
+            batch = task_id.rsplit('-', 1)[0]
+            if batch != resolved_batch:
+                resolved.clear()
+                resolved_batch = batch
+            try:
+                with open(claimed_path, 'rb') as f:
+                    func, args = pickle.load(f)
+                result = (True, func(*[_resolve(arg, queue_dir, resolved) for arg in args]))
+            except Exception:
+                result = (False, traceback.format_exc())
+            # 끝난 배치(코디네이터가 먼저 받은 재시도 작업 등)의 결과는 버림
+            if os.path.exists(os.path.join(queue_dir, 'batches', batch)):
+                _write_atomic(os.path.join(queue_dir, 'results', f"{task_id}.result"),
+                              pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+            try:
+                os.remove(claimed_path)
+            except FileNotFoundError:
+                pass
+            n_tasks += 1
+            idle_since = time.time()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        heartbeat.stop()
+    print(f"워커 {worker_id} 종료 (작업 {n_tasks}개)", flush=True)
+    return n_tasks
+
+
+if __name__ == "__main__":
+    import signal
+    # 코디네이터가 terminate()로 로컬 워커를 멈출 때 heartbeat 파일을 정리하도록 KeyboardInterrupt로 처리
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    parser = argparse.ArgumentParser(description="분산 튜닝 작업 큐 워커")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    worker_parser = subparsers.add_parser("worker", help="큐에서 작업을 가져와 실행")
+    worker_parser.add_argument("--queue-dir", required=True, help="작업 큐 디렉토리 (공유 파일 시스템 경로)")
+    worker_parser.add_argument("--worker-id", help="워커 이름 (기본: 호스트 이름-PID)")
+    worker_parser.add_argument("--heartbeat-interval", type=float, default=5.0, help="heartbeat 갱신 간격 (초)")
+    worker_parser.add_argument("--idle-timeout", type=float, help="작업이 없을 때 종료까지 기다릴 시간 (초)")
+    args = parser.parse_args()
+
+    # 작업 인자의 SharedRef가 코디네이터와 같은 클래스(distributed.SharedRef)로 풀리도록 모듈로 불러와 실행
+    import distributed
+    distributed.run_worker(args.queue_dir, args.worker_id, args.heartbeat_interval, args.idle_timeout)
@@ -0,0 +1,85 @@
+"""
+distributed.py 파일 작업 큐 테스트 (로컬 워커 프로세스 여러 개로 실행)
+
+실행:
+    python -m pytest distributed_test.py -q
+"""
+
+import os
+import signal
+import time
+
+import pytest
+
+import distributed
+from distributed import FileTaskQueue
+
+
+def _square_slowly(x):
+    time.sleep(0.3)
+    return x * x
+
+
+def _kill_self():
+    os.kill(os.getpid(), signal.SIGKILL)
+
+
+def _wait_for_claimed(queue, timeout=10.0):
+    """로컬 워커가 가져간 작업 파일이 생길 때까지 기다리고 (작업 파일 이름, 워커 번호)를 반환"""
+    worker_index = {queue._local_worker_id(i): i for i in range(len(queue._processes))}
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        for filename in os.listdir(queue._path('claimed')):
+            _, _, worker_id = distributed._parse_task_file(filename)
+            if worker_id in worker_index and queue._processes[worker_index[worker_id]].poll() is None:
+                return filename, worker_index[worker_id]
+        time.sleep(0.02)
+    raise AssertionError("워커가 작업을 가져가지 않았습니다")
+
+
+def test_map_survives_killed_worker(tmp_path):
+    """작업 도중 워커 하나를 강제 종료해도 모든 작업 결과가 순서대로 한 번씩 나옴"""
+    queue_dir = str(tmp_path)
+    args = [(x,) for x in range(12)]
+    with FileTaskQueue(queue_dir, heartbeat_timeout=1.0, local_workers=3, poll_interval=0.05) as queue:
+        results = []
+        for value in queue.map(_square_slowly, args):
+            results.append(value)
+            if len(results) == 1:
+                _, index = _wait_for_claimed(queue)
+                queue._processes[index].kill()
+        assert results == [x * x for x, in args]
+        assert queue.requeued >= 1
+    for subdir in ('tasks', 'claimed', 'results', 'batches'):
+        assert os.listdir(os.path.join(queue_dir, subdir)) == []
+
+
+def test_map_gives_up_after_max_retries(tmp_path):
+    """작업을 실행하는 워커가 매번 죽으면 max_retries번 다시 시도한 뒤 RuntimeError"""
+    with FileTaskQueue(str(tmp_path), heartbeat_timeout=0.5, max_retries=1, local_workers=3,
+                       poll_interval=0.05) as queue:
+        with pytest.raises(RuntimeError, match="max_retries=1"):
+            list(queue.map(_kill_self, [()]))
+        assert queue.requeued == 1
+
+
+def test_map_fails_without_live_workers(tmp_path):
+    """살아 있는 워커가 worker_wait_timeout 동안 없으면 기다리지 않고 RuntimeError"""
+    queue = FileTaskQueue(str(tmp_path), heartbeat_timeout=0.2, worker_wait_timeout=0.5, poll_interval=0.05)
+    start = time.time()
+    with pytest.raises(RuntimeError, match="살아 있는 워커"):
+        list(queue.map(_square_slowly, [(1,)]))
+    assert time.time() - start < 10
+    assert os.listdir(os.path.join(str(tmp_path), 'tasks')) == []
+
+
+def test_heartbeat_age_uses_queue_clock(tmp_path, monkeypatch):
+    """코디네이터 시계가 어긋나도 heartbeat는 큐 파일 시스템 시각과 비교"""
+    queue = FileTaskQueue(str(tmp_path), heartbeat_timeout=5.0)
+    heartbeat = os.path.join(str(tmp_path), 'workers', 'node-a')
+    with open(heartbeat, 'a'):
+        os.utime(heartbeat)
+    real_time = time.time
+    for skew in (3600, -3600):
+        monkeypatch.setattr(distributed.time, 'time', lambda: real_time() + skew)
+        assert queue._count_live_workers() == 1
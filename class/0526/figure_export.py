@@ -0,0 +1,108 @@
+"""
+시각화 그림 일괄 저장 모듈
+
+create_basic_visualizations / create_performance_visualizations가 만든 Plotly 그림을 모아 두었다가 한 번에 저장합니다.
+
+- png: kaleido 1.x는 write_image 호출마다 브라우저를 새로 띄우므로 plotly.io.write_images로
+  브라우저 세션 하나에서 모든 그림을 내보냅니다. kaleido 0.2.x는 프로세스 안에서 렌더러를 유지하므로
+  그대로 차례로 저장하고, workers > 1이면 렌더러를 가진 작은 프로세스 풀에서 나눠 저장합니다.
+- html: 이미지 렌더링 없이 HTML로 저장합니다 (plotly.js는 디렉토리에 한 번만 기록).
+- skip: 그림을 저장하지 않습니다.
+
+batch() 안에서 flush를 호출하면 바깥 batch가 끝날 때 한꺼번에 저장합니다.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+FIGURE_FORMATS = ['png', 'html', 'skip']
+
+
+def _kaleido_major() -> int:
+    try:
+        from importlib.metadata import version
+        return int(version("kaleido").split(".")[0])
+    except Exception:
+        return 0
+
+
+def _render_png(figure_json: dict, path: str):
+    """프로세스 풀 워커: 워커마다 유지되는 kaleido 렌더러로 PNG 저장"""
+    import plotly.io as pio
+    pio.write_image(figure_json, path)
+    return path
+
+
+class FigureExporter:
+    """
+    Plotly 그림 일괄 저장기
+
+    Args:
+        output_dir: 그림을 저장할 디렉토리
+        figure_format: 'png', 'html', 'skip'
+        workers: png 저장 프로세스 수 (kaleido 0.2.x에서만 사용, 1이면 현재 프로세스)
+    """
+
+    def __init__(self, output_dir='visualizations', figure_format='png', workers=1):
+        if figure_format not in FIGURE_FORMATS:
+            raise ValueError(f"지원하지 않는 그림 형식입니다: {figure_format}")
+        self.output_dir = output_dir
+        self.figure_format = figure_format
+        self.workers = workers
+        self._pending = []
+        self._depth = 0
+        self._pool = None
+        self.export_seconds = 0.0
+
+    def add(self, fig, name: str, label: str):
+        """그림을 저장 대기열에 추가합니다 (name: 확장자 없는 파일 이름, label: 출력 메시지용 설명)"""
+        if self.figure_format != 'skip':
+            self._pending.append((fig, name, label))
+
+    @contextmanager
+    def batch(self):
+        """이 블록 안의 flush는 미루고 블록이 끝날 때 모아서 저장합니다"""
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+        self.flush()
+
+    def flush(self) -> list:
+        """대기 중인 그림을 저장하고 저장한 경로 목록을 반환합니다"""
+        if self._depth > 0 or not self._pending:
+            return []
+        pending, self._pending = self._pending, []
+        paths = [os.path.join(self.output_dir, f"{name}.{self.figure_format}") for _, name, _ in pending]
+        figures = [fig for fig, _, _ in pending]
+
+        start = time.perf_counter()
+        if self.figure_format == 'html':
+            for fig, path in zip(figures, paths):
+                fig.write_html(path, include_plotlyjs='directory')
+        elif _kaleido_major() >= 1:
+            import plotly.io as pio
+            pio.write_images(figures, paths)
+        elif self.workers > 1 and len(figures) > 1:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            list(self._pool.map(_render_png, [fig.to_plotly_json() for fig in figures], paths))
+        else:
+            for fig, path in zip(figures, paths):
+                fig.write_image(path)
+        elapsed = time.perf_counter() - start
+        self.export_seconds += elapsed
+
+        for (_, _, label), path in zip(pending, paths):
+            print(f"✓ {label} 저장: {path}")
+        print(f"  그림 {len(paths)}개 저장 {elapsed:.2f}초 ({self.figure_format})")
+        return paths
+
+    def close(self):
+        """프로세스 풀 종료"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
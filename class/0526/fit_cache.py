@@ -0,0 +1,227 @@
+"""
+학습 결과 메모이제이션 캐시 모듈
+
+학습된 추정기와 교차 검증 점수를 디스크에 저장해 두고,
+같은 (추정기 클래스, 하이퍼파라미터, 학습 데이터 지문, CV 분할 설정) 조합이 다시 요청되면
+다시 학습하지 않고 저장된 결과를 불러옵니다.
+캐시 용량이 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다.
+캐시에서 불러오지 않고 실제로 실행한 추정기 fit 횟수는 fits에 누적됩니다 (실행 기록용).
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator
+from sklearn.model_selection import check_cv, cross_val_predict, cross_val_score
+
+
+def data_fingerprint(X, y=None) -> str:
+    """학습 데이터(X, y)의 내용 기반 지문 (값, 형태, 컬럼 이름이 같으면 같은 지문)"""
+    h = hashlib.blake2b(digest_size=16)
+    for data in (X, y):
+        if data is None:
+            continue
+        if isinstance(data, (pd.DataFrame, pd.Series)):
+            h.update(repr(list(data.columns) if isinstance(data, pd.DataFrame) else data.name).encode())
+            h.update(repr(data.dtypes.tolist() if isinstance(data, pd.DataFrame) else data.dtype).encode())
+            h.update(pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes())
+            continue
+        array = np.ascontiguousarray(data)
+        h.update(f"{array.shape}{array.dtype}".encode())
+        h.update(array.tobytes())
+    return h.hexdigest()
+
+
+# 병렬화/로그 옵션처럼 학습 결과를 바꾸지 않는 파라미터
+_RUNTIME_PARAMS = {'n_jobs', 'verbose', 'pre_dispatch'}
+
+
+def count_fits(estimator) -> int:
+    """
+    추정기(탐색 객체 포함) 하나를 학습할 때 실행되는 추정기 fit 횟수.
+    탐색 객체는 학습된 상태여야 후보 수를 알 수 있고, 그 밖의 추정기는 학습 전이어도 됩니다.
+    """
+    if hasattr(estimator, 'n_fits_'):
+        return estimator.n_fits_
+    if hasattr(estimator, 'cv_results_') and hasattr(estimator, 'n_splits_'):
+        # (후보, fold)마다 한 번 + 최적 후보 재학습
+        refit = 1 if getattr(estimator, 'refit', True) else 0
+        return len(estimator.cv_results_['params']) * estimator.n_splits_ + refit
+    if hasattr(estimator, 'final_estimator') and hasattr(estimator, 'cv'):
+        # StackingClassifier: 베이스 모델마다 전체 데이터 1회 + 내부 CV fold + 메타 모델 1회
+        n_splits = check_cv(estimator.cv).get_n_splits()
+        return sum(count_fits(model) * (n_splits + 1) for _, model in estimator.estimators if model != 'drop') + 1
+    return 1
+
+
+def _describe(value):
+    """
+    추정기/파라미터를 캐시 키용 문자열로 직렬화합니다.
+    sklearn의 repr은 길면 '...'로 생략되므로 중첩 추정기까지 직접 풀어서 기록합니다.
+    """
+    if isinstance(value, BaseEstimator):
+        params = value.get_params(deep=False)
+        # 결과에 영향을 주지 않는 실행 옵션은 키에서 제외
+        inner = ", ".join(f"{k}={_describe(params[k])}" for k in sorted(params) if k not in _RUNTIME_PARAMS)
+        return f"{type(value).__module__}.{type(value).__qualname__}({inner})"
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{k!r}: {_describe(value[k])}" for k in sorted(value, key=str)) + "}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(_describe(v) for v in value) + "]"
+    if isinstance(value, np.ndarray):
+        return f"ndarray({hashlib.blake2b(np.ascontiguousarray(value).tobytes(), digest_size=8).hexdigest()})"
+    return repr(value)
+
+
+class FitCache:
+    """
+    디스크 기반 학습 결과 캐시
+
+    cache_dir가 None이면 비활성화되어 모든 요청을 그대로 학습합니다.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=1024 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.fits = 0
+        self._total_bytes = None
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @property
+    def enabled(self):
+        return bool(self.cache_dir)
+
+    def make_key(self, estimator, data_fp: str, **context) -> str:
+        """추정기 클래스/파라미터, 데이터 지문, 추가 문맥(cv 설정, fold, scoring 등)으로 캐시 키 생성"""
+        description = "|".join([_describe(estimator), data_fp, _describe(context)])
+        return hashlib.blake2b(description.encode(), digest_size=20).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.pkl")
+
+    def get(self, key: str):
+        """
+        캐시된 값을 반환합니다 (없으면 None). 사용 시각을 갱신하여 LRU 삭제 순서에 반영합니다.
+        읽을 수 없는 항목(잘린 파일, 코드/라이브러리 버전이 바뀌어 복원할 수 없는 객체 등)은 미스로 처리하고 삭제합니다.
+        """
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:
+            # 다음 put이 같은 키로 다시 저장하도록 깨진 항목 삭제
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self._total_bytes = None
+            self.misses += 1
+            return None
+        os.utime(path)
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value):
+        """값을 임시 파일에 쓴 뒤 교체하여 저장하고, 용량을 넘으면 오래된 항목을 삭제합니다"""
+        if not self.enabled:
+            return
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+        # 디렉토리 전체 크기는 처음 한 번만 계산하고 이후에는 누적하여 용량 초과 시에만 정리
+        if self._total_bytes is None:
+            self.evict()
+        else:
+            self._total_bytes += os.path.getsize(path)
+            if self._total_bytes > self.max_bytes:
+                self.evict()
+
+    def evict(self):
+        """총 용량이 max_bytes 이하가 될 때까지 마지막 사용 시각이 오래된 항목부터 삭제합니다"""
+        if not self.enabled:
+            return
+        entries = []
+        for root, dirs, files in os.walk(self.cache_dir):
+            for file in files:
+                if file.endswith(".pkl"):
+                    path = os.path.join(root, file)
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._total_bytes = total
+
+    def fit(self, estimator, X, y, data_fp=None):
+        """
+        추정기를 학습하거나 캐시에서 불러옵니다.
+        탐색 객체(RandomizedSearchCV 등)도 추정기이므로 같은 방식으로 탐색 결과 전체를 캐시합니다.
+        """
+        if not self.enabled:
+            fitted = estimator.fit(X, y)
+            self.fits += count_fits(fitted)
+            return fitted
+        key = self.make_key(estimator, data_fp or data_fingerprint(X, y), kind="fit")
+        fitted = self.get(key)
+        if fitted is None:
+            fitted = estimator.fit(X, y)
+            self.fits += count_fits(fitted)
+            self.put(key, fitted)
+        return fitted
+
+    def cross_val_score(self, estimator, X, y, cv=5, scoring=None, data_fp=None, **kwargs):
+        """sklearn cross_val_score와 같지만 같은 추정기/데이터/분할의 점수는 캐시에서 불러옵니다"""
+        if not self.enabled:
+            self.fits += check_cv(cv).get_n_splits() * count_fits(estimator)
+            return cross_val_score(estimator, X, y, cv=cv, scoring=scoring, **kwargs)
+        key = self.make_key(
+            estimator, data_fp or data_fingerprint(X, y),
+            kind="cross_val_score", cv=cv, scoring=scoring
+        )
+        scores = self.get(key)
+        if scores is None:
+            self.fits += check_cv(cv).get_n_splits() * count_fits(estimator)
+            scores = cross_val_score(estimator, X, y, cv=cv, scoring=scoring, **kwargs)
+            self.put(key, scores)
+        return scores
+
+    def cross_val_predict(self, estimator, X, y, cv=5, method='predict', data_fp=None, **kwargs):
+        """sklearn cross_val_predict와 같지만 같은 추정기/데이터/분할의 예측은 캐시에서 불러옵니다"""
+        if not self.enabled:
+            self.fits += check_cv(cv).get_n_splits() * count_fits(estimator)
+            return cross_val_predict(estimator, X, y, cv=cv, method=method, **kwargs)
+        key = self.make_key(
+            estimator, data_fp or data_fingerprint(X, y),
+            kind="cross_val_predict", cv=cv, method=method
+        )
+        predictions = self.get(key)
+        if predictions is None:
+            self.fits += check_cv(cv).get_n_splits() * count_fits(estimator)
+            predictions = cross_val_predict(estimator, X, y, cv=cv, method=method, **kwargs)
+            self.put(key, predictions)
+        return predictions
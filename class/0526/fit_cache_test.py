@@ -0,0 +1,116 @@
+"""
+fit_cache.py 학습 결과 캐시 테스트 (적중/미스, 깨진 항목, LRU 삭제)
+
+실행:
+    python -m pytest fit_cache_test.py -q
+"""
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.datasets import load_iris
+from sklearn.linear_model import LogisticRegression
+from sklearn.tree import DecisionTreeClassifier
+
+from fit_cache import FitCache, data_fingerprint
+
+
+def _iris():
+    X, y = load_iris(return_X_y=True)
+    return X, y
+
+
+def test_fit_hit_and_miss(tmp_path):
+    """같은 추정기/데이터는 적중, 파라미터나 데이터가 다르면 미스"""
+    X, y = _iris()
+    cache = FitCache(str(tmp_path))
+    first = cache.fit(DecisionTreeClassifier(max_depth=2, random_state=0), X, y)
+    assert (cache.hits, cache.misses, cache.fits) == (0, 1, 1)
+
+    second = cache.fit(DecisionTreeClassifier(max_depth=2, random_state=0), X, y)
+    assert (cache.hits, cache.misses, cache.fits) == (1, 1, 1)
+    np.testing.assert_array_equal(second.predict(X), first.predict(X))
+
+    cache.fit(DecisionTreeClassifier(max_depth=3, random_state=0), X, y)
+    cache.fit(DecisionTreeClassifier(max_depth=2, random_state=0), X[:100], y[:100])
+    assert (cache.hits, cache.misses, cache.fits) == (1, 3, 3)
+
+
+def test_runtime_params_do_not_change_key():
+    """n_jobs처럼 결과를 바꾸지 않는 파라미터는 키에서 제외"""
+    cache = FitCache()
+    fp = data_fingerprint(*_iris())
+    assert cache.make_key(LogisticRegression(n_jobs=1), fp) == cache.make_key(LogisticRegression(n_jobs=4), fp)
+    assert cache.make_key(LogisticRegression(C=1.0), fp) != cache.make_key(LogisticRegression(C=0.5), fp)
+
+
+def test_data_fingerprint_includes_columns():
+    X, y = _iris()
+    df = pd.DataFrame(X, columns=['a', 'b', 'c', 'd'])
+    assert data_fingerprint(df, y) == data_fingerprint(df.copy(), y.copy())
+    assert data_fingerprint(df, y) != data_fingerprint(df.rename(columns={'a': 'z'}), y)
+    assert data_fingerprint(X, y) != data_fingerprint(X.astype(np.float32), y)
+
+
+def test_cross_val_score_cached(tmp_path):
+    X, y = _iris()
+    cache = FitCache(str(tmp_path))
+    scores = cache.cross_val_score(DecisionTreeClassifier(random_state=0), X, y, cv=3)
+    assert cache.fits == 3
+    np.testing.assert_array_equal(cache.cross_val_score(DecisionTreeClassifier(random_state=0), X, y, cv=3), scores)
+    assert (cache.hits, cache.fits) == (1, 3)
+    cache.cross_val_score(DecisionTreeClassifier(random_state=0), X, y, cv=5)
+    assert (cache.misses, cache.fits) == (2, 8)
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    """잘린 캐시 파일은 미스로 처리되어 삭제되고, 다시 학습한 결과로 교체됨"""
+    X, y = _iris()
+    cache = FitCache(str(tmp_path))
+    estimator = DecisionTreeClassifier(random_state=0)
+    cache.fit(estimator, X, y)
+    key = cache.make_key(estimator, data_fingerprint(X, y), kind="fit")
+    path = cache._path(key)
+    with open(path, 'r+b') as f:
+        f.truncate(os.path.getsize(path) // 2)
+
+    assert cache.get(key) is None
+    assert not os.path.exists(path)
+    assert (cache.hits, cache.misses) == (0, 2)
+
+    cache.fit(DecisionTreeClassifier(random_state=0), X, y)
+    assert cache.fits == 2
+    assert cache.get(key) is not None
+
+
+def test_lru_eviction(tmp_path):
+    """용량을 넘으면 마지막 사용 시각이 가장 오래된 항목부터 삭제 (get이 사용 시각을 갱신)"""
+    value = np.zeros(10000)
+    probe = FitCache(str(tmp_path / "probe"))
+    probe.put("00size", value)
+    entry_bytes = os.path.getsize(probe._path("00size"))
+
+    cache = FitCache(str(tmp_path / "cache"), max_bytes=int(2.5 * entry_bytes))
+    now = time.time()
+    cache.put("aa", value)
+    cache.put("bb", value)
+    os.utime(cache._path("aa"), (now - 100, now - 100))
+    os.utime(cache._path("bb"), (now - 50, now - 50))
+    # 먼저 저장한 aa를 다시 사용하면 bb가 가장 오래된 항목이 됨
+    assert cache.get("aa") is not None
+    cache.put("cc", value)
+
+    assert os.path.exists(cache._path("aa"))
+    assert not os.path.exists(cache._path("bb"))
+    assert os.path.exists(cache._path("cc"))
+    assert cache._total_bytes <= cache.max_bytes
+
+
+def test_disabled_cache_always_fits():
+    X, y = _iris()
+    cache = FitCache()
+    cache.fit(DecisionTreeClassifier(random_state=0), X, y)
+    cache.fit(DecisionTreeClassifier(random_state=0), X, y)
+    assert (cache.hits, cache.misses, cache.fits) == (0, 0, 2)
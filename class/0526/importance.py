@@ -0,0 +1,139 @@
+"""
+병렬 순열 특성 중요도 모듈
+
+특성 열 하나를 섞었을 때 점수가 얼마나 떨어지는지로 중요도를 잽니다. feature_importances_가 없는
+모델(로지스틱 회귀, 스태킹 앙상블 등)에도 같은 방식으로 적용할 수 있습니다.
+
+sklearn.inspection.permutation_importance는 특성마다 입력 행렬 전체를 복사하고 특성 단위로만 병렬화합니다.
+여기서는 (특성, 반복) 작업을 워커 수만큼 묶어 워커마다 행렬을 한 번만 복사하고, 그 사본의 열을 제자리에서
+섞어 점수를 매긴 뒤 원래 값으로 되돌립니다. 작업마다 추가로 필요한 메모리는 열 하나입니다.
+워커 사본의 합이 MAX_COPY_BYTES를 넘지 않도록 묶음 수를 줄이므로, 큰 검증 세트에서도 사본은 코어 수가 아니라
+몇 개로 제한됩니다 (max_samples로 줄인 작은 X는 모든 코어 사용).
+반복마다 난수 시드를 미리 정해 두므로 결과는 워커 수와 관계없이 같습니다.
+큰 검증 세트는 max_samples로 행을 표본 추출하여 비용을 줄일 수 있습니다.
+"""
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, cpu_count, delayed
+from sklearn.metrics import get_scorer
+from threadpoolctl import threadpool_limits
+
+# 워커별 입력 행렬 사본 크기의 합 상한 (사본은 최소 1개)
+MAX_COPY_BYTES = 256 * 1024 * 1024
+
+
+def _sample_rows(n_rows, max_samples, rng):
+    """max_samples(행 수 또는 비율)에 맞는 행 인덱스 (None이면 전체)"""
+    if max_samples is None:
+        return None
+    n_samples = int(max_samples * n_rows) if isinstance(max_samples, float) and max_samples <= 1.0 \
+        else int(max_samples)
+    if n_samples <= 0:
+        raise ValueError(f"max_samples는 0보다 커야 합니다: {max_samples}")
+    if n_samples >= n_rows:
+        return None
+    return np.sort(rng.choice(n_rows, size=n_samples, replace=False))
+
+
+def _nbytes(X):
+    """입력 행렬 사본 하나의 크기 (bytes)"""
+    if isinstance(X, pd.DataFrame):
+        return int(X.memory_usage(index=False).sum())
+    return np.asarray(X).nbytes
+
+
+def _permutation_scores_task(model, X, y, tasks, seeds, scoring):
+    """
+    워커 하나에서 (특성, 반복) 작업 묶음을 실행합니다.
+    입력 행렬은 한 번만 복사하고, 작업마다 열 하나를 제자리에서 섞었다가 되돌립니다.
+    """
+    scorer = get_scorer(scoring)
+    if isinstance(X, pd.DataFrame):
+        work = X.to_numpy(copy=True)
+        # 단일 dtype이면 DataFrame이 work의 메모리를 그대로 사용하므로 work를 바꾸면 입력도 바뀜
+        frame = pd.DataFrame(work, index=X.index, columns=X.columns, copy=False)
+        shared = np.shares_memory(work, frame.values)
+    else:
+        work = np.array(X, copy=True)
+        frame, shared = work, True
+
+    def set_column(j, values):
+        work[:, j] = values
+        if not shared:
+            frame.isetitem(j, values)
+
+    scores = []
+    with threadpool_limits(limits=1):
+        for j, r in tasks:
+            column = work[:, j].copy()
+            set_column(j, column[np.random.default_rng(seeds[j, r]).permutation(len(column))])
+            scores.append(scorer(model, frame, y))
+            set_column(j, column)
+    return scores
+
+
+def permutation_importance_parallel(model, X, y, n_repeats=5, scoring='accuracy', max_samples=None,
+                                    n_jobs=-1, random_state=42):
+    """
+    (특성, 반복) 단위로 병렬화한 순열 특성 중요도
+
+    Args:
+        model: 학습된 모델
+        X: 평가 데이터 (numpy 배열 또는 DataFrame, 모델 학습 때와 같은 형식)
+        y: 평가 레이블
+        n_repeats: 특성마다 섞는 횟수
+        scoring: sklearn scorer 이름
+        max_samples: 사용할 행 수(int) 또는 비율(0~1 float) (None이면 전체)
+        n_jobs: 최대 워커 수 (-1이면 모든 코어, 사본 크기 합이 MAX_COPY_BYTES를 넘으면 더 적게 사용)
+        random_state: 표본 추출과 순열의 난수 시드
+
+    Returns:
+        {'importances_mean', 'importances_std', 'importances' (특성 × 반복), 'baseline_score', 'n_samples'}
+
+    Raises:
+        ValueError: X나 y가 없거나, X가 2차원이 아니거나, 행 수가 다르거나, 비어 있을 때
+    """
+    if X is None or y is None:
+        raise ValueError("순열 특성 중요도에는 평가 데이터 X와 레이블 y가 필요합니다")
+    if len(np.shape(X)) != 2:
+        raise ValueError(f"X는 (행, 특성) 2차원이어야 합니다: shape={np.shape(X)}")
+    y = np.asarray(y)
+    if len(y) != X.shape[0]:
+        raise ValueError(f"X와 y의 행 수가 다릅니다: {X.shape[0]} != {len(y)}")
+    if len(y) == 0:
+        raise ValueError("평가 데이터가 비어 있습니다")
+    # cgroup / CPU affinity 제한을 반영한 코어 수
+    n_jobs = cpu_count() if n_jobs in (None, -1) else n_jobs
+    rng = np.random.default_rng(random_state)
+    rows = _sample_rows(len(y), max_samples, rng)
+    if rows is not None:
+        X = X.iloc[rows] if isinstance(X, pd.DataFrame) else np.asarray(X)[rows]
+        y = y[rows]
+    n_features = X.shape[1]
+    seeds = rng.integers(0, 2 ** 32, size=(n_features, n_repeats), dtype=np.uint64)
+
+    baseline = get_scorer(scoring)(model, X, y)
+    tasks = [(j, r) for j in range(n_features) for r in range(n_repeats)]
+    # 워커마다 X를 한 번 복사하므로 사본 크기 합이 MAX_COPY_BYTES 안에 들어가는 만큼만 나눔
+    max_copies = MAX_COPY_BYTES // max(1, _nbytes(X))
+    n_chunks = max(1, min(n_jobs, len(tasks), max_copies))
+    chunks = [tasks[k::n_chunks] for k in range(n_chunks)]
+    if n_chunks == 1:
+        chunk_scores = [_permutation_scores_task(model, X, y, chunks[0], seeds, scoring)]
+    else:
+        chunk_scores = Parallel(n_jobs=n_chunks)(
+            delayed(_permutation_scores_task)(model, X, y, chunk, seeds, scoring) for chunk in chunks
+        )
+
+    importances = np.zeros((n_features, n_repeats))
+    for chunk, scores in zip(chunks, chunk_scores):
+        for (j, r), score in zip(chunk, scores):
+            importances[j, r] = baseline - score
+    return {
+        'importances_mean': importances.mean(axis=1),
+        'importances_std': importances.std(axis=1),
+        'importances': importances,
+        'baseline_score': baseline,
+        'n_samples': len(y)
+    }
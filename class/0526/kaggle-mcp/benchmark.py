@@ -0,0 +1,160 @@
+"""
+kaggle-mcp 처리량 벤치마크
+
+fake_kaggle의 로컬 Kaggle API 대역을 사용하여 각 MCP 도구의
+p50/p99 지연 시간, 동시 호출 시 처리량, 전송 바이트 수를 측정합니다.
+다운로드 시나리오는 캐시 없음(download_dataset 전체 재다운로드)과
+캐시 있음(sync_dataset 증분 동기화)을 함께 비교합니다.
+
+실행 예:
+    python benchmark.py --latency 0.05 --bandwidth 50000000 --concurrency 8 --requests 40
+    python benchmark.py --output benchmark_results.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import numpy as np
+
+# kaggle 패키지는 import 시점에 인증을 시도하므로 가짜 인증 정보를 먼저 설정
+os.environ.setdefault('KAGGLE_USERNAME', 'benchmark')
+os.environ.setdefault('KAGGLE_KEY', 'benchmark')
+
+import server
+from fake_kaggle import FakeKaggleService, install
+
+
+def run_scenario(service, name, make_call, requests, concurrency, cache=None):
+    """
+    동일한 도구 호출을 requests번, concurrency개의 스레드에서 동시에 실행하고 통계를 반환합니다.
+    make_call(i)는 i번째 호출의 코루틴을 반환해야 합니다.
+    """
+    service.reset_counters()
+
+    def timed_call(i):
+        start = time.perf_counter()
+        result = asyncio.run(make_call(i))
+        return time.perf_counter() - start, result.get("success", False)
+
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        outcomes = list(executor.map(timed_call, range(requests)))
+    wall = time.perf_counter() - wall_start
+
+    latencies = np.array([latency for latency, _ in outcomes]) * 1000
+    return {
+        "scenario": name,
+        "cache": cache,
+        "requests": requests,
+        "concurrency": concurrency,
+        "failures": sum(1 for _, ok in outcomes if not ok),
+        "p50_ms": float(np.percentile(latencies, 50)),
+        "p99_ms": float(np.percentile(latencies, 99)),
+        "mean_ms": float(latencies.mean()),
+        "throughput_rps": requests / wall,
+        "api_calls": service.calls,
+        "bytes_transferred": service.bytes_transferred,
+        "bytes_per_request": service.bytes_transferred / requests
+    }
+
+
+def run_benchmark(args) -> list:
+    service = install(server, FakeKaggleService(
+        latency=args.latency,
+        bandwidth=args.bandwidth,
+        files_per_dataset=args.files_per_dataset,
+        file_size=args.file_size
+    ))
+    dataset_ref = "fake-owner/dataset-000"
+    work_dir = tempfile.mkdtemp(prefix="kaggle-mcp-bench-")
+    results = []
+
+    try:
+        results.append(run_scenario(
+            service, "list_datasets",
+            lambda i: server.list_datasets(search_query="dataset", max_results=50),
+            args.requests, args.concurrency
+        ))
+        results.append(run_scenario(
+            service, "list_datasets (filtered)",
+            lambda i: server.list_datasets(search_query="dataset", max_results=10, min_usability=0.8, tags=["finance"]),
+            args.requests, args.concurrency
+        ))
+        results.append(run_scenario(
+            service, "dataset_info",
+            lambda i: server.dataset_info(dataset_ref),
+            args.requests, args.concurrency
+        ))
+        results.append(run_scenario(
+            service, "list_competitions",
+            lambda i: server.list_competitions(max_results=50),
+            args.requests, args.concurrency
+        ))
+
+        # 캐시 없음: 매번 전체 아카이브를 새 디렉토리에 다운로드 (아카이브 생성 비용은 미리 지불)
+        service.archive(dataset_ref)
+        results.append(run_scenario(
+            service, "download_dataset",
+            lambda i: server.download_dataset(dataset_ref, output_path=os.path.join(work_dir, f"download_{i}")),
+            args.requests, args.concurrency, cache=False
+        ))
+
+        # 캐시 있음: 미리 동기화해 둔 로컬 사본에 새 버전(파일 1개 변경)을 증분 동기화
+        sync_dirs = [os.path.join(work_dir, f"sync_{i}") for i in range(args.requests)]
+        for sync_dir in sync_dirs:
+            asyncio.run(server.sync_dataset(dataset_ref, sync_dir))
+        service.publish_version(dataset_ref, changed_files=["file_0.csv"])
+        results.append(run_scenario(
+            service, "sync_dataset (1 file changed)",
+            lambda i: server.sync_dataset(dataset_ref, sync_dirs[i]),
+            args.requests, args.concurrency, cache=True
+        ))
+        results.append(run_scenario(
+            service, "sync_dataset (unchanged)",
+            lambda i: server.sync_dataset(dataset_ref, sync_dirs[i]),
+            args.requests, args.concurrency, cache=True
+        ))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return results
+
+
+def print_results(results):
+    print(f"{'시나리오':<32}{'p50(ms)':>10}{'p99(ms)':>10}{'req/s':>10}{'API 호출':>10}{'전송(MB)':>12}{'실패':>6}")
+    for r in results:
+        print(
+            f"{r['scenario']:<32}{r['p50_ms']:>10.1f}{r['p99_ms']:>10.1f}{r['throughput_rps']:>10.2f}"
+            f"{r['api_calls']:>10}{r['bytes_transferred'] / 1e6:>12.2f}{r['failures']:>6}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="kaggle-mcp 처리량 벤치마크 (로컬 가짜 Kaggle API 사용)")
+    parser.add_argument("--latency", type=float, default=0.05, help="API 호출당 지연 시간 (초)")
+    parser.add_argument("--bandwidth", type=float, default=50_000_000, help="파일 전송 대역폭 (바이트/초, 0이면 무제한)")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 호출 수")
+    parser.add_argument("--requests", type=int, default=40, help="시나리오당 호출 수")
+    parser.add_argument("--files-per-dataset", type=int, default=4, help="데이터셋당 파일 수")
+    parser.add_argument("--file-size", type=int, default=500_000, help="기본 파일 크기 (바이트, n번째 파일은 n배)")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    results = run_benchmark(args)
+    print_results(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({
+                "timestamp": datetime.now().isoformat(),
+                "config": vars(args),
+                "results": results
+            }, f, ensure_ascii=False, indent=2)
+        print(f"\n✓ 결과 저장: {args.output}")
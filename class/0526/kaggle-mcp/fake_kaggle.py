@@ -0,0 +1,264 @@
+"""
+로컬 Kaggle API 대역(stand-in) 모듈
+
+실제 Kaggle API 없이 kaggle-mcp 서버를 부하 테스트하기 위한 가짜 서비스입니다.
+미리 정의한 메타데이터와 합성 CSV/zip 아카이브를 제공하며,
+호출당 지연 시간(latency)과 대역폭(bandwidth)을 설정할 수 있습니다.
+
+사용 예:
+    import server
+    from fake_kaggle import FakeKaggleService, install
+
+    service = FakeKaggleService(latency=0.05, bandwidth=50_000_000)
+    install(server, service)   # server.KaggleApi를 가짜 클라이언트로 교체
+"""
+
+import io
+import os
+import threading
+import time
+import zipfile
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+# 실제 API와 같이 한 페이지에 담기는 목록 항목 수
+PAGE_SIZE = 20
+# 이 크기 이상인 단일 파일은 실제 API처럼 zip으로 압축해서 내려줌
+ZIP_THRESHOLD = 1_000_000
+
+
+def _synthetic_csv(file_name: str, size: int, version: int) -> bytes:
+    """요청한 크기에 가까운 합성 CSV 내용을 결정적으로 생성합니다"""
+    header = "id,item_id,shop_id,value,category\n"
+    rows = []
+    total = len(header)
+    i = 0
+    seed = sum(map(ord, file_name)) + version * 7919
+    while total < size:
+        row = f"{i},{(i * 31 + seed) % 22170},{(i + seed) % 60},{((i * 17 + seed) % 1000) / 10},cat_{(i + seed) % 84}\n"
+        rows.append(row)
+        total += len(row)
+        i += 1
+    return (header + "".join(rows)).encode('utf-8')
+
+
+class FakeKaggleService:
+    """
+    가짜 Kaggle 서비스
+
+    데이터셋/대회 메타데이터와 파일 내용을 보관하고, 호출 수와 전송 바이트 수를 집계합니다.
+    모든 응답은 latency초 만큼 지연되며, 파일 전송은 bandwidth(바이트/초)에 맞춰 추가로 지연됩니다.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.05,
+        bandwidth: Optional[float] = 50_000_000,
+        num_datasets: int = 100,
+        files_per_dataset: int = 4,
+        file_size: int = 500_000,
+        num_competitions: int = 60
+    ):
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self._lock = threading.Lock()
+        self._content_cache: Dict[tuple, bytes] = {}
+        self.calls = 0
+        self.bytes_transferred = 0
+
+        base_date = datetime(2024, 1, 1)
+        self.datasets = {}
+        for d in range(num_datasets):
+            ref = f"fake-owner/dataset-{d:03d}"
+            files = {
+                f"file_{f}.csv": {
+                    "size": file_size * (f + 1),
+                    "version": 1,
+                    "creation_date": base_date.isoformat()
+                }
+                for f in range(files_per_dataset)
+            }
+            self.datasets[ref] = {
+                "ref": ref,
+                "title": f"Fake Dataset {d:03d}",
+                "version": 1,
+                "usability_rating": round((d % 10) / 10 + 0.05, 2),
+                "tags": ["finance" if d % 3 == 0 else "tabular", "synthetic"],
+                "last_updated": (base_date + timedelta(days=d)).isoformat(),
+                "download_count": d * 13,
+                "vote_count": d * 3,
+                "files": files
+            }
+        self.competitions = [
+            {
+                "ref": f"fake-competition-{c:03d}",
+                "title": f"Fake Competition {c:03d}",
+                "url": f"https://www.kaggle.com/c/fake-competition-{c:03d}",
+                "deadline": (base_date + timedelta(days=30 + c)).isoformat(),
+                "category": "featured" if c % 2 == 0 else "playground",
+                "reward": f"${(c + 1) * 1000}",
+                "team_count": c * 11
+            }
+            for c in range(num_competitions)
+        ]
+
+    # ----- 시뮬레이션 유틸리티 -----
+
+    def _request(self):
+        """API 호출 1회를 집계하고 고정 지연 시간을 적용합니다"""
+        with self._lock:
+            self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _transfer(self, payload: bytes) -> bytes:
+        """전송 바이트를 집계하고 대역폭에 따른 전송 시간을 적용합니다"""
+        with self._lock:
+            self.bytes_transferred += len(payload)
+        if self.bandwidth:
+            time.sleep(len(payload) / self.bandwidth)
+        return payload
+
+    def file_content(self, dataset_ref: str, file_name: str) -> bytes:
+        """파일 버전별 합성 내용 (한 번 생성한 내용은 캐시하여 벤치마크에 생성 비용이 섞이지 않게 함)"""
+        meta = self.datasets[dataset_ref]["files"][file_name]
+        key = (dataset_ref, file_name, meta["version"])
+        if key not in self._content_cache:
+            self._content_cache[key] = _synthetic_csv(file_name, meta["size"], meta["version"])
+        return self._content_cache[key]
+
+    def archive(self, dataset_ref: str) -> bytes:
+        """데이터셋 전체 파일을 담은 zip 아카이브"""
+        key = (dataset_ref, "__archive__", self.datasets[dataset_ref]["version"])
+        if key not in self._content_cache:
+            buffer = io.BytesIO()
+            with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+                for file_name in self.datasets[dataset_ref]["files"]:
+                    zf.writestr(file_name, self.file_content(dataset_ref, file_name))
+            self._content_cache[key] = buffer.getvalue()
+        return self._content_cache[key]
+
+    def publish_version(self, dataset_ref: str, changed_files: List[str], added_files: Optional[Dict[str, int]] = None):
+        """새 데이터셋 버전을 게시합니다 (지정한 파일만 내용/타임스탬프 변경)"""
+        dataset = self.datasets[dataset_ref]
+        dataset["version"] += 1
+        now = datetime.now().isoformat()
+        for file_name in changed_files:
+            meta = dataset["files"][file_name]
+            meta["version"] += 1
+            meta["creation_date"] = now
+            meta["size"] = len(self.file_content(dataset_ref, file_name))
+        for file_name, size in (added_files or {}).items():
+            dataset["files"][file_name] = {"size": size, "version": 1, "creation_date": now}
+
+    def reset_counters(self):
+        with self._lock:
+            self.calls = 0
+            self.bytes_transferred = 0
+
+    # ----- 응답 객체 생성 -----
+
+    def dataset_object(self, dataset_ref: str) -> SimpleNamespace:
+        dataset = self.datasets[dataset_ref]
+        return SimpleNamespace(
+            ref=dataset["ref"],
+            title=dataset["title"],
+            total_bytes=sum(meta["size"] for meta in dataset["files"].values()),
+            usability_rating=dataset["usability_rating"],
+            tags=[SimpleNamespace(name=tag, ref=tag) for tag in dataset["tags"]],
+            last_updated=dataset["last_updated"],
+            download_count=dataset["download_count"],
+            vote_count=dataset["vote_count"],
+            current_version_number=dataset["version"],
+            description=f"{dataset['title']} (synthetic)",
+            license_name="CC0-1.0"
+        )
+
+
+class FakeKaggleApi:
+    """
+    KaggleApi와 같은 메서드 시그니처를 가진 가짜 클라이언트
+
+    server.py가 사용하는 메서드만 구현하며, 모든 호출은 연결된 FakeKaggleService로 전달됩니다.
+    """
+
+    service: FakeKaggleService = None
+
+    def authenticate(self):
+        pass
+
+    def dataset_list(self, sort_by=None, search=None, user=None, owner=None, page=1, **kwargs):
+        self.service._request()
+        owner = owner or user
+        refs = [
+            ref for ref in self.service.datasets
+            if (not search or search in ref) and (not owner or ref.startswith(f"{owner}/"))
+        ]
+        start = (page - 1) * PAGE_SIZE
+        return [self.service.dataset_object(ref) for ref in refs[start:start + PAGE_SIZE]]
+
+    def dataset_list_files(self, dataset, page_token=None, page_size=PAGE_SIZE):
+        self.service._request()
+        files = list(self.service.datasets[dataset]["files"].items())
+        start = int(page_token or 0)
+        page = files[start:start + page_size]
+        next_token = str(start + page_size) if start + page_size < len(files) else ""
+        return SimpleNamespace(
+            files=[
+                SimpleNamespace(name=name, total_bytes=meta["size"], size=meta["size"], creation_date=meta["creation_date"])
+                for name, meta in page
+            ],
+            next_page_token=next_token
+        )
+
+    def dataset_download_files(self, dataset, path=None, force=False, quiet=True, unzip=False, **kwargs):
+        self.service._request()
+        path = path or os.getcwd()
+        os.makedirs(path, exist_ok=True)
+        payload = self.service._transfer(self.service.archive(dataset))
+        zip_path = os.path.join(path, dataset.split('/')[1] + ".zip")
+        with open(zip_path, 'wb') as f:
+            f.write(payload)
+        if unzip:
+            with zipfile.ZipFile(zip_path, 'r') as zf:
+                zf.extractall(path)
+            os.remove(zip_path)
+
+    def dataset_download_file(self, dataset, file_name, path=None, force=False, quiet=True, **kwargs):
+        self.service._request()
+        path = path or os.getcwd()
+        os.makedirs(path, exist_ok=True)
+        content = self.service.file_content(dataset, file_name)
+        base_name = os.path.basename(file_name)
+        if len(content) >= ZIP_THRESHOLD:
+            buffer = io.BytesIO()
+            with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+                zf.writestr(base_name, content)
+            with open(os.path.join(path, base_name + ".zip"), 'wb') as f:
+                f.write(self.service._transfer(buffer.getvalue()))
+        else:
+            with open(os.path.join(path, base_name), 'wb') as f:
+                f.write(self.service._transfer(content))
+        return True
+
+    def competitions_list(self, group=None, category=None, sort_by=None, page=-1, search=None, page_size=PAGE_SIZE, page_token=None):
+        self.service._request()
+        competitions = [
+            c for c in self.service.competitions
+            if (not search or search in c["ref"]) and (category in (None, "all") or c["category"] == category)
+        ]
+        start = int(page_token or 0)
+        page_items = competitions[start:start + page_size]
+        next_token = str(start + page_size) if start + page_size < len(competitions) else ""
+        return SimpleNamespace(
+            competitions=[SimpleNamespace(**c) for c in page_items],
+            next_page_token=next_token
+        )
+
+
+def install(server_module, service: FakeKaggleService) -> FakeKaggleService:
+    """server 모듈의 KaggleApi를 주어진 서비스에 연결된 가짜 클라이언트로 교체합니다"""
+    FakeKaggleApi.service = service
+    server_module.KaggleApi = FakeKaggleApi
+    return service
@@ -1,18 +1,356 @@
 from mcp.server.fastmcp import FastMCP
 import pandas as pd
+import numpy as np
 import os
+import asyncio
 import tempfile
 import json
-from typing import List, Optional, Dict, Any
+import re
+import zipfile
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple
 import kaggle
 from kaggle.api.kaggle_api_extended import KaggleApi
 import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
 
 mcp = FastMCP(
     name="kaggle-mcp-server",
     instructions="Kaggle API를 활용한 데이터셋 조회, 다운로드 및 분석을 수행하는 MCP 서버"
 )
 
+# 동기화 상태(버전, 파일별 크기/타임스탬프)를 기록하는 매니페스트 파일 이름
+SYNC_MANIFEST_NAME = ".kaggle_sync.json"
+
+def _get_attr(obj, *names, default=None):
+    """kaggle 버전에 따라 다른 속성 이름(snake_case/camelCase)을 순서대로 조회합니다"""
+    for name in names:
+        value = getattr(obj, name, None)
+        if value is not None:
+            return value
+    return default
+
+def _find_dataset(api, dataset_ref: str):
+    """owner/dataset-name 형식의 참조와 일치하는 데이터셋 객체를 찾습니다 (없으면 None)"""
+    owner, dataset_name = dataset_ref.split('/')
+    for ds in api.dataset_list(search=dataset_name, owner=owner) or []:
+        if ds.ref == dataset_ref:
+            return ds
+    return None
+
+def _list_remote_files(api, dataset_ref: str) -> Dict[str, Dict[str, Any]]:
+    """원격 데이터셋의 파일 목록을 {파일명: {size, creation_date}} 형태로 반환합니다"""
+    remote_files = {}
+    page_token = None
+    while True:
+        if page_token:
+            response = api.dataset_list_files(dataset_ref, page_token=page_token)
+        else:
+            response = api.dataset_list_files(dataset_ref)
+        for f in response.files or []:
+            remote_files[f.name] = {
+                "size": _get_attr(f, 'total_bytes', 'totalBytes', 'size'),
+                "creation_date": str(_get_attr(f, 'creation_date', 'creationDate', default=''))
+            }
+        # 신규 kaggle 클라이언트는 파일 목록을 페이지 단위로 반환
+        page_token = _get_attr(response, 'next_page_token', 'nextPageToken')
+        if not page_token:
+            break
+    return remote_files
+
+def _load_sync_manifest(output_path: str, dataset_ref: str) -> dict:
+    """로컬 동기화 매니페스트를 읽습니다 (다른 데이터셋의 매니페스트면 무시)"""
+    manifest_path = os.path.join(output_path, SYNC_MANIFEST_NAME)
+    if os.path.exists(manifest_path):
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get("dataset_ref") == dataset_ref:
+            return manifest
+    return {"dataset_ref": dataset_ref, "version": None, "files": {}}
+
+def _write_json_atomic(path: str, data: dict):
+    """JSON을 임시 파일에 쓴 뒤 교체하여 중간 실패 시에도 깨지지 않게 저장합니다"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+def _save_sync_manifest(output_path: str, manifest: dict):
+    """동기화 매니페스트를 저장합니다"""
+    _write_json_atomic(os.path.join(output_path, SYNC_MANIFEST_NAME), manifest)
+
+def _download_remote_file(api, dataset_ref: str, file_name: str, output_path: str) -> int:
+    """원격 파일 하나만 내려받아 output_path 아래 같은 상대 경로에 배치하고 전송 바이트 수를 반환합니다"""
+    target_path = os.path.join(output_path, file_name)
+    target_dir = os.path.dirname(target_path)
+    os.makedirs(target_dir, exist_ok=True)
+    api.dataset_download_file(dataset_ref, file_name, path=target_dir, force=True, quiet=True)
+
+    # 큰 파일은 zip으로 압축되어 내려오므로 압축 해제 후 원본 zip 삭제
+    zip_path = os.path.join(target_dir, os.path.basename(file_name) + ".zip")
+    if os.path.exists(zip_path):
+        transferred = os.path.getsize(zip_path)
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            zip_ref.extractall(target_dir)
+        os.remove(zip_path)
+        return transferred
+    return os.path.getsize(target_path)
+
+# Parquet 변환 결과(스키마, 행 수)를 기록하는 매니페스트 파일 이름
+PARQUET_MANIFEST_NAME = "parquet_manifest.json"
+# 청크(= row group) 크기: 컬럼 통계로 건너뛰기 좋고 스캔 시 메모리에 부담 없는 크기
+PARQUET_ROW_GROUP_SIZE = 250_000
+
+def _parquet_path(file_path: str) -> str:
+    """CSV 파일 옆에 생성되는 Parquet 사본 경로"""
+    return os.path.splitext(file_path)[0] + ".parquet"
+
+def _prefer_parquet(file_path: str) -> str:
+    """원본보다 최신인 Parquet 사본이 있으면 그 경로를, 없으면 원본 경로를 반환합니다"""
+    if file_path.endswith(('.csv', '.tsv')):
+        parquet_path = _parquet_path(file_path)
+        if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(file_path):
+            return parquet_path
+    return file_path
+
+def _promote_type(a, b):
+    """
+    두 청크에서 추론한 컬럼 타입을 모두 담을 수 있는 타입
+    (전부 결측인 컬럼 → 다른 쪽 타입, int/float → float64, 그 밖의 불일치 → 문자열)
+    """
+    import pyarrow as pa
+
+    if a.equals(b):
+        return a
+    if pa.types.is_null(a):
+        return b
+    if pa.types.is_null(b):
+        return a
+    if pa.types.is_integer(a) and pa.types.is_integer(b):
+        return pa.int64()
+    if (pa.types.is_integer(a) or pa.types.is_floating(a)) and (pa.types.is_integer(b) or pa.types.is_floating(b)):
+        return pa.float64()
+    return pa.string()
+
+def _promote_schema(schema, other):
+    """컬럼별로 _promote_type을 적용한 스키마 (바뀌는 컬럼이 없으면 schema 그대로)"""
+    import pyarrow as pa
+
+    fields = [field.with_type(_promote_type(field.type, other.field(field.name).type)) for field in schema]
+    if all(field.type.equals(original.type) for field, original in zip(fields, schema)):
+        return schema
+    # pandas 메타데이터는 첫 청크의 dtype을 기록하므로 타입이 바뀌면 버림
+    return pa.schema(fields)
+
+class _SchemaWidened(Exception):
+    """이미 쓴 청크의 스키마보다 넓은 타입이 필요한 청크를 만남 (넓힌 스키마로 처음부터 다시 씀)"""
+
+    def __init__(self, schema):
+        super().__init__()
+        self.schema = schema
+
+def _write_parquet_chunks(csv_path: str, tmp_path: str, delimiter: str, row_group_size: int, compression: str, schema=None):
+    """
+    CSV 청크를 schema(None이면 첫 청크의 타입)로 맞춰 Parquet에 씁니다.
+    이후 청크가 더 넓은 타입을 요구하면(결측만 있던 컬럼에 문자열, int 컬럼에 소수 등) _SchemaWidened를 냅니다.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    rows = 0
+    row_groups = 0
+    try:
+        for chunk in pd.read_csv(csv_path, delimiter=delimiter, chunksize=row_group_size):
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            target = table.schema if schema is None else _promote_schema(schema, table.schema)
+            if writer is None:
+                schema = target
+                writer = pq.ParquetWriter(tmp_path, schema, compression=compression)
+            elif target is not schema:
+                raise _SchemaWidened(target)
+            if not table.schema.equals(schema):
+                # 좁은 타입(결측만 있는 컬럼, int → float 등)은 항상 손실 없이 넓은 타입으로 캐스팅됨
+                table = table.cast(schema)
+            writer.write_table(table, row_group_size=row_group_size)
+            rows += table.num_rows
+            row_groups += 1
+        if writer is None:
+            # 헤더만 있는 파일
+            schema = pa.Table.from_pandas(pd.read_csv(csv_path, delimiter=delimiter, nrows=0), preserve_index=False).schema
+            pq.write_table(schema.empty_table(), tmp_path, compression=compression)
+    finally:
+        if writer is not None:
+            writer.close()
+    return schema, rows, row_groups
+
+def _convert_csv_to_parquet(csv_path: str, row_group_size: int = PARQUET_ROW_GROUP_SIZE, compression: str = "zstd") -> dict:
+    """
+    CSV를 청크 단위로 스트리밍하며 압축된 Parquet으로 변환하고 스키마와 행 수를 반환합니다.
+    청크마다 추론한 타입이 다르면 모두 담을 수 있는 타입으로 넓히고, 이미 쓴 청크보다 넓은 타입이 필요하면
+    넓힌 스키마로 파일을 처음부터 다시 씁니다 (넓힐 수 있는 횟수는 컬럼 수에 비례하므로 재작성은 드묾).
+    """
+    delimiter = '\t' if csv_path.endswith('.tsv') else ','
+    parquet_path = _parquet_path(csv_path)
+    tmp_path = parquet_path + ".tmp"
+    schema = None
+    rewrites = 0
+    try:
+        while True:
+            try:
+                schema, rows, row_groups = _write_parquet_chunks(
+                    csv_path, tmp_path, delimiter, row_group_size, compression, schema
+                )
+                break
+            except _SchemaWidened as e:
+                schema = e.schema
+                rewrites += 1
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, parquet_path)
+
+    return {
+        "parquet": parquet_path,
+        "rows": rows,
+        "row_groups": row_groups,
+        "schema_rewrites": rewrites,
+        "compression": compression,
+        "schema": {field.name: str(field.type) for field in schema},
+        "source_size": os.path.getsize(csv_path),
+        "parquet_size": os.path.getsize(parquet_path)
+    }
+
+async def _ingest_to_parquet(output_path: str, csv_paths: List[str], row_group_size: int = PARQUET_ROW_GROUP_SIZE) -> dict:
+    """CSV 파일들을 프로세스 풀에서 Parquet으로 변환하고 데이터셋 루트의 매니페스트를 갱신합니다"""
+    manifest_path = os.path.join(output_path, PARQUET_MANIFEST_NAME)
+    manifest = {"files": {}}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor() as executor:
+        futures = [
+            loop.run_in_executor(executor, _convert_csv_to_parquet, path, row_group_size)
+            for path in csv_paths
+        ]
+        results = await asyncio.gather(*futures, return_exceptions=True)
+
+    errors = {}
+    for path, result in zip(csv_paths, results):
+        name = os.path.relpath(path, output_path)
+        if isinstance(result, Exception):
+            # 변환에 실패한 파일은 매니페스트에서 빼고 원본 CSV를 그대로 사용
+            errors[name] = str(result)
+            manifest["files"].pop(name, None)
+            continue
+        result["parquet"] = os.path.relpath(result["parquet"], output_path)
+        manifest["files"][name] = result
+
+    manifest["updated_at"] = datetime.now().isoformat()
+    _write_json_atomic(manifest_path, manifest)
+    return {"manifest": manifest_path, "files": manifest["files"], "errors": errors}
+
+def _find_csv_files(output_path: str) -> List[str]:
+    """output_path 아래의 모든 CSV/TSV 파일 경로"""
+    return [
+        os.path.join(root, file)
+        for root, dirs, files in os.walk(output_path)
+        for file in sorted(files)
+        if file.endswith(('.csv', '.tsv'))
+    ]
+
+# 지연 페이지 순회 시 기본 최대 페이지 수 (필터가 까다로워도 무한히 요청하지 않도록 제한)
+MAX_PAGES = 10
+
+def _iter_pages(fetch_page, first_cursor=1, max_pages: int = MAX_PAGES):
+    """
+    페이지 단위 API 결과를 항목 단위로 지연 순회합니다.
+    fetch_page(cursor)는 (항목 리스트, 다음 cursor 또는 None)을 반환해야 하며,
+    현재 페이지를 소비하는 동안 다음 페이지를 백그라운드 스레드에서 미리 요청합니다.
+    """
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        future = executor.submit(fetch_page, first_cursor)
+        for page in range(1, max_pages + 1):
+            items, next_cursor = future.result()
+            if next_cursor is not None and items and page < max_pages:
+                future = executor.submit(fetch_page, next_cursor)
+            else:
+                future = None
+            yield from items
+            if future is None:
+                return
+    finally:
+        # 조기 종료 시 미리 요청한 페이지는 기다리지 않음
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def _tag_names(dataset) -> List[str]:
+    """데이터셋 태그 객체/문자열을 태그 이름 리스트로 변환합니다"""
+    return [
+        str(_get_attr(tag, 'name', 'ref', default=tag))
+        for tag in (_get_attr(dataset, 'tags') or [])
+    ]
+
+def _dataset_summary(dataset) -> dict:
+    """데이터셋 객체를 목록 조회 결과용 dict로 변환합니다 (kaggle 버전별 속성 이름 모두 지원)"""
+    dataset_info = {
+        "ref": dataset.ref,  # owner/dataset-name 형식
+        "title": dataset.title,
+    }
+    # 안전하게 속성 추가
+    optional_fields = {
+        "size": ('total_bytes', 'totalBytes', 'size'),
+        "last_updated": ('last_updated', 'lastUpdated'),
+        "download_count": ('download_count', 'downloadCount'),
+        "vote_count": ('vote_count', 'voteCount'),
+        "usability_rating": ('usability_rating', 'usabilityRating'),
+    }
+    for key, names in optional_fields.items():
+        value = _get_attr(dataset, *names)
+        if value is not None:
+            dataset_info[key] = str(value) if key == "last_updated" else value
+    if _get_attr(dataset, 'tags') is not None:
+        dataset_info["tags"] = _tag_names(dataset)
+    return dataset_info
+
+# 이전 kaggle 버전의 size 문자열("12MB", "1.5 GB" 등) 단위
+SIZE_UNITS = {"B": 1, "KB": 1024, "MB": 1024 ** 2, "GB": 1024 ** 3, "TB": 1024 ** 4}
+
+def _parse_size(size) -> Optional[float]:
+    """데이터셋 크기를 바이트로 변환합니다 (숫자 또는 "12MB" 같은 문자열, 알 수 없으면 None)"""
+    if isinstance(size, (int, float)):
+        return size
+    match = re.fullmatch(r"\s*([\d.]+)\s*([KMGT]?B)?\s*", str(size or ""), re.IGNORECASE)
+    if match is None:
+        return None
+    try:
+        return float(match.group(1)) * SIZE_UNITS[(match.group(2) or "B").upper()]
+    except ValueError:
+        return None
+
+def _dataset_matches(dataset_info: dict, min_size=None, max_size=None, min_usability=None, tags=None) -> bool:
+    """
+    클라이언트 측 필터(크기, 사용성 점수, 태그)를 적용합니다.
+    크기를 알 수 없는 데이터셋은 크기 필터를 건너뛰고, 사용성 점수나 태그가 없는 항목은 제외합니다
+    """
+    size = _parse_size(dataset_info.get("size"))
+    if size is not None:
+        if min_size is not None and size < min_size:
+            return False
+        if max_size is not None and size > max_size:
+            return False
+    if min_usability is not None and (dataset_info.get("usability_rating") or 0) < min_usability:
+        return False
+    if tags:
+        wanted = {tag.lower() for tag in tags}
+        if not wanted & {tag.lower() for tag in dataset_info.get("tags", [])}:
+            return False
+    return True
+
 @mcp.tool('authenticate', "Kaggle API 인증")
 async def authenticate(
     kaggle_username: str,
@@ -41,46 +379,42 @@ async def authenticate(
 async def list_datasets(
     search_query: str = "",
     max_results: int = 10,
-    sort_by: str = "relevance"
+    sort_by: str = "relevance",
+    min_size: int = None,
+    max_size: int = None,
+    min_usability: float = None,
+    tags: List[str] = None,
+    max_pages: int = MAX_PAGES
 ) -> dict:
-    """검색 쿼리에 맞는 Kaggle 데이터셋 목록을 조회합니다"""
+    """
+    검색 쿼리에 맞는 Kaggle 데이터셋 목록을 조회합니다.
+    결과 페이지를 필요할 때만 이어서 요청하며(다음 페이지는 미리 요청), 크기(바이트)/사용성 점수/태그
+    필터를 통과한 데이터셋이 max_results개 모이면 즉시 중단합니다.
+    """
     try:
         api = KaggleApi()
         api.authenticate()
-        
-        # 데이터셋 검색
-        datasets = api.dataset_list(search=search_query, sort_by=sort_by)
-        
-        result = []
-        count = 0
-        for dataset in datasets:
-            if count >= max_results:
-                break
-            dataset_info = {
-                "ref": dataset.ref,  # owner/dataset-name 형식
-                "title": dataset.title,
-            }
-            
-            # 안전하게 속성 추가
-            if hasattr(dataset, 'size'):
-                dataset_info["size"] = dataset.size
-            if hasattr(dataset, 'lastUpdated'):
-                dataset_info["last_updated"] = str(dataset.lastUpdated)
-            if hasattr(dataset, 'downloadCount'):
-                dataset_info["download_count"] = dataset.downloadCount
-            if hasattr(dataset, 'voteCount'):
-                dataset_info["vote_count"] = dataset.voteCount
-            if hasattr(dataset, 'tags'):
-                dataset_info["tags"] = dataset.tags
-            if hasattr(dataset, 'usabilityRating'):
-                dataset_info["usability_rating"] = dataset.usabilityRating
-            
-            result.append(dataset_info)
-            count += 1
+
+        def fetch_page(page):
+            datasets = api.dataset_list(search=search_query, sort_by=sort_by, page=page) or []
+            return datasets, page + 1
+
+        # 데이터셋 검색 (페이지 스트림 위에서 필터 적용 후 조기 종료)
+        scanned = 0
+        def matching(datasets):
+            nonlocal scanned
+            for dataset in datasets:
+                scanned += 1
+                dataset_info = _dataset_summary(dataset)
+                if _dataset_matches(dataset_info, min_size, max_size, min_usability, tags):
+                    yield dataset_info
+
+        result = list(islice(matching(_iter_pages(fetch_page, 1, max_pages)), max_results))
         
         return {
             "success": True,
             "count": len(result),
+            "scanned": scanned,
             "datasets": result
         }
     except Exception as e:
@@ -88,6 +422,7 @@ async def list_datasets(
             "success": False,
             "message": f"데이터셋 목록 조회 실패: {str(e)}"
         }
+
 @mcp.tool('dataset_info', "Kaggle 데이터셋 상세 정보 조회")
 async def dataset_info(
     dataset_ref: str  # owner/dataset-name 형식
@@ -97,16 +432,8 @@ async def dataset_info(
         api = KaggleApi()
         api.authenticate()
         
-        # 데이터셋 상세 정보 조회 (dataset_view 대신 dataset_list_files를 사용하여 정보 얻기)
-        owner, dataset_name = dataset_ref.split('/')
-        datasets = api.dataset_list(search=dataset_name, owner=owner)
-        
-        # 일치하는 데이터셋 찾기
-        dataset = None
-        for ds in datasets:
-            if ds.ref == dataset_ref:
-                dataset = ds
-                break
+        # 데이터셋 상세 정보 조회 (dataset_view 대신 dataset_list를 검색하여 정보 얻기)
+        dataset = _find_dataset(api, dataset_ref)
                 
         if not dataset:
             return {
@@ -155,9 +482,11 @@ async def dataset_info(
 async def download_dataset(
     dataset_ref: str,  # owner/dataset-name 형식
     output_path: str = None,
-    unzip: bool = True
+    unzip: bool = True,
+    to_parquet: bool = False,
+    row_group_size: int = PARQUET_ROW_GROUP_SIZE
 ) -> dict:
-    """Kaggle 데이터셋을 다운로드합니다"""
+    """Kaggle 데이터셋을 다운로드합니다 (to_parquet=True면 압축 해제된 CSV를 Parquet으로 변환)"""
     try:
         api = KaggleApi()
         api.authenticate()
@@ -168,6 +497,11 @@ async def download_dataset(
         
         # 데이터셋 다운로드
         api.dataset_download_files(dataset_ref, path=output_path, unzip=unzip)
+
+        # 선택적 수집 단계: 이후 분석 도구가 원본 텍스트 대신 읽을 Parquet 사본 생성
+        parquet = None
+        if to_parquet and unzip:
+            parquet = await _ingest_to_parquet(output_path, _find_csv_files(output_path), row_group_size)
         
         # 다운로드된 파일 목록
         file_list = []
@@ -185,7 +519,8 @@ async def download_dataset(
             "success": True,
             "message": f"데이터셋 '{dataset_ref}'가 성공적으로 다운로드되었습니다.",
             "output_path": output_path,
-            "files": file_list
+            "files": file_list,
+            "parquet": parquet
         }
     except Exception as e:
         return {
@@ -193,6 +528,87 @@ async def download_dataset(
             "message": f"데이터셋 다운로드 실패: {str(e)}"
         }
 
+@mcp.tool('sync_dataset', "Kaggle 데이터셋 증분 동기화 (변경된 파일만 다운로드)")
+async def sync_dataset(
+    dataset_ref: str,  # owner/dataset-name 형식
+    output_path: str,
+    prune: bool = False,
+    to_parquet: bool = False
+) -> dict:
+    """원격 파일 목록(이름, 크기, 타임스탬프)을 로컬 사본과 비교하여 새로 생겼거나 변경된 파일만 다운로드합니다"""
+    try:
+        api = KaggleApi()
+        api.authenticate()
+
+        os.makedirs(output_path, exist_ok=True)
+        manifest = _load_sync_manifest(output_path, dataset_ref)
+        remote_files = _list_remote_files(api, dataset_ref)
+
+        downloaded, unchanged = [], []
+        bytes_transferred = 0
+        for name, remote in remote_files.items():
+            local_path = os.path.join(output_path, name)
+            local = manifest["files"].get(name)
+            if os.path.exists(local_path):
+                if local is not None and local == remote:
+                    unchanged.append(name)
+                    continue
+                # 매니페스트가 없는 기존 사본(download_dataset 결과 등)은 크기가 같으면 그대로 채택
+                if local is None and remote["size"] == os.path.getsize(local_path):
+                    manifest["files"][name] = remote
+                    unchanged.append(name)
+                    continue
+
+            bytes_transferred += _download_remote_file(api, dataset_ref, name, output_path)
+            manifest["files"][name] = remote
+            downloaded.append(name)
+            # 파일 단위로 매니페스트를 갱신하여 중단되더라도 받은 파일은 다시 받지 않음
+            _save_sync_manifest(output_path, manifest)
+
+        # 원격에서 삭제된 파일 처리 (매니페스트로 추적 중인 파일만 대상, prune=False면 기록만 유지)
+        removed = [name for name in manifest["files"] if name not in remote_files]
+        if prune:
+            for name in removed:
+                del manifest["files"][name]
+                local_path = os.path.join(output_path, name)
+                if os.path.exists(local_path):
+                    os.remove(local_path)
+
+        # 변경된 CSV만 다시 Parquet으로 변환 (나머지 사본은 최신 상태 유지)
+        parquet = None
+        if to_parquet:
+            changed_csv = [
+                path for path in _find_csv_files(output_path)
+                if _prefer_parquet(path) == path
+            ]
+            parquet = await _ingest_to_parquet(output_path, changed_csv)
+
+        dataset = _find_dataset(api, dataset_ref)
+        version = _get_attr(dataset, 'current_version_number', 'currentVersionNumber') if dataset else None
+        previous_version = manifest.get("version")
+        manifest["version"] = version
+        manifest["synced_at"] = datetime.now().isoformat()
+        _save_sync_manifest(output_path, manifest)
+
+        return {
+            "success": True,
+            "message": f"데이터셋 '{dataset_ref}' 동기화 완료: {len(downloaded)}개 다운로드, {len(unchanged)}개 유지",
+            "output_path": output_path,
+            "version": version,
+            "previous_version": previous_version,
+            "downloaded": downloaded,
+            "unchanged": unchanged,
+            "removed": removed if prune else [],
+            "stale": [] if prune else removed,
+            "bytes_transferred": bytes_transferred,
+            "parquet": parquet
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "message": f"데이터셋 동기화 실패: {str(e)}"
+        }
+
 @mcp.tool('preview_dataset', "Kaggle 데이터셋 미리보기")
 async def preview_dataset(
     dataset_ref: str,  # owner/dataset-name 형식
@@ -263,15 +679,24 @@ async def preview_dataset(
 async def list_competitions(
     search_query: str = "",
     category: str = "all",
-    max_results: int = 10
+    max_results: int = 10,
+    max_pages: int = MAX_PAGES
 ) -> dict:
-    """Kaggle 대회 목록을 조회합니다"""
+    """Kaggle 대회 목록을 조회합니다 (max_results개가 모일 때까지 페이지를 지연 순회)"""
     try:
         api = KaggleApi()
         api.authenticate()
+
+        def fetch_page(page_token):
+            response = api.competitions_list(
+                search=search_query, category=category,
+                page_size=min(max_results, 100), page_token=page_token or None
+            )
+            competitions = _get_attr(response, 'competitions', default=response) or []
+            return list(competitions), _get_attr(response, 'next_page_token', 'nextPageToken') or None
         
         # 대회 검색
-        competitions = api.competitions_list(search=search_query, category=category, page_size=max_results)
+        competitions = islice(_iter_pages(fetch_page, "", max_pages), max_results)
         
         result = []
         for competition in competitions:
@@ -282,7 +707,7 @@ async def list_competitions(
                 "deadline": str(competition.deadline),
                 "category": competition.category,
                 "reward": competition.reward,
-                "team_count": competition.teamCount
+                "team_count": _get_attr(competition, 'team_count', 'teamCount')
             })
         
         return {
@@ -296,47 +721,178 @@ async def list_competitions(
             "message": f"대회 목록 조회 실패: {str(e)}"
         }
 
-@mcp.tool('analyze_dataset', "다운로드된 CSV 데이터셋 분석")
+# 디렉토리 분석 시 프로파일링 대상이 되는 표 형식 파일 확장자
+TABULAR_EXTENSIONS = ('.csv', '.tsv', '.xls', '.xlsx', '.parquet')
+
+def _read_table(file_path: str, delimiter: str = ",", nrows: Optional[int] = None) -> pd.DataFrame:
+    """확장자에 맞는 pandas 리더로 표 형식 파일을 읽습니다 (최신 Parquet 사본이 있으면 우선 사용)"""
+    file_path = _prefer_parquet(file_path)
+    if file_path.endswith('.parquet'):
+        if nrows is None:
+            return pd.read_parquet(file_path)
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        parquet_file = pq.ParquetFile(file_path)
+        if nrows == 0:
+            return pd.DataFrame(columns=parquet_file.schema_arrow.names)
+        # 앞쪽 행 그룹에서 nrows행만 읽음 (파일 전체를 읽지 않음)
+        batches, remaining = [], nrows
+        for batch in parquet_file.iter_batches(batch_size=nrows):
+            batches.append(batch.slice(0, remaining))
+            remaining -= len(batches[-1])
+            if remaining == 0:
+                break
+        return pa.Table.from_batches(batches, schema=parquet_file.schema_arrow).to_pandas()
+    if file_path.endswith(('.xls', '.xlsx')):
+        return pd.read_excel(file_path, nrows=nrows)
+    if file_path.endswith('.tsv'):
+        delimiter = '\t'
+    return pd.read_csv(file_path, delimiter=delimiter, nrows=nrows)
+
+def _hash_key_set(series: pd.Series) -> np.ndarray:
+    """컬럼의 고유값을 64비트 해시 배열로 변환합니다 (파일 간 키 겹침 비교용)"""
+    values = series.dropna().drop_duplicates()
+    # 결측값 때문에 float로 읽힌 정수 키도 다른 파일의 int 키와 같은 해시가 되도록 정규화
+    if pd.api.types.is_float_dtype(values) and (values % 1 == 0).all():
+        values = values.astype('int64')
+    return np.unique(pd.util.hash_pandas_object(values, index=False).to_numpy())
+
+def _profile_table(file_path: str, delimiter: str = ",", sample_size: int = 5, key_columns=()) -> tuple:
+    """파일 하나를 프로파일링하고 (분석 결과, {키 컬럼: 해시 배열})을 반환합니다 (프로세스 풀 작업 단위)"""
+    df = _read_table(file_path, delimiter)
+
+    # 기본 통계
+    stats = df.describe(include='all').to_dict()
+
+    # 결측값 정보
+    missing_values = df.isnull().sum().to_dict()
+    missing_percent = (df.isnull().mean() * 100).to_dict()
+
+    # 데이터 타입 정보
+    dtypes = df.dtypes.astype(str).to_dict()
+
+    # 상관관계 (수치형 변수만)
+    try:
+        corr = df.corr(numeric_only=True).to_dict()
+    except:
+        corr = {"message": "상관관계를 계산할 수 없습니다."}
+
+    profile = {
+        "file_info": {
+            "path": file_path,
+            "read_from": _prefer_parquet(file_path),
+            "columns": df.columns.tolist(),
+            "shape": df.shape,
+            "sample": df.head(sample_size).to_dict(),
+            "dtypes": dtypes
+        },
+        "statistics": stats,
+        "missing_values": missing_values,
+        "missing_percent": missing_percent,
+        "correlation": corr
+    }
+    key_hashes = {col: _hash_key_set(df[col]) for col in key_columns if col in df.columns}
+    return profile, key_hashes
+
+def _key_overlap_hints(key_hashes: Dict[str, Dict[str, np.ndarray]]) -> List[dict]:
+    """같은 이름의 컬럼을 가진 파일 쌍마다 해시 키 집합의 겹침 정도를 계산합니다"""
+    hints = []
+    names = sorted(key_hashes)
+    for i, left in enumerate(names):
+        for right in names[i + 1:]:
+            for col in sorted(set(key_hashes[left]) & set(key_hashes[right])):
+                left_keys, right_keys = key_hashes[left][col], key_hashes[right][col]
+                shared = np.intersect1d(left_keys, right_keys, assume_unique=True).size
+                union = left_keys.size + right_keys.size - shared
+                smaller = min(left_keys.size, right_keys.size)
+                containment = shared / smaller if smaller else 0.0
+                hints.append({
+                    "column": col,
+                    "left": left,
+                    "right": right,
+                    "left_unique": int(left_keys.size),
+                    "right_unique": int(right_keys.size),
+                    "shared_unique": int(shared),
+                    "jaccard": shared / union if union else 0.0,
+                    "containment": containment,
+                    # 작은 쪽 키가 거의 모두 큰 쪽에 포함되면 조인 키일 가능성이 높음
+                    "likely_join_key": containment >= 0.9
+                })
+    return sorted(hints, key=lambda h: h["containment"], reverse=True)
+
+def _read_headers(table_paths: Dict[str, str], delimiter: str) -> Tuple[Dict[str, List[str]], Dict[str, str]]:
+    """파일마다 헤더만 읽습니다. 비어 있거나 읽을 수 없는 파일은 오류로 기록하고 건너뜁니다"""
+    headers, errors = {}, {}
+    for name, path in table_paths.items():
+        try:
+            headers[name] = _read_table(path, delimiter, nrows=0).columns.tolist()
+        except Exception as e:
+            errors[name] = str(e)
+    return headers, errors
+
+async def _analyze_directory(directory: str, delimiter: str, sample_size: int, max_workers: Optional[int]) -> dict:
+    """디렉토리 안의 모든 표 형식 파일을 프로세스 풀에서 병렬로 프로파일링하고 결과를 합칩니다"""
+    table_paths = {}
+    for root, dirs, files in os.walk(directory):
+        for file in sorted(files):
+            if file.endswith(TABULAR_EXTENSIONS):
+                file_path = os.path.join(root, file)
+                # CSV의 Parquet 사본은 CSV 항목에서 대신 읽으므로 중복 집계하지 않음
+                stem = os.path.splitext(file_path)[0]
+                if file.endswith('.parquet') and (os.path.exists(stem + '.csv') or os.path.exists(stem + '.tsv')):
+                    continue
+                table_paths[os.path.relpath(file_path, directory)] = file_path
+
+    # 헤더만 먼저 읽어 두 개 이상의 파일에 등장하는 컬럼을 키 후보로 선정 (이벤트 루프를 막지 않도록 스레드에서)
+    loop = asyncio.get_running_loop()
+    headers, errors = await loop.run_in_executor(None, _read_headers, table_paths, delimiter)
+    table_paths = {name: path for name, path in table_paths.items() if name in headers}
+    column_counts = pd.Series([col for cols in headers.values() for col in cols], dtype=object).value_counts()
+    shared_columns = set(column_counts[column_counts > 1].index)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            loop.run_in_executor(
+                executor, _profile_table, path, delimiter, sample_size,
+                [col for col in headers[name] if col in shared_columns]
+            )
+            for name, path in table_paths.items()
+        ]
+        results = await asyncio.gather(*futures, return_exceptions=True)
+
+    profiles, key_hashes = {}, {}
+    for name, result in zip(table_paths, results):
+        if isinstance(result, Exception):
+            errors[name] = str(result)
+            continue
+        profiles[name], key_hashes[name] = result
+
+    return {
+        "success": True,
+        "directory": directory,
+        "file_count": len(profiles),
+        "total_rows": sum(profile["file_info"]["shape"][0] for profile in profiles.values()),
+        "files": profiles,
+        "key_overlap": _key_overlap_hints(key_hashes),
+        "errors": errors
+    }
+
+@mcp.tool('analyze_dataset', "다운로드된 CSV 데이터셋 분석 (파일 또는 데이터셋 디렉토리)")
 async def analyze_dataset(
     file_path: str,
     delimiter: str = ",",
-    sample_size: int = 5
+    sample_size: int = 5,
+    max_workers: int = None
 ) -> dict:
-    """다운로드된 CSV 파일을 분석합니다"""
+    """다운로드된 CSV 파일을 분석합니다. 디렉토리를 지정하면 모든 표 형식 파일을 병렬로 분석하고 파일 간 키 겹침을 함께 보고합니다"""
     try:
-        # CSV 파일 로드
-        df = pd.read_csv(file_path, delimiter=delimiter)
-        
-        # 기본 통계
-        stats = df.describe(include='all').to_dict()
-        
-        # 결측값 정보
-        missing_values = df.isnull().sum().to_dict()
-        missing_percent = (df.isnull().mean() * 100).to_dict()
-        
-        # 데이터 타입 정보
-        dtypes = df.dtypes.astype(str).to_dict()
-        
-        # 상관관계 (수치형 변수만)
-        try:
-            corr = df.corr(numeric_only=True).to_dict()
-        except:
-            corr = {"message": "상관관계를 계산할 수 없습니다."}
-        
-        return {
-            "success": True,
-            "file_info": {
-                "path": file_path,
-                "columns": df.columns.tolist(),
-                "shape": df.shape,
-                "sample": df.head(sample_size).to_dict(),
-                "dtypes": dtypes
-            },
-            "statistics": stats,
-            "missing_values": missing_values,
-            "missing_percent": missing_percent,
-            "correlation": corr
-        }
+        if os.path.isdir(file_path):
+            return await _analyze_directory(file_path, delimiter, sample_size, max_workers)
+
+        # 큰 파일을 읽는 동안 이벤트 루프를 막지 않도록 스레드에서 실행
+        loop = asyncio.get_running_loop()
+        profile, _ = await loop.run_in_executor(None, _profile_table, file_path, delimiter, sample_size)
+        return {"success": True, **profile}
     except Exception as e:
         return {
             "success": False,
@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+"""
+대용량 CSV를 위한 out-of-core 학습 모드
+
+메모리에 다 올라가지 않는 CSV를 청크 단위로 여러 번 읽으며 분석합니다.
+- 학습/검증/테스트 분할: 행 ID(없으면 행 번호)의 해시로 결정 (청크 크기, 실행 순서와 무관하게 항상 같은 분할)
+- 셔플: 전처리 단계에서 행을 해시 키에 따라 float32 바이너리 샤드로 나눠 씀. 학습 샤드 하나는 전체 학습 행의
+  균등 표본이므로 파일이 클래스 순으로 정렬되어 있어도 샤드 단위 학습이 치우치지 않고,
+  이후 epoch/평가는 CSV를 다시 파싱하지 않고 샤드를 읽음
+- 스케일링: StandardScaler.partial_fit으로 학습 행만 청크별로 누적
+- 모델: partial_fit을 지원하는 점진 학습 모델 (SGDClassifier, GaussianNB, 미니배치 MLPClassifier)
+- CV 점수 대신 progressive validation(각 학습 청크를 학습하기 직전에 평가)한 청크별 정확도의 평균/표준편차 사용
+결과 형식(self.results, self.test_results, 저장 파일, 시각화)은 IrisAnalysis와 같습니다.
+
+실행 예:
+    python out_of_core.py --data-path datasets/large.csv --chunksize 200000 --epochs 3
+"""
+
+import argparse
+import os
+import shutil
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.linear_model import SGDClassifier
+from sklearn.metrics import accuracy_score, classification_report
+from sklearn.model_selection import ParameterGrid
+from sklearn.naive_bayes import GaussianNB
+from sklearn.neural_network import MLPClassifier
+
+from analysis import IrisAnalysis
+from artifacts import ARTIFACT_FORMATS
+from figure_export import FIGURE_FORMATS
+from run_log import RUN_LOG_FORMATS
+
+# 해시 버킷 경계: [0, 0.6) 학습, [0.6, 0.8) 검증, [0.8, 1) 테스트 (IrisAnalysis와 같은 60/20/20 비율)
+SPLIT_BOUNDARIES = (0.6, 0.8)
+TRAIN, VAL, TEST = 0, 1, 2
+# 기본 시각화용으로 메모리에 남길 표본 행 수 상한
+SAMPLE_ROWS = 10_000
+
+
+def row_keys(ids) -> np.ndarray:
+    """행 ID를 [0, 1) 구간의 결정적 난수로 해시합니다"""
+    return pd.util.hash_pandas_object(pd.Series(ids), index=False).to_numpy() / 2.0 ** 64
+
+
+def hash_split(keys) -> np.ndarray:
+    """row_keys 값으로 0(학습)/1(검증)/2(테스트) 분할 번호를 결정합니다"""
+    return np.searchsorted(SPLIT_BOUNDARIES, keys, side='right').astype(np.int8)
+
+
+class OutOfCoreAnalysis(IrisAnalysis):
+    """
+    청크 단위 out-of-core 분석 클래스
+
+    IrisAnalysis의 파이프라인/체크포인트/저장/시각화를 그대로 사용하고,
+    데이터 로드부터 평가까지의 단계만 청크 스트리밍 방식으로 바꿉니다.
+    """
+
+    LOADED_ATTRIBUTES = ['df', 'n_rows', 'feature_names', 'classes', 'column_stats']
+    PREPARED_ATTRIBUTES = ['scaler', 'label_encoder', 'split_counts', 'n_shards']
+    EVALUATED_ATTRIBUTES = ['test_results', 'best_model_name', 'y_test']
+
+    def __init__(self, data_path='datasets/Iris.csv', chunksize=100_000, epochs=3,
+                 id_column='Id', target_column='Species', shard_dir='cache/shards', **kwargs):
+        """
+        Args:
+            data_path: 데이터셋 CSV 경로
+            chunksize: 한 번에 읽을 행 수
+            epochs: 학습 데이터를 반복해서 읽는 횟수
+            id_column: 분할 해시에 사용할 ID 컬럼 (없으면 파일 내 행 번호 사용)
+            target_column: 타겟 컬럼
+            shard_dir: 분할별 바이너리 샤드를 쓸 디렉토리
+            **kwargs: IrisAnalysis 옵션 (checkpoint_dir 등)
+        """
+        super().__init__(data_path=data_path, **kwargs)
+        self.chunksize = chunksize
+        self.epochs = epochs
+        self.id_column = id_column
+        self.target_column = target_column
+        self.shard_dir = shard_dir
+        self.n_shards = 0
+        self.n_rows = 0
+        self.classes = None
+        self.column_stats = None
+        self.split_counts = None
+
+    def _iter_chunks(self):
+        """(특성 DataFrame, 타겟 Series, 행 해시 키 배열) 청크를 차례로 반환합니다"""
+        offset = 0
+        for chunk in pd.read_csv(self.data_path, chunksize=self.chunksize):
+            if self.id_column in chunk.columns:
+                ids = chunk[self.id_column].to_numpy()
+            else:
+                ids = np.arange(offset, offset + len(chunk))
+            offset += len(chunk)
+            X = chunk.drop(columns=[c for c in (self.id_column, self.target_column) if c in chunk.columns])
+            yield X, chunk[self.target_column], row_keys(ids)
+
+    def _shard_paths(self, name):
+        return os.path.join(self.shard_dir, f"{name}_X.f32"), os.path.join(self.shard_dir, f"{name}_y.i32")
+
+    def _read_shard(self, name, mmap=False):
+        """샤드의 (특성, 레이블) 배열 (mmap이면 메모리에 올리지 않고 매핑)"""
+        X_path, y_path = self._shard_paths(name)
+        if mmap:
+            y = np.memmap(y_path, dtype=np.int32, mode='r') if os.path.getsize(y_path) else np.zeros(0, np.int32)
+            X = np.memmap(X_path, dtype=np.float32, mode='r', shape=(len(y), len(self.feature_names))) \
+                if len(y) else np.zeros((0, len(self.feature_names)), np.float32)
+            return X, y
+        y = np.fromfile(y_path, dtype=np.int32)
+        return np.fromfile(X_path, dtype=np.float32).reshape(len(y), len(self.feature_names)), y
+
+    def _iter_split(self, split, rng=None):
+        """
+        지정한 분할의 (스케일링 전 특성, 스케일링된 특성, 인코딩된 타겟) 청크를 반환합니다.
+        학습 분할은 샤드 하나씩 읽어 (rng가 있으면 샤드 안에서 섞어) 반환하고,
+        검증/테스트 분할은 샤드를 mmap으로 열어 chunksize 행씩 반환합니다.
+        """
+        if split == TRAIN:
+            for shard in range(self.n_shards):
+                X, y = self._read_shard(f"train_{shard:04d}")
+                if rng is not None:
+                    order = rng.permutation(len(y))
+                    X, y = X[order], y[order]
+                if len(y):
+                    yield X, self.scaler.transform(X), y
+            return
+        X_all, y_all = self._read_shard('val' if split == VAL else 'test', mmap=True)
+        for start in range(0, len(y_all), self.chunksize):
+            X = np.asarray(X_all[start:start + self.chunksize])
+            yield X, self.scaler.transform(X), np.asarray(y_all[start:start + self.chunksize])
+
+    def load_and_explore_data(self, visualize=True):
+        """
+        청크 스트리밍으로 행 수, 클래스 분포, 특성별 통계, 결측값을 집계합니다.
+        기본 시각화용으로 행 해시 키가 가장 작은 SAMPLE_ROWS행(결정적 균등 표본)만 self.df에 남깁니다.
+        """
+        print("=" * 50)
+        print("1. 데이터 로드 및 탐색 (out-of-core)")
+        print("=" * 50)
+
+        start = time.perf_counter()
+        n_rows = 0
+        class_counts = pd.Series(dtype=np.int64)
+        missing = None
+        sums = sq_sums = mins = maxs = None
+        sample = None
+        for X, y, keys in self._iter_chunks():
+            n_rows += len(X)
+            class_counts = class_counts.add(y.value_counts(), fill_value=0)
+            chunk_missing = X.isnull().sum()
+            missing = chunk_missing if missing is None else missing + chunk_missing
+            sums = X.sum() if sums is None else sums + X.sum()
+            sq_sums = (X ** 2).sum() if sq_sums is None else sq_sums + (X ** 2).sum()
+            mins = X.min() if mins is None else np.minimum(mins, X.min())
+            maxs = X.max() if maxs is None else np.maximum(maxs, X.max())
+            # 해시 키가 작은 행만 유지하여 표본 크기를 SAMPLE_ROWS로 고정
+            chunk_sample = pd.concat([X, y], axis=1).assign(_key=keys)
+            sample = chunk_sample if sample is None else pd.concat([sample, chunk_sample], ignore_index=True)
+            sample = sample.nsmallest(SAMPLE_ROWS, '_key')
+
+        count = n_rows - missing
+        mean = sums / count
+        self.n_rows = n_rows
+        self.feature_names = list(sums.index)
+        self.classes = sorted(class_counts.index)
+        self.column_stats = pd.DataFrame({
+            'mean': mean,
+            'std': np.sqrt(np.maximum(sq_sums / count - mean ** 2, 0)),
+            'min': mins,
+            'max': maxs,
+            'missing': missing
+        })
+        self.df = sample.drop(columns='_key').reset_index(drop=True)
+
+        print(f"전체 행 수: {n_rows:,} (청크 크기 {self.chunksize:,}, {time.perf_counter() - start:.1f}초)")
+        print(f"\n기본 통계:")
+        print(self.column_stats)
+        print(f"\n클래스 분포:")
+        print(class_counts.astype(np.int64))
+
+        if visualize:
+            self.create_basic_visualizations()
+
+    def prepare_data(self):
+        """
+        CSV를 한 번 읽으며 행을 해시 분할별 float32 바이너리 샤드로 나눠 쓰고,
+        학습 행만으로 레이블 인코더와 스케일러(partial_fit)를 학습합니다.
+        학습 샤드 수는 샤드 하나가 chunksize 행 정도가 되도록 정합니다.
+        """
+        print("\n" + "=" * 50)
+        print("2. 데이터 전처리 및 분할 (out-of-core)")
+        print("=" * 50)
+
+        start = time.perf_counter()
+        self.label_encoder.fit(self.classes)
+        self.n_shards = max(1, int(np.ceil(self.n_rows * SPLIT_BOUNDARIES[0] / self.chunksize)))
+        shutil.rmtree(self.shard_dir, ignore_errors=True)
+        os.makedirs(self.shard_dir)
+        names = [f"train_{shard:04d}" for shard in range(self.n_shards)] + ['val', 'test']
+        files = {name: [open(path, 'wb') for path in self._shard_paths(name)] for name in names}
+
+        counts = np.zeros(3, dtype=np.int64)
+        try:
+            for X, y, keys in self._iter_chunks():
+                X = X.to_numpy(dtype=np.float64)
+                y = self.label_encoder.transform(y).astype(np.int32)
+                splits = hash_split(keys)
+                counts += np.bincount(splits, minlength=3)
+                train = splits == TRAIN
+                if train.any():
+                    self.scaler.partial_fit(X[train])
+                # 학습 행은 [0, 0.6) 구간의 해시 키로 샤드 번호를 정해 샤드마다 균등 표본이 되도록 함
+                shard_ids = np.where(
+                    train,
+                    np.minimum((keys / SPLIT_BOUNDARIES[0] * self.n_shards).astype(np.int64), self.n_shards - 1),
+                    -1
+                )
+                targets = [(f"train_{shard:04d}", shard_ids == shard) for shard in np.unique(shard_ids[train])]
+                targets += [('val', splits == VAL), ('test', splits == TEST)]
+                for name, mask in targets:
+                    if mask.any():
+                        X_file, y_file = files[name]
+                        X_file.write(X[mask].astype(np.float32).tobytes())
+                        y_file.write(y[mask].tobytes())
+        finally:
+            for handles in files.values():
+                for handle in handles:
+                    handle.close()
+        self.split_counts = {'train': int(counts[TRAIN]), 'val': int(counts[VAL]), 'test': int(counts[TEST])}
+
+        n_features = len(self.feature_names)
+        print(f"훈련 세트: ({counts[TRAIN]}, {n_features})")
+        print(f"검증 세트: ({counts[VAL]}, {n_features})")
+        print(f"테스트 세트: ({counts[TEST]}, {n_features})")
+        print(f"학습 샤드: {self.n_shards}개 ({self.shard_dir}, {time.perf_counter() - start:.1f}초)")
+
+    def define_models(self):
+        """
+        partial_fit을 지원하는 점진 학습 모델과 작은 파라미터 그리드 정의
+        그리드의 모든 후보는 같은 청크 읽기에서 함께 학습됩니다.
+        """
+        print("\n" + "=" * 50)
+        print("3. 모델 정의 (점진 학습)")
+        print("=" * 50)
+
+        self.models = {
+            'SGDClassifier': {
+                'model': SGDClassifier(loss='log_loss', random_state=42),
+                'params': {
+                    'alpha': [1e-5, 1e-4, 1e-3],
+                    'penalty': ['l2', 'elasticnet']
+                },
+                'use_scaling': True
+            },
+            'GaussianNB': {
+                'model': GaussianNB(),
+                'params': {
+                    'var_smoothing': [1e-9, 1e-7, 1e-5]
+                },
+                'use_scaling': False
+            },
+            'MLPClassifier': {
+                'model': MLPClassifier(random_state=42),
+                'params': {
+                    'hidden_layer_sizes': [(32,), (64,)],
+                    'alpha': [1e-4, 1e-3]
+                },
+                'use_scaling': True
+            }
+        }
+
+        print("정의된 모델들:")
+        for name in self.models.keys():
+            print(f"- {name}")
+
+    def train_and_tune_models(self):
+        """
+        학습 행 청크로 모든 후보를 partial_fit하고, 검증 행 정확도로 모델별 최적 후보를 고릅니다
+        """
+        print("\n" + "=" * 50)
+        print("4. 점진 학습 및 하이퍼파라미터 선택 (out-of-core)")
+        print("=" * 50)
+
+        classes = np.arange(len(self.label_encoder.classes_))
+        candidates = {
+            name: [(params, clone(model_info['model']).set_params(**params))
+                   for params in ParameterGrid(model_info['params'])]
+            for name, model_info in self.models.items()
+        }
+        # 마지막 epoch의 progressive validation 청크 정확도 (후보별)
+        progressive = {name: [[] for _ in candidates[name]] for name in candidates}
+        rng = np.random.RandomState(42)
+
+        for epoch in range(self.epochs):
+            start = time.perf_counter()
+            last_epoch = epoch == self.epochs - 1
+            for X, X_scaled, y in self._iter_split(TRAIN, rng):
+                for name, model_info in self.models.items():
+                    data = X_scaled if model_info['use_scaling'] else X
+                    for i, (_, model) in enumerate(candidates[name]):
+                        if last_epoch and hasattr(model, 'classes_'):
+                            progressive[name][i].append(accuracy_score(y, model.predict(data)))
+                        model.partial_fit(data, y, classes=classes)
+                        # partial_fit 호출도 실행 기록의 fit 횟수로 셈
+                        self.fit_cache.fits += 1
+            print(f"epoch {epoch + 1}/{self.epochs} 완료 ({time.perf_counter() - start:.1f}초)")
+
+        # 검증 행 한 번 읽기로 모든 후보 평가
+        correct = {name: np.zeros(len(candidates[name])) for name in candidates}
+        total = 0
+        for X, X_scaled, y in self._iter_split(VAL):
+            total += len(y)
+            for name, model_info in self.models.items():
+                data = X_scaled if model_info['use_scaling'] else X
+                for i, (_, model) in enumerate(candidates[name]):
+                    correct[name][i] += np.sum(model.predict(data) == y)
+
+        for name in self.models:
+            val_scores = correct[name] / max(total, 1)
+            best = int(np.argmax(val_scores))
+            best_params, best_model = candidates[name][best]
+            scores = np.array(progressive[name][best] or [np.nan])
+            self.best_models[name] = best_model
+            self.results[name] = {
+                'best_params': best_params,
+                'best_cv_score': float(np.nanmean(scores)),
+                'val_score': float(val_scores[best]),
+                'cv_mean': float(np.nanmean(scores)),
+                'cv_std': float(np.nanstd(scores)),
+                'tuning_strategy': 'out_of_core'
+            }
+            print(f"\n{name}")
+            print(f"✓ 최적 파라미터: {best_params}")
+            print(f"✓ progressive 검증 점수: {np.nanmean(scores):.4f} ± {np.nanstd(scores):.4f}")
+            print(f"✓ 검증 점수: {val_scores[best]:.4f}")
+
+    def create_stacking_ensemble(self):
+        """out-of-core 모드에서는 OOF 예측을 모두 보관해야 하는 스태킹을 생략합니다"""
+        print("\n" + "=" * 50)
+        print("5. 스태킹 앙상블 모델 생성 (out-of-core 모드에서는 생략)")
+        print("=" * 50)
+
+    def evaluate_models(self):
+        """
+        테스트 행 청크를 한 번 읽으며 모든 모델의 예측을 모아 평가합니다
+        """
+        print("\n" + "=" * 50)
+        print("6. 최종 모델 성능 평가 (out-of-core)")
+        print("=" * 50)
+
+        y_true = []
+        predictions = {name: [] for name in self.best_models}
+        for X, X_scaled, y in self._iter_split(TEST):
+            y_true.append(y)
+            for name, model in self.best_models.items():
+                data = X_scaled if self.models[name]['use_scaling'] else X
+                predictions[name].append(model.predict(data))
+        self.y_test = np.concatenate(y_true)
+
+        test_results = {}
+        for name, y_pred in predictions.items():
+            y_pred = np.concatenate(y_pred)
+            test_results[name] = {
+                'test_accuracy': accuracy_score(self.y_test, y_pred),
+                'predictions': y_pred
+            }
+            print(f"\n{name}:")
+            print(f"테스트 정확도: {test_results[name]['test_accuracy']:.4f}")
+            print("분류 리포트:")
+            print(classification_report(self.y_test, y_pred,
+                                        labels=np.arange(len(self.label_encoder.classes_)),
+                                        target_names=self.label_encoder.classes_.astype(str)))
+
+        best_model_name = max(test_results.keys(), key=lambda x: test_results[x]['test_accuracy'])
+        print(f"\n🏆 최고 성능 모델: {best_model_name}")
+        print(f"테스트 정확도: {test_results[best_model_name]['test_accuracy']:.4f}")
+
+        self.test_results = test_results
+        self.best_model_name = best_model_name
+        return best_model_name
+
+    def _importance_data(self):
+        """
+        검증 샤드를 mmap으로 열어 결정적 표본(importance_max_samples, 지정하지 않으면 최대 SAMPLE_ROWS행)만
+        메모리에 올려 순열 특성 중요도에 사용합니다
+        """
+        X_all, y_all = self._read_shard('val', mmap=True)
+        max_samples = self.importance_max_samples
+        if isinstance(max_samples, float) and max_samples <= 1.0:
+            max_samples = int(max_samples * len(y_all))
+        n_samples = min(len(y_all), max_samples or SAMPLE_ROWS)
+        if n_samples == 0:
+            return None, None, None
+        rows = np.sort(np.random.RandomState(42).choice(len(y_all), size=n_samples, replace=False))
+        X, y = np.asarray(X_all[rows]), np.asarray(y_all[rows])
+        if self.models[self.best_model_name]['use_scaling']:
+            X = self.scaler.transform(X)
+        return X, y, None
+
+    def _tuning_config(self):
+        return {'chunksize': self.chunksize, 'epochs': self.epochs, 'id_column': self.id_column}
+
+    def _pipeline_stages(self):
+        """
+        IrisAnalysis 단계에 더해 prepare 단계가 쓴 샤드 파일이 바뀌거나 사라지면 다시 실행.
+        ID/타겟 컬럼은 load(표본, 특성 목록)와 prepare(분할 해시, 레이블) 결과를 바꾸므로 두 단계의 키에 포함
+        """
+        stages = super()._pipeline_stages()
+        columns = {'id_column': self.id_column, 'target_column': self.target_column}
+        for i, (name, func, depends, outputs, config, options) in enumerate(stages):
+            if name == 'load':
+                config = {**config, **columns}
+            elif name == 'prepare':
+                options = {**options, 'output_dirs': [self.shard_dir]}
+                config = {'chunksize': self.chunksize, 'shard_dir': self.shard_dir, **columns}
+            stages[i] = (name, func, depends, outputs, config, options)
+        return stages
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="대용량 CSV out-of-core 분석")
+    parser.add_argument("--data-path", default="datasets/Iris.csv", help="데이터셋 CSV 경로")
+    parser.add_argument("--chunksize", type=int, default=100_000, help="한 번에 읽을 행 수")
+    parser.add_argument("--epochs", type=int, default=3, help="학습 데이터 반복 횟수")
+    parser.add_argument("--id-column", default="Id", help="분할 해시에 사용할 ID 컬럼 (없으면 행 번호)")
+    parser.add_argument("--target-column", default="Species", help="타겟 컬럼")
+    parser.add_argument("--shard-dir", default="cache/shards", help="분할별 바이너리 샤드 디렉토리")
+    parser.add_argument("--checkpoint-dir", help="단계별 체크포인트 디렉토리")
+    parser.add_argument("--artifact-format", choices=ARTIFACT_FORMATS, default="pickle", help="모델 저장 형식")
+    parser.add_argument("--figure-format", choices=FIGURE_FORMATS, default="png", help="시각화 저장 형식 (png / html / skip)")
+    parser.add_argument("--run-log-format", choices=RUN_LOG_FORMATS, default="json", help="단계별 실행 기록 형식 (json / parquet)")
+    args = parser.parse_args()
+
+    analyzer = OutOfCoreAnalysis(
+        data_path=args.data_path,
+        chunksize=args.chunksize,
+        epochs=args.epochs,
+        id_column=args.id_column,
+        target_column=args.target_column,
+        shard_dir=args.shard_dir,
+        checkpoint_dir=args.checkpoint_dir,
+        artifact_format=args.artifact_format,
+        figure_format=args.figure_format,
+        run_log_format=args.run_log_format
+    )
+    analyzer.run_complete_analysis()
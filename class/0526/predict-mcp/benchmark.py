@@ -0,0 +1,92 @@
+"""
+predict-mcp 지연 시간/처리량 벤치마크
+
+동시 클라이언트 여러 개가 단건 predict 요청을 연속으로 보낼 때
+마이크로 배치 없음(요청마다 개별 예측)과 마이크로 배치(짧은 시간 창 안의 요청을 모아 예측)의
+처리량, 요청별 p50/p99 지연 시간, 평균 배치 크기를 비교합니다.
+
+실행 예:
+    python benchmark.py --model-dir ../models --clients 64 --requests 20
+    python benchmark.py --model-dir ../models --model RandomForest --windows 0 1 2 5 --output predict_benchmark.json
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime
+
+import numpy as np
+
+import server
+
+
+async def run_clients(features_rows, model_name, clients, requests):
+    """clients개의 동시 클라이언트가 각각 requests번 단건 예측을 보냅니다"""
+    async def client(c):
+        failures = 0
+        for r in range(requests):
+            result = await server.predict(features_rows[(c * requests + r) % len(features_rows)], model_name)
+            failures += not result["success"]
+        return failures
+
+    return sum(await asyncio.gather(*(client(c) for c in range(clients))))
+
+
+def run_scenario(args, window_ms, max_batch_size, features_rows):
+    server.load_models(args.model_dir, window_ms, max_batch_size, args.compiled_trees)
+    model_name = args.model or server._state["best_model"]
+    start = time.perf_counter()
+    failures = asyncio.run(run_clients(features_rows, model_name, args.clients, args.requests))
+    wall = time.perf_counter() - start
+    stats = server._get_batcher(model_name).stats.summary()
+    total = args.clients * args.requests
+    return {
+        "model": model_name,
+        "batch_window_ms": window_ms,
+        "max_batch_size": max_batch_size,
+        "clients": args.clients,
+        "requests": total,
+        "failures": failures,
+        "throughput_rps": total / wall,
+        "p50_ms": stats["p50_ms"],
+        "p99_ms": stats["p99_ms"],
+        "mean_batch_size": stats["mean_batch_size"]
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="predict-mcp 마이크로 배치 벤치마크")
+    parser.add_argument("--model-dir", default="../models", help="save_models가 만든 모델 디렉토리")
+    parser.add_argument("--model", help="벤치마크할 모델 이름 (기본: 최고 성능 모델)")
+    parser.add_argument("--clients", type=int, default=64, help="동시 클라이언트 수")
+    parser.add_argument("--requests", type=int, default=20, help="클라이언트당 요청 수")
+    parser.add_argument("--windows", type=float, nargs="+", default=[1.0, 2.0, 5.0], help="비교할 배치 시간 창 (ms)")
+    parser.add_argument("--compiled-trees", action="store_true", help="tree_export.py로 내보낸 노드 테이블로 예측")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    server.load_models(args.model_dir, compiled_trees=args.compiled_trees)
+    rng = np.random.RandomState(42)
+    features_rows = [
+        {name: float(v) for name, v in zip(server._state["feature_names"], rng.uniform(0, 8, len(server._state["feature_names"])))}
+        for _ in range(1000)
+    ]
+
+    # 기준: 배치 크기 1 (요청마다 개별 예측)
+    results = [run_scenario(args, 0.0, 1, features_rows)]
+    for window_ms in args.windows:
+        results.append(run_scenario(args, window_ms, server.MAX_BATCH_SIZE, features_rows))
+
+    print(f"{'시간 창(ms)':<12}{'최대 배치':>10}{'req/s':>12}{'p50(ms)':>10}{'p99(ms)':>10}{'평균 배치':>10}{'실패':>6}")
+    for r in results:
+        print(
+            f"{r['batch_window_ms']:<12}{r['max_batch_size']:>10}{r['throughput_rps']:>12.1f}"
+            f"{r['p50_ms']:>10.2f}{r['p99_ms']:>10.2f}{r['mean_batch_size']:>10.1f}{r['failures']:>6}"
+        )
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({"timestamp": datetime.now().isoformat(), "config": vars(args), "results": results},
+                      f, ensure_ascii=False, indent=2)
+        print(f"\n✓ 결과 저장: {args.output}")
@@ -0,0 +1,377 @@
+from mcp.server.fastmcp import FastMCP
+import pandas as pd
+import numpy as np
+import os
+import sys
+import time
+import asyncio
+import argparse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict
+
+# 저장된 모델(pickle)이 참조하는 분석 모듈(stacking 등)과 batch_score를 불러오기 위해 상위 디렉토리 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from artifacts import has_object
+from batch_score import load_artifacts, score_features
+
+mcp = FastMCP(
+    name="predict-mcp-server",
+    instructions="analysis.py가 저장한 모델로 저지연 예측을 제공하는 MCP 서버"
+)
+
+# 동시에 들어온 단건 요청을 모으는 시간 창과 한 번에 예측할 최대 행 수
+BATCH_WINDOW_MS = 2.0
+MAX_BATCH_SIZE = 256
+# 요청별 지연 시간 히스토그램 구간 상한 (ms)
+LATENCY_BUCKETS_MS = (0.5, 1, 2, 5, 10, 20, 50, 100, 250, 500, 1000, float('inf'))
+# 백분위 계산용으로 보관할 최근 지연 시간 수
+LATENCY_WINDOW = 10_000
+
+
+class LatencyHistogram:
+    """요청별 지연 시간 히스토그램과 최근 요청 기준 백분위"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.counts = [0] * len(LATENCY_BUCKETS_MS)
+        self.recent = deque(maxlen=LATENCY_WINDOW)
+        self.requests = 0
+        self.batches = 0
+        self.batched_rows = 0
+
+    def record(self, latency_ms: float):
+        self.requests += 1
+        self.recent.append(latency_ms)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if latency_ms <= bound:
+                self.counts[i] += 1
+                break
+
+    def summary(self) -> dict:
+        recent = np.array(self.recent) if self.recent else np.zeros(1)
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "mean_batch_size": self.batched_rows / self.batches if self.batches else 0.0,
+            "p50_ms": float(np.percentile(recent, 50)),
+            "p95_ms": float(np.percentile(recent, 95)),
+            "p99_ms": float(np.percentile(recent, 99)),
+            "max_ms": float(recent.max()),
+            "histogram": {
+                (f"<={bound}ms" if bound != float('inf') else ">1000ms"): count
+                for bound, count in zip(LATENCY_BUCKETS_MS, self.counts)
+            }
+        }
+
+
+# 배치 루프 종료 표시 (MicroBatcher.close가 큐 끝에 넣음)
+_CLOSE = object()
+
+
+class MicroBatcher:
+    """
+    모델 하나에 대한 마이크로 배치 실행기
+
+    단건 요청은 큐에 들어가고, 배치 루프가 첫 요청 이후 window_ms 동안(또는 max_batch_size가 찰 때까지)
+    도착한 요청을 모아 한 번의 벡터화 predict_proba로 처리한 뒤 각 요청의 future에 결과를 돌려줍니다.
+    예측은 모델별 전용 스레드에서 실행되어 이벤트 루프를 막지 않습니다.
+    close()하면 이미 큐에 들어온 요청까지 처리한 뒤 배치 루프와 예측 스레드를 정리합니다.
+    """
+
+    def __init__(self, artifacts: dict, window_ms: float = BATCH_WINDOW_MS, max_batch_size: int = MAX_BATCH_SIZE):
+        self.artifacts = artifacts
+        self.window = window_ms / 1000
+        self.max_batch_size = max_batch_size
+        self.stats = LatencyHistogram()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._loop = None
+        self._queue = None
+        self._task = None
+        self._closed = False
+
+    def _ensure_started(self):
+        """현재 이벤트 루프에서 배치 루프를 시작합니다 (루프가 바뀌면 새로 시작)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._task = loop.create_task(self._run())
+
+    async def predict(self, row: np.ndarray):
+        """한 행을 예측합니다 (인코딩된 레이블, 클래스별 확률)"""
+        if self._closed:
+            raise RuntimeError("모델을 다시 불러오는 중 닫힌 배치 실행기입니다. 다시 요청하세요")
+        self._ensure_started()
+        future = self._loop.create_future()
+        await self._queue.put((row, future))
+        return await future
+
+    async def predict_many(self, X: pd.DataFrame) -> np.ndarray:
+        """여러 행을 배치 큐를 거치지 않고 예측 스레드에서 한 번에 예측합니다 (인코딩된 레이블)"""
+        if self._closed:
+            raise RuntimeError("모델을 다시 불러오는 중 닫힌 배치 실행기입니다. 다시 요청하세요")
+        try:
+            predictions, _ = await asyncio.get_running_loop().run_in_executor(
+                self._executor, score_features, self.artifacts, X, False
+            )
+        except RuntimeError:
+            # 확인 직후 다른 스레드에서 close()되어 예측 스레드가 정리된 경우
+            if self._closed:
+                raise RuntimeError("모델을 다시 불러오는 중 닫힌 배치 실행기입니다. 다시 요청하세요") from None
+            raise
+        return predictions
+
+    def close(self):
+        """
+        배치 루프를 멈추고 예측 스레드를 정리합니다 (다른 스레드에서 호출해도 됨).
+        이미 큐에 들어온 요청은 처리한 뒤 멈추고, 예측 스레드는 마지막 배치가 끝나면 종료됩니다.
+        """
+        self._closed = True
+        if self._task is not None and not self._task.done() and self._loop.is_running():
+            # 종료 표시를 큐 끝에 넣어 앞선 요청을 모두 처리한 뒤 배치 루프가 끝나도록 함
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, _CLOSE)
+        else:
+            self._executor.shutdown(wait=False)
+
+    async def _run(self):
+        try:
+            closing = False
+            while not closing:
+                item = await self._queue.get()
+                if item is _CLOSE:
+                    break
+                batch = [item]
+                deadline = self._loop.time() + self.window
+                while len(batch) < self.max_batch_size:
+                    # 이미 큐에 쌓인 요청은 기다리지 않고 가져오고, 창이 남아 있으면 다음 요청을 기다림
+                    if not self._queue.empty():
+                        item = self._queue.get_nowait()
+                    else:
+                        timeout = deadline - self._loop.time()
+                        if timeout <= 0:
+                            break
+                        try:
+                            item = await asyncio.wait_for(self._queue.get(), timeout)
+                        except asyncio.TimeoutError:
+                            break
+                    if item is _CLOSE:
+                        closing = True
+                        break
+                    batch.append(item)
+                await self._predict_batch(batch)
+        finally:
+            # close() 이후 큐에 남은 요청(종료 표시 뒤에 들어온 요청)은 실패로 돌려줌
+            while self._queue is not None and not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is not _CLOSE and not item[1].done():
+                    item[1].set_exception(RuntimeError("배치 실행기가 닫혔습니다. 다시 요청하세요"))
+            self._executor.shutdown(wait=False)
+
+    async def _predict_batch(self, batch):
+        # 요청 행을 한 배열로 모은 뒤 DataFrame은 배치당 한 번만 생성
+        X = pd.DataFrame(np.vstack([row for row, _ in batch]), columns=self.artifacts['feature_names'])
+        try:
+            predictions, probabilities = await self._loop.run_in_executor(
+                self._executor, score_features, self.artifacts, X, True
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        self.stats.batches += 1
+        self.stats.batched_rows += len(batch)
+        for i, (_, future) in enumerate(batch):
+            if not future.done():
+                future.set_result((predictions[i], probabilities[i]))
+
+
+# 서버 상태: 불러오기 설정(모델 디렉토리, 배치 시간 창/크기, 노드 테이블 사용 여부), 모델별 배치 실행기, 최고 성능 모델 이름
+_state = {
+    "model_dir": "models", "window_ms": BATCH_WINDOW_MS, "max_batch_size": MAX_BATCH_SIZE, "compiled_trees": False,
+    "batchers": {}, "best_model": None, "feature_names": None
+}
+
+
+def load_models(model_dir: str = None, window_ms: float = None, max_batch_size: int = None,
+                compiled_trees: bool = None) -> dict:
+    """
+    모델 디렉토리의 모든 모델을 불러오고 한 번씩 예측하여 미리 데워 둡니다.
+    compiled_trees=True이면 tree_export.py로 내보낸 노드 테이블이 있는 트리 모델은 테이블로 예측합니다.
+    생략한 설정은 마지막으로 불러올 때(서버 시작 시 CLI 옵션)의 값을 그대로 사용합니다.
+    """
+    model_dir = model_dir or _state["model_dir"]
+    window_ms = _state["window_ms"] if window_ms is None else window_ms
+    max_batch_size = _state["max_batch_size"] if max_batch_size is None else max_batch_size
+    compiled_trees = _state["compiled_trees"] if compiled_trees is None else compiled_trees
+    best = load_artifacts(model_dir)
+    batchers = {}
+    for name in best['model_names']:
+        if not has_object(model_dir, f"{name.lower()}_model"):
+            continue
+        artifacts = load_artifacts(model_dir, name, compiled_trees)
+        if not artifacts['feature_names']:
+            raise ValueError("results_summary에 feature_names가 없습니다. analysis.py를 다시 실행하여 모델을 저장하세요")
+        # 첫 요청이 모델 초기화 비용(지연 import, 캐시 생성 등)을 떠안지 않도록 미리 한 번 예측
+        warmup = pd.DataFrame(np.zeros((1, len(artifacts['feature_names']))), columns=artifacts['feature_names'])
+        score_features(artifacts, warmup, True)
+        batchers[name] = MicroBatcher(artifacts, window_ms, max_batch_size)
+
+    previous = _state["batchers"]
+    _state.update(
+        model_dir=model_dir,
+        window_ms=window_ms,
+        max_batch_size=max_batch_size,
+        compiled_trees=compiled_trees,
+        batchers=batchers,
+        best_model=best['model_name'],
+        feature_names=best['feature_names']
+    )
+    # 교체된 배치 실행기는 처리 중인 요청을 끝낸 뒤 배치 루프와 예측 스레드를 정리
+    for batcher in previous.values():
+        batcher.close()
+    return _state
+
+
+async def _ensure_models():
+    """모델을 아직 불러오지 않았으면 이벤트 루프 밖에서 불러옵니다 (마지막 불러오기 설정 사용)"""
+    if not _state["batchers"]:
+        await asyncio.to_thread(load_models)
+
+
+def _get_batcher(model_name: Optional[str]) -> MicroBatcher:
+    if not _state["batchers"]:
+        load_models()
+    name = model_name or _state["best_model"]
+    for candidate, batcher in _state["batchers"].items():
+        if candidate.lower() == name.lower():
+            return batcher
+    raise KeyError(f"모델을 찾을 수 없습니다: {name} (사용 가능: {list(_state['batchers'])})")
+
+
+def _to_array(rows: List[Dict[str, float]], feature_names: List[str]) -> np.ndarray:
+    """요청의 특성 dict 목록을 모델 학습 시 컬럼 순서의 (행 수, 특성 수) 배열로 변환합니다"""
+    missing = {c for row in rows for c in feature_names if c not in row}
+    if missing:
+        raise ValueError(f"누락된 특성: {sorted(missing)}")
+    return np.array([[row[c] for c in feature_names] for row in rows], dtype=np.float64)
+
+
+@mcp.tool('predict', "단건 예측 (동시 요청은 짧은 시간 창 안에서 모아 한 번에 예측)")
+async def predict(
+    features: Dict[str, float],
+    model_name: Optional[str] = None
+) -> dict:
+    """특성 dict 하나를 예측합니다 (model_name이 없으면 최고 성능 모델 사용)"""
+    start = time.perf_counter()
+    try:
+        await _ensure_models()
+        batcher = _get_batcher(model_name)
+        row = _to_array([features], batcher.artifacts['feature_names'])
+        prediction, probabilities = await batcher.predict(row)
+        classes = batcher.artifacts['label_encoder'].classes_
+        latency_ms = (time.perf_counter() - start) * 1000
+        batcher.stats.record(latency_ms)
+        return {
+            "success": True,
+            "model": batcher.artifacts['model_name'],
+            "prediction": str(classes[prediction]),
+            "probabilities": {str(label): float(p) for label, p in zip(classes, probabilities)},
+            "latency_ms": latency_ms
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "message": f"예측 실패: {str(e)}"
+        }
+
+
+@mcp.tool('predict_batch', "여러 행을 한 번에 예측")
+async def predict_batch(
+    rows: List[Dict[str, float]],
+    model_name: Optional[str] = None
+) -> dict:
+    """특성 dict 목록을 한 번의 벡터화 예측으로 처리합니다 (마이크로 배치 큐를 거치지 않음)"""
+    start = time.perf_counter()
+    try:
+        await _ensure_models()
+        batcher = _get_batcher(model_name)
+        X = pd.DataFrame(_to_array(rows, batcher.artifacts['feature_names']), columns=batcher.artifacts['feature_names'])
+        predictions = await batcher.predict_many(X)
+        return {
+            "success": True,
+            "model": batcher.artifacts['model_name'],
+            "predictions": [str(label) for label in batcher.artifacts['label_encoder'].inverse_transform(predictions)],
+            "latency_ms": (time.perf_counter() - start) * 1000
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "message": f"배치 예측 실패: {str(e)}"
+        }
+
+
+@mcp.tool('list_models', "불러온 모델 목록 조회")
+async def list_models() -> dict:
+    """불러온 모델, 최고 성능 모델, 입력 특성 이름을 반환합니다"""
+    try:
+        await _ensure_models()
+        return {
+            "success": True,
+            "model_dir": _state["model_dir"],
+            "models": list(_state["batchers"]),
+            "best_model": _state["best_model"],
+            "feature_names": _state["feature_names"]
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "message": f"모델 목록 조회 실패: {str(e)}"
+        }
+
+
+@mcp.tool('prediction_stats', "모델별 요청 지연 시간 히스토그램 및 배치 통계")
+async def prediction_stats(reset: bool = False) -> dict:
+    """모델별 요청 수, p50/p95/p99 지연 시간, 지연 시간 히스토그램, 평균 배치 크기를 반환합니다"""
+    stats = {name: batcher.stats.summary() for name, batcher in _state["batchers"].items()}
+    if reset:
+        for batcher in _state["batchers"].values():
+            batcher.stats.reset()
+    return {"success": True, "stats": stats}
+
+
+@mcp.tool('reload_models', "모델 디렉토리 다시 불러오기")
+async def reload_models(model_dir: Optional[str] = None) -> dict:
+    """모델을 다시 불러옵니다 (analysis.py를 다시 실행한 뒤 사용, 배치 설정은 서버 시작 시 옵션 유지)"""
+    try:
+        # 모델 로드와 워밍업 예측은 블로킹 I/O이므로 이벤트 루프 밖에서 실행
+        await asyncio.to_thread(load_models, model_dir)
+        return {"success": True, "models": list(_state["batchers"]), "best_model": _state["best_model"]}
+    except Exception as e:
+        return {
+            "success": False,
+            "message": f"모델 불러오기 실패: {str(e)}"
+        }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="예측 MCP 서버")
+    parser.add_argument("--model-dir", default="models", help="save_models가 만든 모델 디렉토리")
+    parser.add_argument("--batch-window-ms", type=float, default=BATCH_WINDOW_MS, help="단건 요청을 모으는 시간 창 (ms)")
+    parser.add_argument("--max-batch-size", type=int, default=MAX_BATCH_SIZE, help="한 번에 예측할 최대 요청 수")
+    parser.add_argument("--compiled-trees", action="store_true", help="tree_export.py로 내보낸 노드 테이블이 있는 트리 모델은 테이블로 예측")
+    parser.add_argument("--transport", choices=["stdio", "streamable-http"], default="stdio", help="MCP 전송 방식")
+    parser.add_argument("--port", type=int, default=8000, help="streamable-http 전송 시 포트")
+    args = parser.parse_args()
+
+    # 서버 시작 전에 모든 모델을 불러와 데워 둠
+    load_models(args.model_dir, args.batch_window_ms, args.max_batch_size, args.compiled_trees)
+    print(f"모델 {len(_state['batchers'])}개 로드 완료 (최고 성능: {_state['best_model']})", file=sys.stderr)
+
+    mcp.settings.port = args.port
+    mcp.run(
+        transport=args.transport
+    )
@@ -0,0 +1,116 @@
+"""
+predict-mcp 마이크로 배치 실행기 테스트 (배치로 모아 예측한 결과가 한 행씩 예측한 결과와 같은지)
+
+실행:
+    python -m pytest server_test.py -q
+"""
+
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+
+# server가 상위 디렉토리(분석 모듈)를 sys.path에 추가하므로 먼저 import
+from server import MicroBatcher
+from artifacts import save_object, write_manifest
+from batch_score import load_artifacts, score_features
+from tree_export import export_models
+
+FEATURE_NAMES = ['SepalLengthCm', 'SepalWidthCm', 'PetalLengthCm', 'PetalWidthCm']
+
+
+@pytest.fixture(scope="module")
+def model_dir(tmp_path_factory):
+    """save_models와 같은 파일 구성의 모델 디렉토리 (RandomForest + 스케일링하는 LogisticRegression)"""
+    directory = tmp_path_factory.mktemp("models")
+    rng = np.random.RandomState(0)
+    X = pd.DataFrame(rng.rand(300, 4) * [4, 2, 6, 2.5], columns=FEATURE_NAMES)
+    labels = np.array(['Iris-setosa', 'Iris-versicolor', 'Iris-virginica'])[
+        np.digitize(X['PetalLengthCm'] + rng.rand(300), [2.5, 4.5])
+    ]
+    label_encoder = LabelEncoder().fit(labels)
+    y = label_encoder.transform(labels)
+    scaler = StandardScaler().fit(X)
+    objects = {
+        'results_summary': {
+            'best_model': 'RandomForest',
+            'model_results': {'RandomForest': {}, 'LogisticRegression': {}},
+            'feature_names': FEATURE_NAMES, 'target_column': 'Species',
+            'scaled_models': ['LogisticRegression'],
+        },
+        'randomforest_model': RandomForestClassifier(n_estimators=25, random_state=0).fit(X, y),
+        'logisticregression_model': LogisticRegression(max_iter=1000).fit(scaler.transform(X), y),
+        'scaler': scaler,
+        'label_encoder': label_encoder,
+    }
+    filenames = {name: save_object(obj, str(directory), name, 'mmap') for name, obj in objects.items()}
+    write_manifest(str(directory), filenames, 'mmap')
+    export_models(str(directory))
+    return str(directory)
+
+
+def _rows(n=40):
+    return np.random.RandomState(1).rand(n, 4) * [4, 2, 6, 2.5]
+
+
+def _single_row_predictions(artifacts, rows):
+    results = [score_features(artifacts, pd.DataFrame([row], columns=FEATURE_NAMES), True) for row in rows]
+    return np.array([p[0] for p, _ in results]), np.vstack([proba[0] for _, proba in results])
+
+
+async def _predict_concurrently(batcher, rows):
+    results = await asyncio.gather(*(batcher.predict(row) for row in rows))
+    return np.array([label for label, _ in results]), np.vstack([proba for _, proba in results])
+
+
+@pytest.mark.parametrize("model_name, compiled_trees", [
+    ('RandomForest', False),
+    ('RandomForest', True),
+    ('LogisticRegression', False),
+])
+def test_batched_predictions_equal_single_row_predictions(model_dir, model_name, compiled_trees):
+    """동시에 들어온 단건 요청을 배치로 모아 예측해도 한 행씩 예측한 레이블/확률과 같음"""
+    artifacts = load_artifacts(model_dir, model_name, compiled_trees)
+    rows = _rows()
+    expected_labels, expected_proba = _single_row_predictions(artifacts, rows)
+
+    batcher = MicroBatcher(artifacts, window_ms=50, max_batch_size=8)
+    labels, proba = asyncio.run(_predict_concurrently(batcher, rows))
+    batcher.close()
+
+    np.testing.assert_array_equal(labels, expected_labels)
+    # 행 하나와 여러 행의 행렬 곱은 BLAS 경로가 달라 마지막 자리만 다를 수 있음 (트리 모델은 비트 단위로 같음)
+    np.testing.assert_allclose(proba, expected_proba, rtol=1e-12, atol=1e-15)
+    assert batcher.stats.batched_rows == len(rows)
+    assert len(rows) / batcher.max_batch_size <= batcher.stats.batches < len(rows)
+
+
+def test_predict_many_equals_single_row_predictions(model_dir):
+    artifacts = load_artifacts(model_dir, 'RandomForest', compiled_trees=True)
+    rows = _rows()
+    expected_labels, _ = _single_row_predictions(artifacts, rows)
+    batcher = MicroBatcher(artifacts)
+    labels = asyncio.run(batcher.predict_many(pd.DataFrame(rows, columns=FEATURE_NAMES)))
+    batcher.close()
+    np.testing.assert_array_equal(labels, expected_labels)
+
+
+def test_closed_batcher_rejects_requests(model_dir):
+    """close() 전에 들어온 요청은 처리하고, 이후 요청은 RuntimeError"""
+    batcher = MicroBatcher(load_artifacts(model_dir, 'RandomForest'), window_ms=20)
+    rows = _rows(5)
+
+    async def scenario():
+        pending = [asyncio.ensure_future(batcher.predict(row)) for row in rows]
+        await asyncio.sleep(0)
+        batcher.close()
+        results = await asyncio.gather(*pending)
+        with pytest.raises(RuntimeError, match="닫힌 배치 실행기"):
+            await batcher.predict(rows[0])
+        return results
+
+    assert len(asyncio.run(scenario())) == len(rows)
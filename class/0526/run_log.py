@@ -0,0 +1,293 @@
+"""
+실행 계측 모듈
+
+분석 파이프라인의 단계별 / 모델별 자원 사용량을 기록하고 기계가 읽을 수 있는 실행 기록으로 저장합니다.
+
+- 벽시계 시간과 CPU 시간: CPU 시간은 현재 프로세스와 자식 프로세스(joblib/loky 워커 등)를 모두 합칩니다.
+  Linux에서는 /proc에서 살아 있는 자식 프로세스까지 읽고, 그 밖의 OS에서는 종료된 자식 프로세스만 포함됩니다.
+- 최대 RSS: 현재 프로세스의 단계 중 최대 RSS (Linux는 /proc/self/clear_refs로 단계마다 초기화,
+  초기화할 수 없으면 프로세스 시작 이후 최대값)와, 현재 프로세스 + 자식 프로세스 RSS 합의 표본 최대값.
+  resource 모듈이 없는 Windows에서는 psutil이 설치되어 있으면 psutil로 재고, 없으면 기록하지 않습니다(None).
+- 추정기 fit 횟수: FitCache.fits의 증가량 (캐시에서 불러온 학습은 제외)
+
+실행 기록은 models/run_log.json (또는 run_log.parquet)에 results_summary와 함께 저장됩니다.
+"""
+
+import json
+import os
+import platform
+import sys
+import threading
+import time
+import warnings
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:
+    # Windows에는 resource 모듈이 없음
+    resource = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+RUN_LOG_VERSION = 1
+RUN_LOG_FORMATS = ['json', 'parquet']
+MB = 1024 * 1024
+
+_PROC = os.path.isdir('/proc/self')
+_CLOCK_TICKS = os.sysconf('SC_CLK_TCK') if _PROC else 100
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if _PROC else 4096
+
+
+def _proc_table():
+    """{pid: (ppid, CPU 초(자신 + 기다린 자식), RSS 바이트)} (/proc/[pid]/stat)"""
+    table = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'rb') as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # 프로세스 이름에 공백이나 괄호가 있을 수 있으므로 마지막 ')' 뒤부터 필드를 셈
+        fields = stat[stat.rindex(b')') + 2:].split()
+        ticks = sum(int(value) for value in fields[11:15])
+        table[int(entry)] = (int(fields[1]), ticks / _CLOCK_TICKS, int(fields[21]) * _PAGE_SIZE)
+    return table
+
+
+def _descendants(table, root):
+    children = {}
+    for pid, (ppid, _, _) in table.items():
+        children.setdefault(ppid, []).append(pid)
+    pids, stack = [], [root]
+    while stack:
+        pid = stack.pop()
+        pids.append(pid)
+        stack.extend(children.get(pid, ()))
+    return pids
+
+
+def process_tree_usage():
+    """(CPU 초, RSS 바이트) - 현재 프로세스와 모든 자식 프로세스의 합"""
+    if _PROC:
+        table = _proc_table()
+        pids = [pid for pid in _descendants(table, os.getpid()) if pid in table]
+        return sum(table[pid][1] for pid in pids), sum(table[pid][2] for pid in pids)
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system, _max_rss()
+
+
+def _max_rss():
+    """
+    /proc 없이 구한 현재 프로세스의 최대 RSS (바이트).
+    getrusage를 쓰고, resource 모듈이 없으면(Windows) psutil의 최대 작업 집합, 둘 다 없으면 None
+    """
+    if resource is not None:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == 'darwin' else 1024)
+    if psutil is not None:
+        info = psutil.Process().memory_info()
+        return getattr(info, 'peak_wset', info.rss)
+    return None
+
+
+def _reset_peak_rss() -> bool:
+    """현재 프로세스의 최대 RSS(VmHWM)를 현재 RSS로 초기화합니다 (Linux 4.0 이상)"""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss():
+    """현재 프로세스의 최대 RSS (바이트, 잴 수 없으면 None)"""
+    if _PROC:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    return _max_rss()
+
+
+def search_fit_seconds(search) -> float:
+    """
+    탐색 객체의 (후보, fold) 학습 시간 합계 (cv_results_의 mean_fit_time × fold 수).
+    병렬 탐색이나 shared 스케줄러에서도 모델별 계산량을 비교할 수 있습니다.
+    """
+    cv_results = search.cv_results_
+    n_splits = sum(key.startswith('split') and key.endswith('_test_score') for key in cv_results)
+    return float(sum(cv_results['mean_fit_time']) * n_splits)
+
+
+class _TreeRssSampler:
+    """백그라운드 스레드에서 현재 프로세스 + 자식 프로세스 RSS 합을 주기적으로 재어 최대값을 기록합니다"""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        if _PROC:
+            self.peak = process_tree_usage()[1]
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, process_tree_usage()[1])
+
+    def __exit__(self, *exc):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self.peak = max(self.peak, process_tree_usage()[1])
+        return False
+
+
+class RunLogger:
+    """
+    단계별 / 모델별 실행 기록기
+
+    Args:
+        fit_counter: 지금까지 실행한 추정기 fit 횟수를 반환하는 함수 (예: lambda: fit_cache.fits)
+        sample_interval: 자식 프로세스 포함 RSS 표본 간격 (초)
+    """
+
+    def __init__(self, fit_counter=None, sample_interval=0.2):
+        self.fit_counter = fit_counter or (lambda: 0)
+        self.sample_interval = sample_interval
+        self.stages = []
+        self.models = []
+        self.created = datetime.now().isoformat(timespec='seconds')
+        self._current_stage = None
+
+    @contextmanager
+    def _measure(self, record):
+        """블록의 벽시계 / CPU 시간과 fit 횟수를 record에 기록합니다"""
+        fits = self.fit_counter()
+        cpu = process_tree_usage()[0]
+        start = time.perf_counter()
+        try:
+            yield record
+        except BaseException:
+            record['status'] = 'failed'
+            raise
+        finally:
+            record['wall_seconds'] = round(time.perf_counter() - start, 4)
+            record['cpu_seconds'] = round(process_tree_usage()[0] - cpu, 4)
+            record['fits'] = self.fit_counter() - fits
+
+    @contextmanager
+    def stage(self, name):
+        """
+        단계 하나를 계측합니다. 블록 안에서 record['status']를 바꿀 수 있습니다 (기본 'executed').
+        """
+        record = {'stage': name, 'status': 'executed'}
+        self._current_stage = name
+        peak_scope = 'stage' if _reset_peak_rss() else 'process'
+        try:
+            with _TreeRssSampler(self.sample_interval) as sampler, self._measure(record):
+                yield record
+        finally:
+            peak_rss = _peak_rss()
+            record['peak_rss_mb'] = round(peak_rss / MB, 1) if peak_rss is not None else None
+            record['peak_rss_scope'] = peak_scope
+            record['peak_tree_rss_mb'] = round(sampler.peak / MB, 1) if _PROC else None
+            self.stages.append(record)
+            self._current_stage = None
+
+    @contextmanager
+    def model(self, name):
+        """
+        모델 하나의 튜닝을 계측합니다. 블록 안에서 record에 추가 정보를 넣을 수 있습니다.
+        """
+        record = {'model': name, 'stage': self._current_stage}
+        try:
+            with self._measure(record):
+                yield record
+        finally:
+            self.models.append(record)
+
+    def summary(self) -> dict:
+        """전체 합계"""
+        return {
+            'wall_seconds': round(sum(record['wall_seconds'] for record in self.stages), 4),
+            'cpu_seconds': round(sum(record['cpu_seconds'] for record in self.stages), 4),
+            'fits': sum(record['fits'] for record in self.stages),
+            'peak_rss_mb': max((record['peak_rss_mb'] or 0.0 for record in self.stages), default=0.0),
+            'peak_tree_rss_mb': max((record['peak_tree_rss_mb'] or 0.0 for record in self.stages), default=0.0)
+        }
+
+    def to_dict(self, config=None) -> dict:
+        import numpy as np
+        import sklearn
+        return {
+            'version': RUN_LOG_VERSION,
+            'created': self.created,
+            'environment': {
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'cpu_count': os.cpu_count(),
+                'numpy': np.__version__,
+                'sklearn': sklearn.__version__
+            },
+            'config': config or {},
+            'summary': self.summary(),
+            'stages': self.stages,
+            'models': self.models
+        }
+
+    def write(self, output_dir, run_log_format='json', config=None) -> str:
+        """
+        실행 기록을 저장하고 경로를 반환합니다.
+        json은 설정/환경을 포함한 전체 기록, parquet은 단계와 모델 기록을 한 행씩 담은 표
+        (record 컬럼이 'stage' 또는 'model', 실행 간 비교를 위해 created 컬럼 포함)입니다.
+        pyarrow가 없으면 경고와 함께 JSON으로 저장합니다.
+        """
+        if run_log_format not in RUN_LOG_FORMATS:
+            raise ValueError(f"지원하지 않는 실행 기록 형식입니다: {run_log_format}")
+        os.makedirs(output_dir, exist_ok=True)
+        log = self.to_dict(config)
+        if run_log_format == 'parquet':
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError:
+                # 실행 끝에서 기록을 잃지 않도록 JSON으로 대신 저장
+                warnings.warn("pyarrow가 설치되어 있지 않아 실행 기록을 JSON으로 저장합니다 (pip install pyarrow)")
+                run_log_format = 'json'
+        if run_log_format == 'parquet':
+            import pandas as pd
+            path = os.path.join(output_dir, "run_log.parquet")
+            rows = [{'record': 'stage', **record} for record in log['stages']]
+            rows += [{'record': 'model', **record} for record in log['models']]
+            table = pd.DataFrame(rows)
+            table.insert(0, 'created', log['created'])
+            table.to_parquet(path, index=False)
+        else:
+            path = os.path.join(output_dir, "run_log.json")
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(log, f, ensure_ascii=False, indent=2, default=str)
+        return path
+
+    def print_report(self):
+        """단계별 기록 표 출력"""
+        print(f"{'단계':<10} {'상태':<9} {'벽시계(초)':>10} {'CPU(초)':>9} {'최대 RSS(MB)':>12} {'워커 포함(MB)':>13} {'fit':>6}")
+        for record in self.stages:
+            rss, tree_rss = record['peak_rss_mb'], record['peak_tree_rss_mb']
+            print(f"{record['stage']:<10} {record['status']:<9} {record['wall_seconds']:>10.2f} "
+                  f"{record['cpu_seconds']:>9.2f} {rss if rss is not None else '-':>12} "
+                  f"{tree_rss if tree_rss is not None else '-':>13} {record['fits']:>6}")
+        for record in self.models:
+            fit_seconds = f", 후보 학습 합계 {record['fit_seconds']:.2f}초" if 'fit_seconds' in record else ""
+            print(f"  {record['model']} 튜닝: {record['wall_seconds']:.2f}초 "
+                  f"(CPU {record['cpu_seconds']:.2f}초, fit {record['fits']}회{fit_seconds})")
@@ -0,0 +1,294 @@
+"""
+분석 파이프라인 확장성 벤치마크
+
+Iris.csv와 같은 스키마(Id, 특성 4개, Species)에 특성을 더 붙인 합성 분류 데이터를
+여러 행 수로 만들고, 크기 × 특성 수 × 튜닝 전략마다 분석 파이프라인을 별도 프로세스로 실행합니다.
+각 실행이 남긴 단계별 실행 기록(models/run_log.json)을 모아 단계별 / 모델별 시간·메모리 확장 곡선을 저장하고,
+--baseline으로 이전 결과와 비교하여 느려진 단계를 찾습니다.
+
+- memory 모드: analysis.py (튜닝 전략별로 실행)
+- out_of_core 모드: out_of_core.py (청크 partial_fit, 튜닝 전략 없음)
+- auto: --max-in-memory-rows 이하는 memory, 넘으면 out_of_core
+
+사용 예:
+    python scaling_benchmark.py
+    python scaling_benchmark.py --sizes 10000 100000 --extra-features 0 16 --strategies random halving \\
+        --analysis-args="--n-iter 10 --boosting-engine histogram"
+    python scaling_benchmark.py --baseline benchmarks/results/20260101-120000/results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import shlex
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from figure_export import FigureExporter, FIGURE_FORMATS
+from tuning import TUNING_STRATEGIES
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+BENCHMARK_MODES = ['auto', 'memory', 'out_of_core']
+IRIS_FEATURES = ['SepalLengthCm', 'SepalWidthCm', 'PetalLengthCm', 'PetalWidthCm']
+# Iris.csv의 클래스별 특성 평균 / 표준편차
+IRIS_CLASSES = {
+    'Iris-setosa': ([5.006, 3.428, 1.462, 0.246], [0.352, 0.379, 0.174, 0.105]),
+    'Iris-versicolor': ([5.936, 2.770, 4.260, 1.326], [0.516, 0.314, 0.470, 0.198]),
+    'Iris-virginica': ([6.588, 2.974, 5.552, 2.026], [0.636, 0.322, 0.552, 0.275]),
+}
+GENERATE_CHUNK_ROWS = 1_000_000
+# 이보다 짧은 단계는 측정 잡음이 커서 회귀 비교에서 제외
+MIN_COMPARE_SECONDS = 0.5
+
+
+def synthetic_path(data_dir, n_rows, n_extra, seed):
+    return os.path.join(data_dir, f"synthetic_{n_rows}_{n_extra}_{seed}.csv")
+
+
+def make_synthetic_csv(path, n_rows, n_extra=0, seed=42):
+    """
+    Iris 스키마의 합성 데이터를 CSV로 씁니다 (청크 단위 생성, 같은 인자면 같은 파일).
+    기본 특성 4개는 클래스별 Iris 평균/표준편차의 정규분포이고, 추가 특성 Feature1..n 중
+    절반은 클래스에 따라 평균이 조금씩 다른 약한 정보 특성, 나머지는 잡음입니다.
+    """
+    rng = np.random.default_rng(seed)
+    species = np.array(list(IRIS_CLASSES))
+    means = np.array([IRIS_CLASSES[name][0] for name in species])
+    stds = np.array([IRIS_CLASSES[name][1] for name in species])
+    extra_shift = rng.normal(0, 0.5, size=(len(species), n_extra))
+    extra_shift[:, n_extra // 2:] = 0
+    extra_columns = [f"Feature{i + 1}" for i in range(n_extra)]
+
+    tmp_path = path + ".tmp"
+    start = time.perf_counter()
+    for offset in range(0, n_rows, GENERATE_CHUNK_ROWS):
+        size = min(GENERATE_CHUNK_ROWS, n_rows - offset)
+        labels = rng.integers(0, len(species), size)
+        base = np.round(rng.normal(means[labels], stds[labels]).clip(0.1), 1)
+        chunk = pd.DataFrame(base, columns=IRIS_FEATURES)
+        chunk.insert(0, 'Id', np.arange(offset + 1, offset + size + 1))
+        if n_extra:
+            extra = np.round(rng.normal(extra_shift[labels], 1.0), 3)
+            chunk = pd.concat([chunk, pd.DataFrame(extra, columns=extra_columns)], axis=1)
+        chunk['Species'] = species[labels]
+        chunk.to_csv(tmp_path, mode='w' if offset == 0 else 'a', header=offset == 0, index=False)
+    os.replace(tmp_path, path)
+    print(f"✓ 합성 데이터 생성: {path} ({n_rows:,}행, 특성 {4 + n_extra}개, {time.perf_counter() - start:.1f}초)")
+
+
+def ensure_dataset(data_dir, n_rows, n_extra, seed):
+    os.makedirs(data_dir, exist_ok=True)
+    path = synthetic_path(data_dir, n_rows, n_extra, seed)
+    if not os.path.exists(path):
+        make_synthetic_csv(path, n_rows, n_extra, seed)
+    return os.path.abspath(path)
+
+
+def plan_runs(sizes, extra_features, strategies, mode, max_in_memory_rows):
+    """(행 수, 추가 특성 수, 모드, 튜닝 전략) 실행 목록"""
+    runs = []
+    for n_rows in sizes:
+        run_mode = mode if mode != 'auto' else ('memory' if n_rows <= max_in_memory_rows else 'out_of_core')
+        for n_extra in extra_features:
+            # out-of-core 모드는 튜닝 전략을 쓰지 않으므로 한 번만 실행
+            for strategy in (strategies if run_mode == 'memory' else ['out_of_core']):
+                runs.append((n_rows, n_extra, run_mode, strategy))
+    return runs
+
+
+def run_pipeline(data_path, run_dir, run_mode, strategy, figure_format, extra_args, timeout):
+    """
+    파이프라인을 run_dir에서 별도 프로세스로 실행하고 (상태, 실행 기록, 경과 시간)을 반환합니다.
+    extra_args는 실행 모드의 스크립트(analysis.py 또는 out_of_core.py)에 그대로 넘깁니다.
+    프로세스를 분리하여 실행마다 최대 RSS가 독립적으로 측정됩니다.
+    """
+    os.makedirs(run_dir, exist_ok=True)
+    script = 'analysis.py' if run_mode == 'memory' else 'out_of_core.py'
+    command = [sys.executable, os.path.join(SCRIPT_DIR, script), '--data-path', data_path,
+               '--figure-format', figure_format, '--run-log-format', 'json']
+    if run_mode == 'memory':
+        command += ['--tuning-strategy', strategy]
+    else:
+        command += ['--shard-dir', os.path.join(run_dir, 'shards')]
+    command += extra_args
+
+    start = time.perf_counter()
+    with open(os.path.join(run_dir, 'output.log'), 'w', encoding='utf-8') as log_file:
+        try:
+            result = subprocess.run(command, cwd=run_dir, stdout=log_file, stderr=subprocess.STDOUT, timeout=timeout)
+            status = 'ok' if result.returncode == 0 else 'failed'
+        except subprocess.TimeoutExpired:
+            status = 'timeout'
+    elapsed = time.perf_counter() - start
+
+    log_path = os.path.join(run_dir, 'models', 'run_log.json')
+    run_log = None
+    # 이전 실행의 기록을 잘못 읽지 않도록 이번 실행 중에 쓰인 기록만 사용
+    if os.path.exists(log_path) and os.path.getmtime(log_path) >= time.time() - elapsed - 1:
+        with open(log_path, 'r', encoding='utf-8') as f:
+            run_log = json.load(f)
+    return status, run_log, elapsed
+
+
+def collect_records(key, status, run_log, elapsed):
+    """실행 하나의 단계 / 모델 기록을 (행 수, 특성 수, 모드, 전략) 컬럼과 함께 평평한 행으로 만듭니다"""
+    n_rows, n_extra, run_mode, strategy = key
+    base = {'rows': n_rows, 'n_features': 4 + n_extra, 'mode': run_mode, 'strategy': strategy, 'run_status': status}
+    stages = [{**base, 'stage': 'total', 'status': status, 'wall_seconds': round(elapsed, 4)}]
+    models = []
+    if run_log is not None:
+        stages += [{**base, **record} for record in run_log['stages']]
+        models = [{**base, **record} for record in run_log['models']]
+    return stages, models
+
+
+def compare_with_baseline(stages, baseline_path, threshold):
+    """
+    이전 결과와 같은 (행 수, 특성 수, 모드, 전략, 단계)의 벽시계 시간 / 최대 RSS를 비교합니다.
+    threshold배 이상 늘어난 항목 목록을 반환합니다.
+    """
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = pd.DataFrame(json.load(f)['stages'])
+    keys = ['rows', 'n_features', 'mode', 'strategy', 'stage']
+    merged = pd.DataFrame(stages).merge(baseline, on=keys, suffixes=('', '_baseline'))
+    regressions = []
+    for _, row in merged.iterrows():
+        checks = [('wall_seconds', row['wall_seconds'], row['wall_seconds_baseline'])]
+        if 'peak_tree_rss_mb' in row and pd.notna(row.get('peak_tree_rss_mb_baseline')):
+            checks.append(('peak_tree_rss_mb', row['peak_tree_rss_mb'], row['peak_tree_rss_mb_baseline']))
+        for metric, value, old in checks:
+            if pd.isna(value) or pd.isna(old):
+                continue
+            if metric == 'wall_seconds' and max(value, old) < MIN_COMPARE_SECONDS:
+                continue
+            if old > 0 and value / old >= threshold:
+                regressions.append({**{k: row[k] for k in keys}, 'metric': metric,
+                                    'baseline': old, 'current': value, 'ratio': round(value / old, 2)})
+    return regressions
+
+
+def save_curves(stages, models, output_dir, figure_format):
+    """행 수에 따른 단계별 / 모델별 시간·메모리 확장 곡선 (로그-로그)"""
+    import plotly.express as px
+
+    exporter = FigureExporter(output_dir, figure_format)
+    stage_df = pd.DataFrame(stages)
+    stage_df = stage_df[stage_df['run_status'] == 'ok']
+    if stage_df.empty:
+        print("완료된 실행이 없어 확장 곡선을 만들지 않습니다")
+        return
+    stage_df['series'] = stage_df['mode'] + '/' + stage_df['strategy']
+    with exporter.batch():
+        for metric, title, name in [
+            ('wall_seconds', '단계별 실행 시간', 'scaling_stage_time'),
+            ('cpu_seconds', '단계별 CPU 시간', 'scaling_stage_cpu'),
+            ('peak_tree_rss_mb', '단계별 최대 RSS (워커 포함, MB)', 'scaling_stage_memory'),
+        ]:
+            # 로그 축이므로 0인 값(아주 짧은 단계)은 제외
+            data = stage_df[stage_df[metric] > 0].sort_values('rows')
+            fig = px.line(data, x='rows', y=metric, color='stage', line_dash='series', facet_col='n_features',
+                          markers=True, log_x=True, log_y=True, title=title)
+            exporter.add(fig, name, title)
+        if models:
+            model_df = pd.DataFrame(models)
+            model_df = model_df[model_df['run_status'] == 'ok'].sort_values('rows')
+            if not model_df.empty:
+                fig = px.line(model_df, x='rows', y='wall_seconds', color='model', line_dash='strategy',
+                              facet_col='n_features', markers=True, log_x=True, log_y=True,
+                              title='모델별 튜닝 시간')
+                exporter.add(fig, 'scaling_model_time', '모델별 튜닝 시간')
+    exporter.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="분석 파이프라인 확장성 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs='+', default=[10_000, 1_000_000, 10_000_000],
+                        help="합성 데이터 행 수 목록")
+    parser.add_argument("--extra-features", type=int, nargs='+', default=[0, 16],
+                        help="기본 특성 4개에 더할 특성 수 목록")
+    parser.add_argument("--strategies", nargs='+', choices=TUNING_STRATEGIES, default=['random', 'halving'],
+                        help="memory 모드에서 비교할 튜닝 전략")
+    parser.add_argument("--mode", choices=BENCHMARK_MODES, default='auto',
+                        help="auto: --max-in-memory-rows 이하는 analysis.py, 넘으면 out_of_core.py")
+    parser.add_argument("--max-in-memory-rows", type=int, default=1_000_000, help="auto 모드의 memory 최대 행 수")
+    parser.add_argument("--analysis-args", default="",
+                        help='memory 모드(analysis.py)에 넘길 추가 인자 (예: --analysis-args="--n-iter 10 --n-jobs 4")')
+    parser.add_argument("--out-of-core-args", default="",
+                        help='out_of_core 모드(out_of_core.py)에 넘길 추가 인자 (예: --out-of-core-args="--epochs 1")')
+    parser.add_argument("--timeout", type=float, default=3600, help="실행 하나의 제한 시간 (초, 넘으면 timeout으로 기록)")
+    parser.add_argument("--seed", type=int, default=42, help="합성 데이터 난수 시드")
+    parser.add_argument("--data-dir", default="benchmarks/data", help="합성 데이터 CSV 디렉토리 (같은 크기는 재사용)")
+    parser.add_argument("--output-dir", default="benchmarks/results", help="결과 디렉토리")
+    parser.add_argument("--label", help="결과 하위 디렉토리 이름 (기본: 시작 시각)")
+    parser.add_argument("--pipeline-figure-format", choices=FIGURE_FORMATS, default='skip',
+                        help="각 파이프라인 실행의 시각화 저장 형식")
+    parser.add_argument("--figure-format", choices=FIGURE_FORMATS, default='html', help="확장 곡선 저장 형식")
+    parser.add_argument("--baseline", help="비교할 이전 results.json")
+    parser.add_argument("--regression-threshold", type=float, default=1.2,
+                        help="이전 결과 대비 이 배수 이상 늘어나면 회귀로 보고")
+    args = parser.parse_args()
+
+    label = args.label or datetime.now().strftime('%Y%m%d-%H%M%S')
+    output_dir = os.path.join(args.output_dir, label)
+    os.makedirs(output_dir, exist_ok=True)
+    extra_args = {'memory': shlex.split(args.analysis_args), 'out_of_core': shlex.split(args.out_of_core_args)}
+    runs = plan_runs(args.sizes, args.extra_features, args.strategies, args.mode, args.max_in_memory_rows)
+    print(f"벤치마크 실행 {len(runs)}개 → {output_dir}")
+
+    stages, models = [], []
+    for key in runs:
+        n_rows, n_extra, run_mode, strategy = key
+        data_path = ensure_dataset(args.data_dir, n_rows, n_extra, args.seed)
+        run_dir = os.path.join(output_dir, 'runs', f"{n_rows}_{4 + n_extra}_{run_mode}_{strategy}")
+        print(f"\n▶ {n_rows:,}행 × 특성 {4 + n_extra}개, {run_mode}, {strategy}")
+        status, run_log, elapsed = run_pipeline(
+            data_path, run_dir, run_mode, strategy, args.pipeline_figure_format, extra_args[run_mode], args.timeout
+        )
+        run_stages, run_models = collect_records(key, status, run_log, elapsed)
+        stages += run_stages
+        models += run_models
+        print(f"  {status} ({elapsed:.1f}초)")
+        for record in run_stages[1:]:
+            print(f"  {record['stage']:<10} {record['status']:<9} {record['wall_seconds']:>9.2f}초 "
+                  f"CPU {record['cpu_seconds']:>9.2f}초  RSS {record['peak_tree_rss_mb'] or 0:>8.1f}MB  fit {record['fits']}")
+        if status != 'ok':
+            print(f"  로그: {os.path.join(run_dir, 'output.log')}")
+
+    results = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'label': label,
+        'environment': {'python': platform.python_version(), 'platform': platform.platform(), 'cpu_count': os.cpu_count()},
+        'arguments': vars(args),
+        'stages': stages,
+        'models': models
+    }
+    with open(os.path.join(output_dir, 'results.json'), 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2, default=str)
+    pd.DataFrame(stages).to_csv(os.path.join(output_dir, 'stages.csv'), index=False)
+    pd.DataFrame(models).to_csv(os.path.join(output_dir, 'models.csv'), index=False)
+    print(f"\n✓ 결과 저장: {output_dir}/results.json, stages.csv, models.csv")
+
+    if args.figure_format != 'skip':
+        save_curves(stages, models, output_dir, args.figure_format)
+
+    if args.baseline:
+        regressions = compare_with_baseline(stages, args.baseline, args.regression_threshold)
+        print(f"\n기준 결과 비교 ({args.baseline}, {args.regression_threshold}배 이상):")
+        if not regressions:
+            print("✓ 회귀 없음")
+            return 0
+        for item in regressions:
+            print(f"  ✗ {item['rows']:,}행 × {item['n_features']} {item['mode']}/{item['strategy']} {item['stage']} "
+                  f"{item['metric']}: {item['baseline']:.2f} → {item['current']:.2f} ({item['ratio']}배)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
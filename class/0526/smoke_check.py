@@ -0,0 +1,90 @@
+"""
+파이프라인 종단 간(smoke) 점검 스크립트
+
+analysis.py와 out_of_core.py를 작은 설정으로 임시 작업 디렉토리에서 끝까지 실행하고,
+종료 코드와 주요 산출물(models/run_log.json, 시각화 html)을 확인합니다.
+변경 후 두 실행 모드가 모두 끝까지 도는지 빠르게 확인할 때 사용합니다.
+
+사용법:
+    python smoke_check.py
+    python smoke_check.py --data-path datasets/Iris.csv --keep
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# (이름, 스크립트, 인자, 있어야 하는 산출물)
+CHECKS = [
+    ('analysis', 'analysis.py',
+     ['--n-iter', '3', '--figure-format', 'html', '--n-jobs', '1'],
+     ['models/run_log.json', 'visualizations/permutation_importance_best_model.html']),
+    ('analysis_reuse', 'analysis.py',
+     ['--n-iter', '3', '--figure-format', 'html', '--n-jobs', '1', '--reuse-cv-results'],
+     ['models/run_log.json']),
+    ('out_of_core', 'out_of_core.py',
+     ['--chunksize', '50', '--epochs', '2', '--figure-format', 'html'],
+     ['models/run_log.json', 'visualizations/permutation_importance_best_model.html']),
+]
+
+
+def run_check(name, script, args, outputs, data_path, work_dir, timeout):
+    """스크립트 하나를 실행하고 (성공 여부, 메시지)를 반환합니다"""
+    run_dir = os.path.join(work_dir, name)
+    os.makedirs(os.path.join(run_dir, 'datasets'))
+    shutil.copy(data_path, os.path.join(run_dir, 'datasets', os.path.basename(data_path)))
+    command = [sys.executable, os.path.join(SCRIPT_DIR, script),
+               '--data-path', os.path.join('datasets', os.path.basename(data_path)), *args]
+    start = time.perf_counter()
+    try:
+        completed = subprocess.run(command, cwd=run_dir, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return False, f"{timeout}초 안에 끝나지 않음"
+    elapsed = time.perf_counter() - start
+    with open(os.path.join(run_dir, 'output.log'), 'w', encoding='utf-8') as f:
+        f.write(completed.stdout + completed.stderr)
+    if completed.returncode != 0:
+        tail = (completed.stdout + completed.stderr).strip().splitlines()[-5:]
+        return False, f"종료 코드 {completed.returncode}\n    " + "\n    ".join(tail)
+    missing = [path for path in outputs if not os.path.exists(os.path.join(run_dir, path))]
+    if missing:
+        return False, f"산출물 없음: {missing}"
+    return True, f"{elapsed:.1f}초"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="analysis.py / out_of_core.py 종단 간 점검")
+    parser.add_argument("--data-path", default=os.path.join(SCRIPT_DIR, "datasets", "Iris.csv"),
+                        help="점검에 사용할 데이터셋 CSV")
+    parser.add_argument("--timeout", type=int, default=900, help="스크립트 하나의 제한 시간 (초)")
+    parser.add_argument("--keep", action="store_true", help="임시 작업 디렉토리를 지우지 않음 (로그 확인용)")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.data_path):
+        print(f"데이터셋을 찾을 수 없습니다: {args.data_path}")
+        sys.exit(2)
+
+    work_dir = tempfile.mkdtemp(prefix="iris-smoke-")
+    failed = []
+    try:
+        for name, script, script_args, outputs in CHECKS:
+            ok, message = run_check(name, script, script_args, outputs, args.data_path, work_dir, args.timeout)
+            print(f"{'✓' if ok else '❌'} {name}: {message}")
+            if not ok:
+                failed.append(name)
+    finally:
+        if args.keep or failed:
+            print(f"작업 디렉토리: {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
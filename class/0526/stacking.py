@@ -0,0 +1,78 @@
+"""
+out-of-fold 예측 기반 스태킹 모듈
+
+StackingClassifier(cv=5)는 fit 시 베이스 모델마다 cross_val_predict로 5번씩 다시 학습하여
+메타 모델용 out-of-fold(OOF) 예측을 만들고, 전체 데이터로 한 번 더 학습합니다.
+튜닝 단계에서 같은 fold 분할로 이미 OOF 예측과 전체 데이터 재학습 모델을 얻었다면
+이 모듈의 OOFStackingClassifier로 메타 모델만 학습하여 같은 스태킹 모델을 만들 수 있습니다.
+"""
+
+import numpy as np
+from sklearn.base import BaseEstimator, ClassifierMixin, clone
+from sklearn.model_selection import cross_val_predict
+from sklearn.utils.validation import check_is_fitted
+
+
+def stack_features(probas):
+    """
+    베이스 모델별 predict_proba 결과를 메타 모델 입력으로 이어 붙입니다.
+    StackingClassifier와 마찬가지로 이진 분류에서는 첫 번째 클래스 열을 버립니다.
+    """
+    if probas[0].shape[1] == 2:
+        probas = [proba[:, 1:] for proba in probas]
+    return np.hstack(probas)
+
+
+class OOFStackingClassifier(ClassifierMixin, BaseEstimator):
+    """
+    이미 학습된 베이스 모델과 그 OOF 예측으로 메타 모델만 학습하는 스태킹 분류기
+
+    Args:
+        estimators: [(이름, 전체 학습 데이터로 학습된 베이스 모델)]
+        final_estimator: 메타 모델 (OOF 예측으로 학습)
+    """
+
+    def __init__(self, estimators, final_estimator):
+        self.estimators = estimators
+        self.final_estimator = final_estimator
+
+    def fit_from_oof(self, oof_probas, y, fitted_final_estimator=None):
+        """
+        베이스 모델별 OOF predict_proba 목록으로 메타 모델을 학습합니다 (베이스 모델은 다시 학습하지 않음)
+        fitted_final_estimator가 주어지면 (학습 캐시 등에서 stack_features(oof_probas)로 이미 학습한) 그 메타 모델을 사용합니다.
+        """
+        return self._fit_final(self.estimators, oof_probas, y, fitted_final_estimator)
+
+    def fit(self, X, y):
+        """
+        StackingClassifier(cv=5)와 같은 방식으로 베이스 모델까지 학습합니다.
+        OOF 예측이 이미 있으면 fit_from_oof를 사용하세요.
+        """
+        fitted = [(name, clone(estimator).fit(X, y)) for name, estimator in self.estimators]
+        oof_probas = [
+            cross_val_predict(clone(estimator), X, y, cv=5, method='predict_proba')
+            for _, estimator in self.estimators
+        ]
+        return self._fit_final(fitted, oof_probas, y)
+
+    def _fit_final(self, fitted, oof_probas, y, fitted_final_estimator=None):
+        self.estimators_ = [estimator for _, estimator in fitted]
+        self.named_estimators_ = dict(fitted)
+        self.classes_ = self.estimators_[0].classes_
+        if hasattr(self.estimators_[0], 'feature_names_in_'):
+            self.feature_names_in_ = self.estimators_[0].feature_names_in_
+        if fitted_final_estimator is None:
+            fitted_final_estimator = clone(self.final_estimator).fit(stack_features(oof_probas), y)
+        self.final_estimator_ = fitted_final_estimator
+        return self
+
+    def transform(self, X):
+        """베이스 모델 예측을 메타 모델 입력 형태로 변환합니다"""
+        check_is_fitted(self, 'final_estimator_')
+        return stack_features([estimator.predict_proba(X) for estimator in self.estimators_])
+
+    def predict_proba(self, X):
+        return self.final_estimator_.predict_proba(self.transform(X))
+
+    def predict(self, X):
+        return self.final_estimator_.predict(self.transform(X))
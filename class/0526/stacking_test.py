@@ -0,0 +1,85 @@
+"""
+stacking.py OOF 스태킹이 sklearn StackingClassifier / cross_val_predict 기준 계산과 같은지 확인하는 테스트
+
+실행:
+    python -m pytest stacking_test.py -q
+"""
+
+import numpy as np
+import pytest
+from sklearn.base import clone
+from sklearn.datasets import load_iris
+from sklearn.ensemble import RandomForestClassifier, StackingClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import StratifiedKFold, cross_val_predict
+from sklearn.tree import DecisionTreeClassifier
+
+from stacking import OOFStackingClassifier, stack_features
+from tuning import build_search
+
+BASE_ESTIMATORS = [
+    ('DecisionTree', DecisionTreeClassifier(max_depth=3, random_state=0)),
+    ('LogisticRegression', LogisticRegression(max_iter=1000)),
+]
+
+
+def _data(binary=False):
+    X, y = load_iris(return_X_y=True)
+    if binary:
+        X, y = X[y > 0], y[y > 0]
+    return X, y
+
+
+def _reference(X, y):
+    return StackingClassifier(BASE_ESTIMATORS, final_estimator=LogisticRegression(), cv=5,
+                              stack_method='predict_proba').fit(X, y)
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_fit_matches_stacking_classifier(binary):
+    """베이스 모델까지 학습하는 fit은 StackingClassifier(cv=5)와 같은 메타 입력과 예측"""
+    X, y = _data(binary)
+    reference = _reference(X, y)
+    stacked = OOFStackingClassifier(BASE_ESTIMATORS, final_estimator=LogisticRegression()).fit(X, y)
+    np.testing.assert_array_equal(stacked.transform(X), reference.transform(X))
+    np.testing.assert_allclose(stacked.predict_proba(X), reference.predict_proba(X), rtol=1e-10)
+    np.testing.assert_array_equal(stacked.predict(X), reference.predict(X))
+    np.testing.assert_array_equal(stacked.classes_, reference.classes_)
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_fit_from_oof_matches_reference_meta_model(binary):
+    """미리 계산한 OOF 예측으로 메타 모델만 학습해도 기준 계산과 같은 메타 모델"""
+    X, y = _data(binary)
+    fitted = [(name, clone(estimator).fit(X, y)) for name, estimator in BASE_ESTIMATORS]
+    oof_probas = [cross_val_predict(clone(estimator), X, y, cv=5, method='predict_proba')
+                  for _, estimator in BASE_ESTIMATORS]
+    stacked = OOFStackingClassifier(fitted, final_estimator=LogisticRegression()).fit_from_oof(oof_probas, y)
+
+    reference = _reference(X, y)
+    np.testing.assert_allclose(stacked.final_estimator_.coef_, reference.final_estimator_.coef_, rtol=1e-10)
+    np.testing.assert_allclose(stacked.predict_proba(X), reference.predict_proba(X), rtol=1e-10)
+    # 베이스 모델은 다시 학습하지 않고 주어진 객체를 그대로 사용
+    assert stacked.estimators_[0] is fitted[0][1]
+
+
+def test_stack_features_drops_first_binary_column():
+    probas = [np.array([[0.2, 0.8], [0.6, 0.4]]), np.array([[0.1, 0.9], [0.7, 0.3]])]
+    np.testing.assert_array_equal(stack_features(probas), [[0.8, 0.9], [0.4, 0.3]])
+    multiclass = [np.full((2, 3), 1 / 3), np.full((2, 3), 1 / 3)]
+    assert stack_features(multiclass).shape == (2, 6)
+
+
+@pytest.mark.parametrize("strategy", ['random', 'warm_start'])
+def test_search_oof_matches_cross_val_predict(strategy):
+    """탐색 중에 모은 최적 후보의 OOF 예측은 최적 파라미터로 다시 실행한 cross_val_predict와 같음"""
+    X, y = _data()
+    params = {'n_estimators': [5, 10, 20], 'max_depth': [2, 3, None], 'min_samples_leaf': [1, 3]}
+    search = build_search(RandomForestClassifier(random_state=0), params, strategy=strategy, n_iter=4, cv=5,
+                          random_state=0, n_jobs=1, return_oof=True).fit(X, y)
+    expected = cross_val_predict(
+        RandomForestClassifier(random_state=0).set_params(**search.best_params_), X, y,
+        cv=StratifiedKFold(5), method='predict_proba'
+    )
+    assert search.oof_proba_.shape == expected.shape
+    np.testing.assert_allclose(search.oof_proba_, expected, rtol=0, atol=1e-6)
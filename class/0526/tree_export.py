@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+트리 앙상블을 평평한 배열 기반 노드 테이블로 내보내는 모듈
+
+학습된 RandomForest / GradientBoosting / DecisionTree 분류기의 모든 트리 노드를
+하나의 연속된 테이블(특성 번호, 임계값, 왼쪽/오른쪽 자식, 결측값 방향)과
+리프 값 테이블로 펼쳐 파일 하나에 저장합니다.
+예측은 모든 행 × 모든 트리의 현재 노드를 한 배열로 두고 깊이마다 한 번씩 numpy로 갱신하므로
+sklearn의 호출당 오버헤드(입력 검증, joblib 스레드 분배, 트리별 Python 호출)가 없어
+단건·소량 예측 지연 시간이 크게 줄어듭니다.
+
+sklearn과 같은 결과를 내기 위해:
+- 입력은 sklearn처럼 float32로 변환하고, float64 임계값 t는 "t 이하인 가장 큰 float32"로 저장합니다
+  (float32 x에 대해 x <= t 와 x <= float32_floor(t)는 항상 같음).
+- 랜덤 포레스트는 트리별 정규화된 리프 확률을 트리 순서대로 더한 뒤 트리 수로 나누고,
+  그래디언트 부스팅은 초기 예측값에 learning_rate × 리프 값을 단계 순서대로 더합니다.
+  따라서 예측 레이블과 포레스트 확률, 부스팅 decision_function은 비트 단위로 같고,
+  부스팅 확률은 softmax/sigmoid 구현 차이로 부동소수점 반올림 범위 안에서만 다를 수 있습니다.
+
+파일은 헤더(JSON) 뒤에 64바이트 정렬된 배열을 이어 붙인 형식이며, mmap으로 열어 복사 없이 사용합니다.
+
+실행 예:
+    python tree_export.py --model-dir models
+    python tree_export.py --model-dir models --model RandomForest --benchmark
+"""
+
+import argparse
+import glob
+import json
+import os
+import time
+
+import numpy as np
+from scipy.special import expit
+
+from artifacts import add_manifest_files, has_object, load_object
+
+MAGIC = b"TREETBL1"
+FORMAT_VERSION = 2
+ALIGNMENT = 64
+# 한 번에 순회하는 (행 × 트리) 원소 수 상한 (중간 배열 메모리 제한)
+BLOCK_ELEMENTS = 1 << 20
+TABLE_SUFFIX = "_trees.bin"
+
+
+def _float32_floor(thresholds: np.ndarray) -> np.ndarray:
+    """float64 임계값을 그 값 이하인 가장 큰 float32로 변환"""
+    rounded = thresholds.astype(np.float32)
+    too_large = rounded.astype(np.float64) > thresholds
+    rounded[too_large] = np.nextafter(rounded[too_large], np.float32(-np.inf))
+    return rounded
+
+
+def _estimator_trees(model):
+    """
+    모델 종류와 (트리, 출력 번호) 목록을 반환합니다.
+    트리 순서는 sklearn이 예측값을 누적하는 순서와 같습니다.
+    """
+    from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier, ExtraTreesClassifier
+    from sklearn.tree import DecisionTreeClassifier
+
+    if getattr(model, 'n_outputs_', 1) != 1:
+        raise ValueError("다중 출력 모델은 지원하지 않습니다")
+    if isinstance(model, (RandomForestClassifier, ExtraTreesClassifier)):
+        return 'forest', [(estimator.tree_, 0) for estimator in model.estimators_]
+    if isinstance(model, DecisionTreeClassifier):
+        return 'forest', [(model.tree_, 0)]
+    if isinstance(model, GradientBoostingClassifier):
+        from sklearn.dummy import DummyClassifier
+        # 기본 init(사전 확률)과 'zero'만 행과 무관한 상수 초기 예측값이라 테이블에 담을 수 있음
+        if not (model.init_ == 'zero' or isinstance(model.init_, DummyClassifier)):
+            raise ValueError("init 추정기를 직접 지정한 GradientBoosting 모델은 지원하지 않습니다")
+        return 'gradient_boosting', [
+            (model.estimators_[i, k].tree_, k)
+            for i in range(model.estimators_.shape[0])
+            for k in range(model.estimators_.shape[1])
+        ]
+    raise ValueError(f"트리 테이블로 내보낼 수 없는 모델입니다: {type(model).__name__}")
+
+
+class FlatTreeEnsemble:
+    """
+    평평한 노드 테이블 기반 트리 앙상블 분류기
+
+    노드 번호는 모든 트리의 내부 노드가 먼저, 리프가 뒤에 오도록 다시 매깁니다.
+    리프는 자기 자신을 자식으로 가리키므로 순회는 최대 깊이만큼 반복하면 되고,
+    리프 값은 리프에만 저장합니다 (leaf_values[node - n_internal]).
+    """
+
+    def __init__(self, header: dict, arrays: dict):
+        self.header = header
+        self.kind = header['kind']
+        self.model_type = header['model_type']
+        self.classes_ = np.asarray(header['classes'], dtype=header['classes_dtype'])
+        self.n_features_in_ = header['n_features']
+        if header.get('feature_names') is not None:
+            self.feature_names_in_ = np.asarray(header['feature_names'], dtype=object)
+        self.max_depth = header['max_depth']
+        self.n_internal = header['n_internal']
+        self.learning_rate = header.get('learning_rate')
+        for name, array in arrays.items():
+            setattr(self, name, array)
+
+    @property
+    def n_trees(self):
+        return len(self.roots)
+
+    @classmethod
+    def from_estimator(cls, model):
+        """학습된 sklearn 트리 모델로 노드 테이블 생성"""
+        kind, trees = _estimator_trees(model)
+
+        # 트리별 노드 배열을 이어 붙이고 자식 번호를 전체 번호로 변환
+        offsets = np.cumsum([0] + [tree.node_count for tree, _ in trees])
+        left = np.concatenate([tree.children_left + offset for (tree, _), offset in zip(trees, offsets)])
+        right = np.concatenate([tree.children_right + offset for (tree, _), offset in zip(trees, offsets)])
+        feature = np.concatenate([tree.feature for tree, _ in trees])
+        threshold = np.concatenate([tree.threshold for tree, _ in trees])
+        missing_left = np.concatenate([
+            tree.missing_go_to_left if kind == 'forest' else np.zeros(tree.node_count, dtype=np.uint8)
+            for tree, _ in trees
+        ]).astype(np.uint8)
+        is_leaf = np.concatenate([tree.children_left == -1 for tree, _ in trees])
+
+        # 내부 노드 먼저, 리프 나중 순서로 번호 재부여
+        n_internal = int((~is_leaf).sum())
+        new_ids = np.where(is_leaf, n_internal + np.cumsum(is_leaf) - 1, np.cumsum(~is_leaf) - 1)
+        order = np.argsort(new_ids, kind='stable')
+        own_ids = new_ids[order]
+        internal = ~is_leaf[order]
+        # 리프는 자기 자신을 가리키고 임계값 +inf로 항상 왼쪽(자기 자신)으로 이동
+        children_left = np.where(internal, new_ids[np.maximum(left[order], 0)], own_ids).astype(np.int32)
+        children_right = np.where(internal, new_ids[np.maximum(right[order], 0)], own_ids).astype(np.int32)
+        features = np.where(internal, feature[order], 0).astype(np.int32)
+        thresholds = np.where(internal, _float32_floor(threshold[order]), np.float32(np.inf)).astype(np.float32)
+        missing_go_to_left = np.where(internal, missing_left[order], 1).astype(np.uint8)
+        roots = new_ids[offsets[:-1]].astype(np.int32)
+
+        leaf_values = []
+        for tree, _ in trees:
+            leaf_mask = tree.children_left == -1
+            if kind == 'forest':
+                # DecisionTreeClassifier.predict_proba와 같은 방식으로 리프 확률 정규화
+                proba = tree.value[leaf_mask, 0, :model.n_classes_].copy()
+                normalizer = proba.sum(axis=1)[:, np.newaxis]
+                normalizer[normalizer == 0.0] = 1.0
+                proba /= normalizer
+                leaf_values.append(proba)
+            else:
+                leaf_values.append(tree.value[leaf_mask, 0, :1])
+        arrays = {
+            'roots': roots,
+            'features': features,
+            'thresholds': thresholds,
+            # 노드 n의 자식은 children[n, 0](왼쪽), children[n, 1](오른쪽)
+            'children': np.ascontiguousarray(np.column_stack([children_left, children_right])),
+            'missing_go_to_left': missing_go_to_left,
+            'leaf_values': np.ascontiguousarray(np.concatenate(leaf_values), dtype=np.float64)
+        }
+
+        header = {
+            'kind': kind,
+            'model_type': type(model).__name__,
+            'classes': model.classes_.tolist(),
+            'classes_dtype': model.classes_.dtype.str,
+            'n_features': int(model.n_features_in_),
+            'feature_names': model.feature_names_in_.tolist() if hasattr(model, 'feature_names_in_') else None,
+            'max_depth': int(max(tree.max_depth for tree, _ in trees)),
+            'n_internal': n_internal
+        }
+        if kind == 'gradient_boosting':
+            arrays['output_index'] = np.array([k for _, k in trees], dtype=np.int32)
+            init = model._raw_predict_init(np.zeros((1, model.n_features_in_), dtype=np.float32))
+            arrays['init_raw'] = np.ascontiguousarray(init[0], dtype=np.float64)
+            header['learning_rate'] = float(model.learning_rate)
+        return cls(header, arrays)
+
+    def _as_float32(self, X):
+        if hasattr(X, 'columns'):
+            if hasattr(self, 'feature_names_in_') and list(X.columns) != list(self.feature_names_in_):
+                X = X[list(self.feature_names_in_)]
+            X = X.to_numpy(dtype=np.float32)
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        if X.ndim != 2 or X.shape[1] != self.n_features_in_:
+            raise ValueError(f"입력 특성 수가 {self.n_features_in_}개여야 합니다: {X.shape}")
+        return X
+
+    def apply(self, X) -> np.ndarray:
+        """각 행이 각 트리에서 도달하는 리프 번호 (n_samples, n_trees)"""
+        X = self._as_float32(X)
+        has_missing = bool(np.isnan(X).any())
+        # children[2n + go_right]로 한 번에 조회 (파일의 mmap 배열을 그대로 평평하게 본 것이라 복사 없음)
+        children = self.children.reshape(-1)
+        leaves = np.empty((X.shape[0], self.n_trees), dtype=np.int32)
+        block = max(1, BLOCK_ELEMENTS // self.n_trees)
+        for start in range(0, X.shape[0], block):
+            X_block = X[start:start + block]
+            flat = X_block.ravel()
+            row_base = (np.arange(X_block.shape[0], dtype=np.intp) * X_block.shape[1])[:, np.newaxis]
+            node = np.repeat(self.roots[np.newaxis, :], X_block.shape[0], axis=0)
+            for _ in range(self.max_depth):
+                values = flat.take(row_base + self.features.take(node))
+                go_right = ~(values <= self.thresholds.take(node))
+                if has_missing:
+                    missing = np.isnan(values)
+                    go_right[missing] = self.missing_go_to_left.take(node[missing]) == 0
+                node = children.take(2 * node + go_right)
+                # 모든 행이 리프에 도달했으면 남은 깊이는 생략
+                if node.min() >= self.n_internal:
+                    break
+            leaves[start:start + block] = node
+        return leaves
+
+    def decision_function(self, X) -> np.ndarray:
+        """그래디언트 부스팅의 raw 예측값 (sklearn decision_function과 동일)"""
+        if self.kind != 'gradient_boosting':
+            raise AttributeError("decision_function은 GradientBoosting 모델에서만 사용할 수 있습니다")
+        leaf_values = self.leaf_values[self.apply(X) - self.n_internal, 0]
+        raw = np.tile(self.init_raw, (leaf_values.shape[0], 1))
+        for t, k in enumerate(self.output_index):
+            raw[:, k] += self.learning_rate * leaf_values[:, t]
+        return raw.ravel() if raw.shape[1] == 1 else raw
+
+    def predict_proba(self, X) -> np.ndarray:
+        if self.kind == 'gradient_boosting':
+            raw = self.decision_function(X)
+            if raw.ndim == 1:
+                proba = expit(raw)
+                return np.column_stack([1 - proba, proba])
+            exp = np.exp(raw - raw.max(axis=1, keepdims=True))
+            return exp / exp.sum(axis=1, keepdims=True)
+
+        leaf_index = self.apply(X) - self.n_internal
+        # 포레스트와 같은 순서로 트리별 확률을 누적하여 합계가 비트 단위로 같도록 함
+        proba = np.zeros((leaf_index.shape[0], len(self.classes_)), dtype=np.float64)
+        for t in range(self.n_trees):
+            proba += self.leaf_values[leaf_index[:, t]]
+        if self.n_trees > 1:
+            proba /= self.n_trees
+        return proba
+
+    def predict(self, X) -> np.ndarray:
+        if self.kind == 'gradient_boosting':
+            raw = self.decision_function(X)
+            encoded = (raw >= 0).astype(int) if raw.ndim == 1 else np.argmax(raw, axis=1)
+        else:
+            encoded = np.argmax(self.predict_proba(X), axis=1)
+        return self.classes_.take(encoded, axis=0)
+
+    def save(self, path: str):
+        """헤더와 64바이트 정렬 배열을 파일 하나에 저장합니다"""
+        header = dict(self.header, version=FORMAT_VERSION, arrays={})
+        names = ['roots', 'features', 'thresholds', 'children',
+                 'missing_go_to_left', 'leaf_values', 'output_index', 'init_raw']
+        arrays = {name: getattr(self, name) for name in names if hasattr(self, name)}
+        offset = 0
+        for name, array in arrays.items():
+            offset = -(-offset // ALIGNMENT) * ALIGNMENT
+            header['arrays'][name] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset}
+            offset += array.nbytes
+        header_bytes = json.dumps(header, ensure_ascii=False).encode('utf-8')
+        data_start = -(-(len(MAGIC) + 8 + len(header_bytes)) // ALIGNMENT) * ALIGNMENT
+
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(MAGIC)
+            f.write(len(header_bytes).to_bytes(8, 'little'))
+            f.write(header_bytes)
+            for name, array in arrays.items():
+                f.seek(data_start + header['arrays'][name]['offset'])
+                f.write(np.ascontiguousarray(array).tobytes())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True):
+        """
+        노드 테이블 파일을 불러옵니다.
+        mmap=True이면 파일을 읽기 전용으로 매핑하여 여러 프로세스가 같은 페이지를 공유합니다.
+        """
+        with open(path, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"트리 테이블 파일이 아닙니다: {path}")
+            header_size = int.from_bytes(f.read(8), 'little')
+            header = json.loads(f.read(header_size).decode('utf-8'))
+        if header.get('version') != FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 트리 테이블 버전입니다: {header.get('version')}")
+        data_start = -(-(len(MAGIC) + 8 + header_size) // ALIGNMENT) * ALIGNMENT
+
+        buffer = np.memmap(path, dtype=np.uint8, mode='r') if mmap else np.fromfile(path, dtype=np.uint8)
+        arrays = {}
+        for name, spec in header['arrays'].items():
+            arrays[name] = np.ndarray(
+                shape=tuple(spec['shape']), dtype=np.dtype(spec['dtype']),
+                buffer=buffer, offset=data_start + spec['offset']
+            )
+        return cls(header, arrays)
+
+
+def table_path(model_dir: str, model_name: str) -> str:
+    return os.path.join(model_dir, f"{model_name.lower()}{TABLE_SUFFIX}")
+
+
+def remove_tables(model_dir: str):
+    """이전 실행이 남긴 노드 테이블을 지웁니다 (새로 저장한 모델과 맞지 않는 테이블이 서빙되지 않도록)"""
+    for path in glob.glob(os.path.join(model_dir, f"*{TABLE_SUFFIX}")):
+        os.remove(path)
+
+
+def export_models(model_dir: str = 'models', model_names=None) -> dict:
+    """
+    모델 디렉토리의 트리 모델을 노드 테이블 파일로 내보내고 manifest.json에 기록합니다
+    (manifest에 없는 테이블은 load_artifacts가 불러오지 않음).
+
+    Returns:
+        {모델 이름: 파일 경로} (지원하지 않는 모델은 제외)
+    """
+    summary = load_object(model_dir, "results_summary")
+    exported = {}
+    for name in model_names or summary['model_results']:
+        if not has_object(model_dir, f"{name.lower()}_model"):
+            continue
+        model = load_object(model_dir, f"{name.lower()}_model")
+        try:
+            table = FlatTreeEnsemble.from_estimator(model)
+        except ValueError:
+            continue
+        path = table_path(model_dir, name)
+        table.save(path)
+        exported[name] = path
+    if exported:
+        add_manifest_files(model_dir, [os.path.basename(path) for path in exported.values()])
+    return exported
+
+
+def benchmark(model, table: FlatTreeEnsemble, X: np.ndarray, batch_sizes=(1, 16, 256, 4096), repeats=50) -> list:
+    """
+    배치 크기별로 model.predict와 노드 테이블 예측의 호출당 지연 시간을 비교하고 결과가 같은지 확인합니다.
+    """
+    results = []
+    for batch_size in batch_sizes:
+        X_batch = X[:batch_size]
+        expected = model.predict(X_batch)
+        actual = table.predict(X_batch)
+        if not np.array_equal(expected, actual):
+            raise AssertionError(f"{batch_size}행 배치에서 sklearn과 예측이 다릅니다")
+
+        row = {'batch_size': len(X_batch), 'identical': True}
+        for label, predict in (('sklearn', model.predict), ('table', table.predict)):
+            n_repeats = max(3, repeats // max(1, len(X_batch) // 256))
+            timings = []
+            for _ in range(n_repeats):
+                start = time.perf_counter()
+                predict(X_batch)
+                timings.append(time.perf_counter() - start)
+            row[f'{label}_ms'] = float(np.median(timings) * 1000)
+        row['speedup'] = row['sklearn_ms'] / row['table_ms']
+        results.append(row)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="트리 앙상블을 평평한 노드 테이블로 내보내기")
+    parser.add_argument("--model-dir", default="models", help="save_models가 만든 모델 디렉토리")
+    parser.add_argument("--model", action="append", help="내보낼 모델 이름 (여러 번 지정 가능, 기본: 모든 트리 모델)")
+    parser.add_argument("--benchmark", action="store_true", help="내보낸 뒤 model.predict와 지연 시간 비교")
+    parser.add_argument("--benchmark-rows", type=int, default=4096, help="벤치마크용 무작위 입력 행 수")
+    args = parser.parse_args()
+
+    exported = export_models(args.model_dir, args.model)
+    if not exported:
+        print("내보낼 트리 모델이 없습니다")
+    for name, path in exported.items():
+        table = FlatTreeEnsemble.load(path)
+        print(f"✓ {name}: {path} ({os.path.getsize(path) / 1024:.1f}KB, "
+              f"트리 {table.n_trees}개, 노드 {len(table.features):,}개, 최대 깊이 {table.max_depth})")
+
+        if args.benchmark:
+            model = load_object(args.model_dir, f"{name.lower()}_model")
+            # 학습 데이터 범위를 모르므로 임계값 분포에서 입력을 뽑아 여러 경로를 지나게 함
+            rng = np.random.default_rng(0)
+            X = np.empty((args.benchmark_rows, table.n_features_in_), dtype=np.float32)
+            for j in range(table.n_features_in_):
+                splits = table.thresholds[:table.n_internal][table.features[:table.n_internal] == j]
+                X[:, j] = rng.choice(splits, args.benchmark_rows) + rng.normal(0, 0.1, args.benchmark_rows) \
+                    if len(splits) else rng.normal(size=args.benchmark_rows)
+            if hasattr(model, 'feature_names_in_'):
+                import pandas as pd
+                X = pd.DataFrame(X, columns=model.feature_names_in_)
+            for row in benchmark(model, table, X):
+                print(f"  배치 {row['batch_size']:>5}행: sklearn {row['sklearn_ms']:8.3f}ms, "
+                      f"테이블 {row['table_ms']:8.3f}ms ({row['speedup']:.1f}배, 예측 일치)")
@@ -0,0 +1,108 @@
+"""
+tree_export.py 노드 테이블 예측이 sklearn 예측과 같은지 확인하는 테스트
+
+실행:
+    python -m pytest tree_export_test.py -q
+"""
+
+import numpy as np
+import pytest
+from sklearn.datasets import make_classification
+from sklearn.ensemble import ExtraTreesClassifier, GradientBoostingClassifier, RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.tree import DecisionTreeClassifier
+
+import tree_export
+from tree_export import FlatTreeEnsemble
+
+
+def _data(n_classes, missing=False):
+    X, y = make_classification(n_samples=600, n_features=8, n_informative=5, n_classes=n_classes,
+                               random_state=0)
+    # float32로 바꿨을 때 임계값 경계에 걸리는 값이 생기도록 잘게 반올림한 값과 원래 값을 섞음
+    X[::3] = np.round(X[::3], 2)
+    if missing:
+        X[np.random.RandomState(0).rand(*X.shape) < 0.1] = np.nan
+    return X[:400], y[:400], X[400:]
+
+
+FOREST_MODELS = [
+    DecisionTreeClassifier(random_state=0),
+    RandomForestClassifier(n_estimators=30, random_state=0),
+    ExtraTreesClassifier(n_estimators=30, random_state=0),
+]
+
+
+@pytest.mark.parametrize("missing", [False, True])
+@pytest.mark.parametrize("n_classes", [2, 3])
+@pytest.mark.parametrize("model", FOREST_MODELS, ids=lambda model: type(model).__name__)
+def test_forest_matches_sklearn_exactly(model, n_classes, missing):
+    """포레스트/결정 트리: 예측 레이블과 확률이 비트 단위로 같음 (결측값 포함)"""
+    X_train, y_train, X_test = _data(n_classes, missing)
+    model = model.fit(X_train, y_train)
+    table = FlatTreeEnsemble.from_estimator(model)
+    np.testing.assert_array_equal(table.apply(X_test)[:, 0] >= table.n_internal, True)
+    np.testing.assert_array_equal(table.predict_proba(X_test), model.predict_proba(X_test))
+    np.testing.assert_array_equal(table.predict(X_test), model.predict(X_test))
+
+
+@pytest.mark.parametrize("n_classes", [2, 3])
+def test_gradient_boosting_matches_sklearn(n_classes):
+    """부스팅: 레이블과 decision_function은 비트 단위로 같고, 확률은 반올림 범위 안에서 같음"""
+    X_train, y_train, X_test = _data(n_classes)
+    model = GradientBoostingClassifier(n_estimators=40, max_depth=3, random_state=0).fit(X_train, y_train)
+    table = FlatTreeEnsemble.from_estimator(model)
+    np.testing.assert_array_equal(table.decision_function(X_test), model.decision_function(X_test))
+    np.testing.assert_array_equal(table.predict(X_test), model.predict(X_test))
+    np.testing.assert_allclose(table.predict_proba(X_test), model.predict_proba(X_test), rtol=1e-12, atol=1e-15)
+
+
+def test_string_labels_and_block_boundaries(monkeypatch):
+    """문자열 클래스 레이블을 그대로 돌려주고, 여러 블록으로 나눠 순회해도 결과가 같음"""
+    X_train, y_train, X_test = _data(3)
+    labels = np.array(['setosa', 'versicolor', 'virginica'], dtype=object)[y_train]
+    model = RandomForestClassifier(n_estimators=20, random_state=0).fit(X_train, labels)
+    table = FlatTreeEnsemble.from_estimator(model)
+    expected = model.predict(X_test)
+    monkeypatch.setattr(tree_export, 'BLOCK_ELEMENTS', 7 * table.n_trees)
+    np.testing.assert_array_equal(table.predict(X_test), expected)
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load_round_trip(tmp_path, mmap):
+    """파일로 저장했다가 불러온 테이블도 같은 예측값"""
+    X_train, y_train, X_test = _data(3, missing=True)
+    model = RandomForestClassifier(n_estimators=20, random_state=0).fit(X_train, y_train)
+    path = str(tmp_path / "randomforest_trees.bin")
+    FlatTreeEnsemble.from_estimator(model).save(path)
+    table = FlatTreeEnsemble.load(path, mmap=mmap)
+    if mmap:
+        # 매핑은 페이지 단위로 시작하므로 파일 안의 64바이트 정렬이 메모리 주소에서도 유지됨
+        for array in (table.roots, table.features, table.thresholds, table.children, table.leaf_values):
+            assert array.ctypes.data % tree_export.ALIGNMENT == 0
+    np.testing.assert_array_equal(table.predict_proba(X_test), model.predict_proba(X_test))
+
+
+def test_load_rejects_other_files_and_versions(tmp_path, monkeypatch):
+    """매직 바이트가 다르거나 형식 버전이 다른 파일은 ValueError"""
+    not_a_table = tmp_path / "other.bin"
+    not_a_table.write_bytes(b"NOTATREE" + bytes(64))
+    with pytest.raises(ValueError, match="트리 테이블 파일이 아닙니다"):
+        FlatTreeEnsemble.load(str(not_a_table))
+
+    X_train, y_train, _ = _data(2)
+    path = str(tmp_path / "decisiontree_trees.bin")
+    FlatTreeEnsemble.from_estimator(DecisionTreeClassifier(random_state=0).fit(X_train, y_train)).save(path)
+    monkeypatch.setattr(tree_export, 'FORMAT_VERSION', tree_export.FORMAT_VERSION + 1)
+    with pytest.raises(ValueError, match="버전"):
+        FlatTreeEnsemble.load(path)
+
+
+def test_unsupported_models_are_rejected():
+    X_train, y_train, _ = _data(2)
+    with pytest.raises(ValueError, match="내보낼 수 없는 모델"):
+        FlatTreeEnsemble.from_estimator(LogisticRegression().fit(X_train, y_train))
+    with pytest.raises(ValueError, match="init 추정기"):
+        FlatTreeEnsemble.from_estimator(
+            GradientBoostingClassifier(n_estimators=5, init=LogisticRegression()).fit(X_train, y_train)
+        )
@@ -0,0 +1,784 @@
+"""
+하이퍼파라미터 튜닝 전략 모듈
+- random: RandomizedSearchCV (모든 후보를 전체 데이터/전체 모델 크기로 학습)
+- halving: HalvingRandomSearchCV (successive halving, 적은 자원에서 후보를 걸러낸 뒤 살아남은 후보만 키움)
+- hyperband: 시작 자원이 서로 다른 여러 successive halving 구간(bracket)을 실행하여 가장 좋은 결과 선택
+- warm_start: n_estimators 외 파라미터 조합마다 한 번만 학습하면서 warm_start로 트리를 추가해
+  요청된 n_estimators 크기마다 점수를 매김 (n_estimators를 탐색하지 않는 모델은 random과 동일)
+
+자원(resource)은 학습 샘플 수('n_samples') 또는 앙상블의 트리 개수('n_estimators')를 사용합니다.
+"""
+
+import math
+import time
+import traceback
+import warnings
+from contextlib import nullcontext
+
+import numpy as np
+from joblib import Parallel, cpu_count, delayed
+from sklearn.base import BaseEstimator, clone
+from sklearn.exceptions import FitFailedWarning
+# HalvingRandomSearchCV는 아직 실험적 API이므로 명시적으로 활성화
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.metrics import get_scorer
+from sklearn.model_selection import (
+    RandomizedSearchCV, HalvingRandomSearchCV, ParameterSampler, check_cv, cross_validate,
+    train_test_split
+)
+from sklearn.utils import _safe_indexing, check_random_state
+from scipy.stats import rankdata
+from threadpoolctl import threadpool_limits
+
+from fit_cache import FitCache, count_fits, data_fingerprint
+
+TUNING_STRATEGIES = ('random', 'halving', 'hyperband', 'warm_start')
+TUNING_RESOURCES = ('n_samples', 'n_estimators')
+# sequential: 모델별로 차례대로 탐색 / shared: 모든 모델의 후보 학습을 하나의 워커 풀에서 실행
+# distributed: shared와 같은 작업을 파일 작업 큐(distributed.py)에 올려 여러 노드의 워커가 실행
+TUNING_SCHEDULERS = ('sequential', 'shared', 'distributed')
+# 후보 학습 한 번의 상대 비용: 모델 종류 -> (비용에 곱할 크기 파라미터, 단위 비용)
+# 단위는 RandomForest 트리 1개. 5000행 × 10특성 × 3클래스 데이터에서 단일 스레드로 잰 학습 시간 비율
+FAMILY_COSTS = {
+    'RandomForestClassifier': ('n_estimators', 1.0),
+    'ExtraTreesClassifier': ('n_estimators', 0.3),
+    'GradientBoostingClassifier': ('n_estimators', 5.0),
+    'HistGradientBoostingClassifier': ('max_iter', 0.4),
+    'DecisionTreeClassifier': (None, 4.0),
+    'LogisticRegression': (None, 0.7),
+    'SVC': (None, 20.0),
+    'MLPClassifier': ('max_iter', 0.75),
+}
+
+
+def resolve_resource(model, params, resource='n_samples'):
+    """
+    모델에 적용할 자원과 탐색 공간을 결정합니다.
+    'n_estimators' 자원은 해당 파라미터가 있는 앙상블 모델에만 적용하고(탐색 공간에서는 제외),
+    나머지 모델은 'n_samples'로 대체합니다.
+
+    Returns:
+        (자원 이름, 탐색 파라미터, 최대 자원)
+    """
+    if resource not in TUNING_RESOURCES:
+        raise ValueError(f"지원하지 않는 자원입니다: {resource} (선택: {TUNING_RESOURCES})")
+
+    if resource == 'n_estimators' and 'n_estimators' in model.get_params():
+        sizes = params.get('n_estimators', [model.get_params()['n_estimators']])
+        search_params = {k: v for k, v in params.items() if k != 'n_estimators'}
+        return 'n_estimators', search_params, max(sizes)
+    return 'n_samples', params, 'auto'
+
+
+class HyperbandSearchCV(BaseEstimator):
+    """
+    Hyperband 탐색
+
+    자원 비율 R/r에 따라 s_max+1개(최대 max_brackets개)의 구간을 만들고, 구간 s에서는 최대 자원의 1/factor^s 부터 시작하는
+    successive halving(HalvingRandomSearchCV)을 실행합니다. 각 구간의 후보 수는 Hyperband 비율을
+    유지하면서 전체 후보 수의 합이 n_iter가 되도록 맞춥니다(랜덤 탐색과 같은 후보 수).
+
+    구간마다 마지막 반복의 자원이 다르므로 점수를 그대로 비교하지 않고, 최대 자원에 닿지 못한 구간의 최적 후보는
+    최대 자원으로 같은 CV를 한 번 더 실행하여 모든 구간의 최적 후보를 최대 자원 점수로 비교합니다.
+    cv_results_는 모든 구간의 결과(다시 실행한 행 포함)를 bracket 컬럼과 함께 합친 것이고,
+    n_candidates_는 그중 첫 반복(iter == 0)에서 샘플링한 후보 수입니다.
+    """
+
+    def __init__(self, estimator, param_distributions, n_iter=50, resource='n_samples',
+                 min_resources=None, max_resources='auto', factor=3, max_brackets=4, cv=5,
+                 scoring='accuracy', random_state=42, n_jobs=-1):
+        self.estimator = estimator
+        self.param_distributions = param_distributions
+        self.n_iter = n_iter
+        self.resource = resource
+        self.min_resources = min_resources
+        self.max_resources = max_resources
+        self.factor = factor
+        self.max_brackets = max_brackets
+        self.cv = cv
+        self.scoring = scoring
+        self.random_state = random_state
+        self.n_jobs = n_jobs
+
+    def _resource_bounds(self, X, y):
+        """구간 계산에 사용할 (최소 자원, 최대 자원)"""
+        if self.resource == 'n_samples':
+            max_resources = len(X) if self.max_resources == 'auto' else self.max_resources
+            # HalvingRandomSearchCV의 'smallest'와 같은 기준: 분류 문제는 클래스당 fold마다 2개 이상
+            min_resources = self.min_resources or 2 * self.cv * len(np.unique(y))
+        else:
+            max_resources = self.max_resources
+            # 트리 개수는 가장 공격적인 구간이 최대 크기의 1/factor^(max_brackets-1)에서 시작하도록 설정
+            min_resources = self.min_resources or max(1, max_resources // self.factor ** (self.max_brackets - 1))
+        return min_resources, max_resources
+
+    def fit(self, X, y):
+        min_resources, max_resources = self._resource_bounds(X, y)
+        s_max = max(0, int(math.floor(math.log(max_resources / min_resources, self.factor) + 1e-9)))
+        s_max = min(s_max, self.max_brackets - 1)
+
+        # 구간 s의 후보 수: 원래 Hyperband 비율 (s_max+1)/(s+1) * factor^s 를 합이 n_iter가 되도록 스케일
+        ratios = {s: (s_max + 1) / (s + 1) * self.factor ** s for s in range(s_max + 1)}
+        scale = self.n_iter / sum(ratios.values())
+
+        # 구간마다 다른 후보를 뽑도록 random_state(None / int / RandomState)에서 구간별 시드를 생성
+        rng = check_random_state(self.random_state)
+        self.brackets_ = []
+        for s in range(s_max, -1, -1):
+            n_candidates = math.ceil(ratios[s] * scale)
+            bracket_min = max(min_resources, int(max_resources / self.factor ** s))
+            search = HalvingRandomSearchCV(
+                clone(self.estimator),
+                self.param_distributions,
+                n_candidates=max(n_candidates, 1),
+                factor=self.factor,
+                resource=self.resource,
+                min_resources=bracket_min,
+                max_resources=max_resources,
+                cv=self.cv,
+                scoring=self.scoring,
+                random_state=rng.randint(np.iinfo(np.int32).max),
+                n_jobs=self.n_jobs
+            )
+            search.fit(X, y)
+            self.brackets_.append(search)
+
+        cv = check_cv(self.cv, y, classifier=True)
+        self.n_splits_ = cv.get_n_splits(X, y)
+        blocks, winners, extra_fits = [], [], 0
+        for b, search in enumerate(self.brackets_):
+            block = dict(search.cv_results_)
+            block['bracket'] = np.full(len(block['params']), b)
+            offset = sum(len(previous['params']) for previous in blocks)
+            blocks.append(block)
+            if search.n_resources_[-1] >= max_resources:
+                winners.append((offset + search.best_index_, search.best_estimator_))
+                continue
+            # 최대 자원에 닿지 못한 구간: 최적 후보를 최대 자원으로 다시 CV하여 결과에 한 행으로 추가
+            params = dict(search.best_params_)
+            if self.resource == 'n_estimators':
+                params['n_estimators'] = max_resources
+            X_max, y_max = X, y
+            if self.resource == 'n_samples' and max_resources < len(X):
+                # HalvingRandomSearchCV처럼 클래스 비율을 유지한 max_resources개 표본에서 평가
+                X_max, _, y_max, _ = train_test_split(X, y, train_size=max_resources, stratify=y,
+                                                      random_state=search.random_state)
+            scores = cross_validate(clone(self.estimator).set_params(**params), X_max, y_max, cv=cv,
+                                    scoring=self.scoring, n_jobs=self.n_jobs,
+                                    return_train_score='mean_train_score' in block)
+            blocks.append(_rescored_row(block, params, scores, search.n_iterations_, max_resources, b))
+            winners.append((offset + len(block['params']), None))
+            extra_fits += self.n_splits_
+
+        self.cv_results_ = _concat_cv_results(blocks)
+        mean_scores = np.nan_to_num(self.cv_results_['mean_test_score'], nan=-np.inf)
+        # 동점이면 앞선 구간(더 공격적으로 걸러낸 구간)을 선택
+        self.best_index_, best_estimator = max(winners, key=lambda winner: mean_scores[winner[0]])
+        self.best_params_ = self.cv_results_['params'][self.best_index_]
+        self.best_score_ = float(self.cv_results_['mean_test_score'][self.best_index_])
+        if best_estimator is None:
+            best_estimator = clone(self.estimator).set_params(**self.best_params_).fit(X, y)
+            extra_fits += 1
+        self.best_estimator_ = best_estimator
+        self.n_candidates_ = int(np.sum(self.cv_results_['iter'] == 0))
+        self.n_fits_ = sum(count_fits(search) for search in self.brackets_) + extra_fits
+        return self
+
+    def score(self, X, y):
+        return self.best_estimator_.score(X, y)
+
+
+def _rescored_row(block, params, scores, iteration, n_resources, bracket):
+    """cross_validate 결과를 block(HalvingRandomSearchCV cv_results_)과 같은 컬럼의 한 행짜리 결과로 만듭니다"""
+    test_scores = scores['test_score']
+    row = {
+        'params': [params],
+        'mean_test_score': np.array([test_scores.mean()]),
+        'std_test_score': np.array([test_scores.std()]),
+        'mean_fit_time': np.array([scores['fit_time'].mean()]),
+        'std_fit_time': np.array([scores['fit_time'].std()]),
+        'mean_score_time': np.array([scores['score_time'].mean()]),
+        'std_score_time': np.array([scores['score_time'].std()]),
+        'iter': np.array([iteration]),
+        'n_resources': np.array([n_resources]),
+        'bracket': np.array([bracket]),
+    }
+    for fold, score in enumerate(test_scores):
+        row[f'split{fold}_test_score'] = np.array([score])
+    if 'train_score' in scores:
+        row['mean_train_score'] = np.array([scores['train_score'].mean()])
+        row['std_train_score'] = np.array([scores['train_score'].std()])
+        for fold, score in enumerate(scores['train_score']):
+            row[f'split{fold}_train_score'] = np.array([score])
+    return {key: row[key] for key in block if key in row}
+
+
+def _concat_cv_results(blocks):
+    """여러 cv_results_ 블록을 행 방향으로 합치고 param_* 컬럼과 전체 순위를 다시 만듭니다"""
+    params = [p for block in blocks for p in block['params']]
+    keys = [key for key in blocks[0] if not key.startswith('param_') and key not in ('params', 'rank_test_score')]
+    cv_results = {key: np.concatenate([np.asarray(block[key]) for block in blocks]) for key in keys}
+    for name in sorted({name for p in params for name in p}):
+        cv_results[f'param_{name}'] = np.ma.MaskedArray(
+            [p.get(name) for p in params], mask=[name not in p for p in params], dtype=object
+        )
+    cv_results['params'] = params
+    # RandomizedSearchCV와 마찬가지로 점수가 NaN인 후보는 가장 낮은 순위
+    cv_results['rank_test_score'] = rankdata(
+        -np.nan_to_num(cv_results['mean_test_score'], nan=-np.inf), method='min'
+    ).astype(np.int32)
+    return cv_results
+
+
+def _warm_start_task(estimator, params, sizes, X, y, train, test, scoring, return_proba=False, error_score=np.nan):
+    """
+    고정 파라미터 조합 하나를 fold 하나에서 warm_start로 sizes까지 차례로 키우며 크기마다 점수를 매깁니다.
+    반환하는 학습 시간은 해당 크기까지의 누적 시간(처음부터 그 크기로 학습한 것과 같은 의미)입니다.
+    return_proba이면 크기마다 검증 fold의 predict_proba(float32)도 함께 반환합니다.
+    어떤 크기에서 학습/평가가 실패하면 _fit_and_score_task처럼 그 크기와 이후 크기(이어서 키울 수 없음)의 결과를
+    (error_score, 누적 학습 시간, _FitFailure)로 채웁니다 (error_score='raise'이면 예외를 그대로 냄).
+    """
+    with threadpool_limits(limits=1):
+        model = _single_threaded(clone(estimator).set_params(**params, warm_start=True))
+        X_train, y_train = _safe_indexing(X, train), y[train]
+        X_test, y_test = _safe_indexing(X, test), y[test]
+        scorer = get_scorer(scoring)
+        results, elapsed = [], 0.0
+        for size in sizes:
+            start = time.perf_counter()
+            try:
+                model.set_params(n_estimators=size).fit(X_train, y_train)
+                elapsed += time.perf_counter() - start
+                score = scorer(model, X_test, y_test)
+                if return_proba:
+                    results.append((score, elapsed, model.predict_proba(X_test).astype(np.float32)))
+                else:
+                    results.append((score, elapsed))
+            except Exception:
+                if error_score == 'raise':
+                    raise
+                elapsed += time.perf_counter() - start
+                failure = _FitFailure(traceback.format_exc())
+                results.extend((error_score, elapsed, failure) for _ in sizes[len(results):])
+                break
+    return results
+
+
+class WarmStartSearchCV(BaseEstimator):
+    """
+    warm_start 증분 앙상블 탐색
+
+    n_estimators를 뺀 나머지 파라미터 조합을 ceil(n_iter / 크기 수)개 샘플링하고, 조합마다 요청된 모든 크기
+    (예: 50, 100, 200)를 후보로 둡니다(후보 수는 랜덤 탐색과 비슷한 n_iter 내외).
+    조합 × fold마다 추정기를 한 번 만들어 warm_start로 가장 작은 크기부터 트리를 추가하면서 크기마다
+    검증 fold 점수를 매기므로, 트리는 가장 큰 크기만큼만 만듭니다 (50/100/200이면 350개 대신 200개).
+    sklearn의 RandomForest/GradientBoosting은 warm_start로 키운 모델이 처음부터 그 크기로 학습한 모델과 같으므로
+    각 후보의 점수는 후보를 따로 학습한 것과 같습니다.
+    return_oof이면 크기마다 검증 fold의 predict_proba도 모아 최적 후보의 out-of-fold 예측을 oof_proba_로 제공합니다
+    (조합의 모든 fold가 끝나면 지금까지의 최적 후보와 비교하여 하나만 남김).
+    공유 풀 탐색(tune_models_shared)과 마찬가지로 학습에 실패한 (후보, fold)는 점수를 error_score로 기록하고
+    FitFailedWarning을 낸 뒤 탐색을 계속하며, 실패한 fold가 있는 후보는 최적 후보에서 제외합니다.
+    """
+
+    def __init__(self, estimator, param_distributions, n_iter=50, cv=5, scoring='accuracy',
+                 random_state=42, n_jobs=-1, return_oof=False, error_score=np.nan):
+        self.estimator = estimator
+        self.param_distributions = param_distributions
+        self.n_iter = n_iter
+        self.cv = cv
+        self.scoring = scoring
+        self.random_state = random_state
+        self.n_jobs = n_jobs
+        self.return_oof = return_oof
+        self.error_score = error_score
+
+    def fit(self, X, y):
+        n_jobs = cpu_count() if self.n_jobs in (None, -1) else self.n_jobs
+        y = np.asarray(y)
+        X_array = np.asarray(X)
+        splits = list(check_cv(self.cv, y, classifier=True).split(X_array, y))
+
+        sizes = sorted(self.param_distributions['n_estimators'])
+        other_params = {k: v for k, v in self.param_distributions.items() if k != 'n_estimators'}
+        n_groups = max(1, math.ceil(self.n_iter / len(sizes)))
+        groups = list(ParameterSampler(other_params, n_iter=n_groups, random_state=self.random_state)) \
+            if other_params else [{}]
+        candidates = [dict(fixed, n_estimators=size) for fixed in groups for size in sizes]
+
+        tasks = [(g, fold) for g in range(len(groups)) for fold in range(len(splits))]
+        # 결과를 작업 순서대로 하나씩 받아 끝난 조합의 OOF 버퍼를 바로 정리
+        results = Parallel(n_jobs=n_jobs, return_as="generator")(
+            delayed(_warm_start_task)(
+                self.estimator, groups[g], sizes, X_array, y, splits[fold][0], splits[fold][1], self.scoring,
+                self.return_oof, self.error_score
+            )
+            for g, fold in tasks
+        )
+
+        # 후보 순서는 (조합, 크기) 순이므로 조합 g의 크기 k 후보는 g * len(sizes) + k
+        split_scores = np.zeros((len(candidates), len(splits)))
+        fit_times = np.zeros((len(candidates), len(splits)))
+        failed = np.zeros(len(candidates), dtype=bool)
+        failures = []
+        partial_oof, best_oof = {}, None
+        for (g, fold), size_results in zip(tasks, results):
+            for k, result in enumerate(size_results):
+                split_scores[g * len(sizes) + k, fold] = result[0]
+                fit_times[g * len(sizes) + k, fold] = result[1]
+                if _failed(result):
+                    failed[g * len(sizes) + k] = True
+                    failures.append(result[-1].message)
+                elif self.return_oof:
+                    oof = partial_oof.setdefault(
+                        k, np.zeros((len(y), result[2].shape[1]), dtype=np.float32)
+                    )
+                    oof[splits[fold][1]] = result[2]
+            if self.return_oof and fold == len(splits) - 1:
+                # 조합 g의 모든 fold가 끝남: 크기별 후보를 최적 후보와 비교 (동점이면 먼저 나온 후보 유지)
+                for k in range(len(sizes)):
+                    if failed[g * len(sizes) + k]:
+                        continue
+                    mean_score = split_scores[g * len(sizes) + k].mean()
+                    if best_oof is None or mean_score > best_oof[0]:
+                        best_oof = (mean_score, partial_oof[k])
+                partial_oof = {}
+
+        n_tasks = len(candidates) * len(splits)
+        if failed.all():
+            raise ValueError(
+                f"모든 후보의 학습이 실패했습니다 ({len(failures)}/{n_tasks} fits).\n첫 번째 오류:\n{failures[0]}"
+            )
+        if failures:
+            warnings.warn(
+                f"{len(failures)}/{n_tasks} fits가 실패하여 점수를 {self.error_score}(으)로 기록했습니다 "
+                f"(실패한 후보 {int(failed.sum())}개는 최적 후보에서 제외).\n첫 번째 오류:\n{failures[0]}",
+                FitFailedWarning
+            )
+
+        self.cv_results_ = _cv_results(candidates, split_scores, fit_times)
+        # RandomizedSearchCV와 마찬가지로 동점이면 먼저 나온 후보(같은 조합이면 작은 크기) 선택
+        self.best_index_ = _best_index(split_scores, failed)
+        self.best_params_ = candidates[self.best_index_]
+        self.best_score_ = float(self.cv_results_['mean_test_score'][self.best_index_])
+        self.best_estimator_ = clone(self.estimator).set_params(**self.best_params_).fit(X, y)
+        # fold 학습에서 만든 트리 수: warm_start 대 후보마다 처음부터 학습했을 때
+        self.n_trees_built_ = len(groups) * sizes[-1] * len(splits)
+        self.n_trees_from_scratch_ = len(groups) * sum(sizes) * len(splits)
+        self.oof_proba_ = best_oof[1] if self.return_oof else None
+        # 추정기 fit 호출 수: (조합, fold)마다 크기별 warm_start fit + 최적 후보 재학습
+        self.n_fits_ = len(tasks) * len(sizes) + 1
+        return self
+
+    def score(self, X, y):
+        return self.best_estimator_.score(X, y)
+
+
+def build_search(model, params, strategy='random', resource='n_samples', n_iter=50, cv=5,
+                 factor=3, scoring='accuracy', random_state=42, n_jobs=-1, return_oof=False):
+    """
+    튜닝 전략에 맞는 탐색 객체를 생성합니다 (모두 fit / best_estimator_ / best_params_ / best_score_ 제공)
+
+    return_oof이면 random / warm_start 탐색은 후보 학습 중에 최적 후보의 out-of-fold predict_proba를 모아
+    oof_proba_로 제공합니다. halving / hyperband(sklearn HalvingRandomSearchCV)는 fold 모델을 남기지 않으므로
+    oof_proba_가 없고, OOF 예측이 필요하면 최적 모델로 CV를 한 번 더 실행해야 합니다.
+    """
+    if strategy == 'warm_start' and 'n_estimators' in params and 'warm_start' in model.get_params():
+        return WarmStartSearchCV(
+            model,
+            params,
+            n_iter=n_iter,
+            cv=cv,
+            scoring=scoring,
+            random_state=random_state,
+            n_jobs=n_jobs,
+            return_oof=return_oof
+        )
+    if strategy in ('random', 'warm_start') and return_oof:
+        return OOFRandomSearchCV(
+            model,
+            params,
+            n_iter=n_iter,
+            cv=cv,
+            scoring=scoring,
+            random_state=random_state,
+            n_jobs=n_jobs
+        )
+    if strategy in ('random', 'warm_start'):
+        return RandomizedSearchCV(
+            model,
+            params,
+            n_iter=n_iter,
+            cv=cv,
+            scoring=scoring,
+            random_state=random_state,
+            n_jobs=n_jobs
+        )
+
+    resource_name, search_params, max_resources = resolve_resource(model, params, resource)
+    if strategy == 'halving':
+        return HalvingRandomSearchCV(
+            model,
+            search_params,
+            n_candidates=n_iter,
+            factor=factor,
+            resource=resource_name,
+            # 마지막 반복에서 최대 자원(전체 샘플 / 가장 큰 n_estimators)을 쓰도록 시작 자원을 역산
+            min_resources='exhaust',
+            max_resources=max_resources,
+            cv=cv,
+            scoring=scoring,
+            random_state=random_state,
+            n_jobs=n_jobs
+        )
+    if strategy == 'hyperband':
+        return HyperbandSearchCV(
+            model,
+            search_params,
+            n_iter=n_iter,
+            resource=resource_name,
+            max_resources=max_resources,
+            factor=factor,
+            cv=cv,
+            scoring=scoring,
+            random_state=random_state,
+            n_jobs=n_jobs
+        )
+    raise ValueError(f"지원하지 않는 튜닝 전략입니다: {strategy} (선택: {TUNING_STRATEGIES})")
+
+
+def _single_threaded(estimator):
+    """중첩 병렬화로 코어를 초과 구독하지 않도록 추정기 자체의 n_jobs를 1로 고정합니다"""
+    if 'n_jobs' in estimator.get_params():
+        estimator.set_params(n_jobs=1)
+    return estimator
+
+
+def _estimated_cost(estimator, params):
+    """
+    후보 학습 비용의 대략적인 추정치 (모델 종류별 단위 비용 × 트리 개수/반복 횟수).
+    긴 작업을 먼저 배치하여(LPT 스케줄링) 마지막에 한 코어만 일하고 나머지가 노는 구간을 줄이는 데 사용합니다.
+    FAMILY_COSTS에 없는 모델은 n_estimators 또는 max_iter를 그대로 비용으로 씁니다.
+    """
+    settings = {**estimator.get_params(), **params}
+    family = type(estimator).__name__
+    if family in FAMILY_COSTS:
+        size_param, unit_cost = FAMILY_COSTS[family]
+    else:
+        size_param = next((name for name in ('n_estimators', 'max_iter') if name in settings), None)
+        unit_cost = 1.0
+    return unit_cost * (settings[size_param] if size_param else 1)
+
+
+class _FitFailure:
+    """(후보, fold) 학습/평가 실패 표시 (작업 결과의 마지막 값, 예외 traceback 보관)"""
+
+    def __init__(self, message):
+        self.message = message
+
+
+def _failed(result):
+    return isinstance(result[-1], _FitFailure)
+
+
+def _fit_and_score_task(estimator, params, X, y, train, test, scoring, return_proba=False, error_score=np.nan):
+    """
+    워커 하나에서 (후보, fold) 하나를 학습하고 점수를 반환합니다 (BLAS 스레드도 1개로 제한).
+    return_proba이면 검증 fold의 predict_proba(float32)도 함께 반환합니다.
+    학습/평가가 실패하면 RandomizedSearchCV처럼 점수를 error_score로 하고 (error_score, 학습 시간, _FitFailure)를
+    반환합니다 (error_score='raise'이면 예외를 그대로 냄).
+    """
+    with threadpool_limits(limits=1):
+        model = _single_threaded(clone(estimator).set_params(**params))
+        start = time.perf_counter()
+        try:
+            model.fit(_safe_indexing(X, train), y[train])
+            fit_time = time.perf_counter() - start
+            X_test = _safe_indexing(X, test)
+            score = get_scorer(scoring)(model, X_test, y[test])
+            if return_proba:
+                return score, fit_time, model.predict_proba(X_test).astype(np.float32)
+        except Exception:
+            if error_score == 'raise':
+                raise
+            return error_score, time.perf_counter() - start, _FitFailure(traceback.format_exc())
+    return score, fit_time
+
+
+def _refit_task(estimator, params, X, y):
+    """최적 후보를 전체 학습 데이터로 다시 학습합니다"""
+    with threadpool_limits(limits=1):
+        return _single_threaded(clone(estimator).set_params(**params)).fit(X, y)
+
+
+def _cv_results(candidates, split_scores, fit_times):
+    """(후보, fold)별 점수와 학습 시간으로 RandomizedSearchCV 형식의 cv_results_ 생성"""
+    mean_scores = split_scores.mean(axis=1)
+    cv_results = {
+        'params': candidates,
+        'mean_test_score': mean_scores,
+        'std_test_score': split_scores.std(axis=1),
+        # RandomizedSearchCV와 마찬가지로 점수가 NaN인(학습 실패) 후보는 가장 낮은 순위
+        'rank_test_score': rankdata(-np.nan_to_num(mean_scores, nan=-np.inf), method='min').astype(np.int32),
+        'mean_fit_time': fit_times.mean(axis=1),
+    }
+    for fold in range(split_scores.shape[1]):
+        cv_results[f'split{fold}_test_score'] = split_scores[:, fold]
+    return cv_results
+
+
+class SharedSearchResult:
+    """공유 풀 탐색 결과 (RandomizedSearchCV와 같은 best_* / cv_results_ 속성 제공)"""
+
+    def __init__(self, best_estimator, candidates, split_scores, fit_times, best_index, oof_proba=None, n_fits=0):
+        self.cv_results_ = _cv_results(candidates, split_scores, fit_times)
+        mean_scores = self.cv_results_['mean_test_score']
+        self.best_index_ = best_index
+        self.best_params_ = candidates[self.best_index_]
+        self.best_score_ = float(mean_scores[self.best_index_])
+        self.best_estimator_ = best_estimator
+        # 최적 후보의 out-of-fold predict_proba (return_oof=True로 탐색한 경우)
+        self.oof_proba_ = oof_proba
+        # 캐시에서 불러오지 않고 실제로 학습한 (후보, fold) 작업 + 재학습 수
+        self.n_fits_ = n_fits
+
+    def score(self, X, y):
+        return self.best_estimator_.score(X, y)
+
+
+def _best_index(split_scores, failed):
+    """
+    학습이 실패한 fold가 없는 후보 중 평균 점수가 가장 높은 후보 (동점이면 먼저 샘플링된 후보, RandomizedSearchCV와 같음).
+    모든 후보가 실패하면 None
+    """
+    if failed.all():
+        return None
+    mean_scores = np.where(failed, -np.inf, np.nan_to_num(split_scores.mean(axis=1), nan=-np.inf))
+    return int(np.argmax(mean_scores))
+
+
+def tune_models_shared(families, y, n_iter=50, cv=5, scoring='accuracy', random_state=42, n_jobs=-1,
+                       fit_cache=None, return_oof=False, task_queue=None, error_score=np.nan):
+    """
+    모든 모델 계열의 랜덤 탐색 후보 학습을 하나의 워커 풀에서 실행합니다.
+
+    모델별 RandomizedSearchCV를 차례대로 돌리면 한 계열의 꼬리 작업이 끝날 때까지 다른 코어가 놀고,
+    각 탐색의 n_jobs=-1과 추정기/BLAS의 내부 병렬화가 겹치면 코어를 초과 구독합니다.
+    여기서는 (모델, 후보, fold) 단위 작업을 모두 모아 비용이 큰 순서로 하나의 풀에 배치하고,
+    워커 안에서는 추정기 n_jobs와 BLAS 스레드를 1로 고정하여 코어 수 = 동시 작업 수가 되도록 합니다.
+    후보 샘플링과 fold 분할은 RandomizedSearchCV(n_iter, cv, random_state)와 동일합니다.
+    fit_cache가 주어지면 (후보, fold) 점수와 재학습된 최적 모델을 캐시에서 먼저 찾고, 없는 작업만 풀에 보냅니다.
+    return_oof이면 각 fold의 검증 predict_proba도 모아 최적 후보의 out-of-fold 예측을 oof_proba_로 제공합니다.
+    모든 fold가 끝난 후보는 지금까지의 최적 후보와 비교하여 하나만 남기므로 메모리는 후보 수에 비례하지 않습니다.
+    task_queue(distributed.FileTaskQueue)가 주어지면 같은 작업을 로컬 풀 대신 큐에 올려 여러 노드의 워커가 실행합니다.
+    RandomizedSearchCV와 마찬가지로 학습에 실패한 (후보, fold)는 점수를 error_score로 기록하고 FitFailedWarning을 낸 뒤
+    나머지 탐색을 계속하며, 실패한 fold가 있는 후보는 최적 후보에서 제외합니다. 한 계열의 후보가 모두 실패하면 ValueError를 냅니다.
+
+    Args:
+        families: {모델 이름: (추정기, 파라미터 분포, 학습 데이터 X)}
+        y: 학습 레이블
+        n_jobs: 전체 작업에 사용할 코어 수 (-1이면 모든 코어)
+        fit_cache: FitCache (None이면 캐시 없이 모두 학습)
+        return_oof: 최적 후보의 out-of-fold predict_proba 보관 여부 (스태킹 메타 모델 학습용)
+        task_queue: 분산 작업 큐 (None이면 n_jobs개 로컬 joblib 워커 사용)
+        error_score: 학습에 실패한 (후보, fold)의 점수 ('raise'이면 예외를 그대로 냄)
+
+    Returns:
+        {모델 이름: SharedSearchResult}
+    """
+    # cgroup / CPU affinity 제한을 반영한 코어 수
+    n_jobs = cpu_count() if n_jobs in (None, -1) else n_jobs
+    fit_cache = fit_cache or FitCache()
+    y = np.asarray(y)
+    splits = list(check_cv(cv, y, classifier=True).split(np.zeros(len(y)), y))
+
+    candidates = {
+        name: list(ParameterSampler(params, n_iter=n_iter, random_state=random_state))
+        for name, (estimator, params, X) in families.items()
+    }
+    # 워커로 보낼 데이터는 numpy 배열로 변환 (큰 배열은 joblib이 memmap으로 공유)
+    arrays = {name: np.asarray(X) for name, (estimator, params, X) in families.items()}
+
+    def candidate(name, i):
+        return clone(families[name][0]).set_params(**candidates[name][i])
+
+    tasks = [
+        (name, i, fold)
+        for name in families
+        for i in range(len(candidates[name]))
+        for fold in range(len(splits))
+    ]
+    task_keys, cached_outputs = {}, {}
+    if fit_cache.enabled:
+        array_fps = {name: data_fingerprint(arrays[name], y) for name in families}
+        for name, i, fold in tasks:
+            key = fit_cache.make_key(candidate(name, i), array_fps[name], kind="cv_fold", cv=cv, fold=fold, scoring=scoring)
+            task_keys[(name, i, fold)] = key
+            cached = fit_cache.get(key)
+            # OOF 예측이 필요한데 점수만 캐시된 항목은 다시 학습
+            if cached is not None and (not return_oof or len(cached) == 3):
+                cached_outputs[(name, i, fold)] = cached
+
+    split_scores = {name: np.zeros((len(candidates[name]), len(splits))) for name in families}
+    fit_times = {name: np.zeros((len(candidates[name]), len(splits))) for name in families}
+    remaining_folds = {(name, i): len(splits) for name in families for i in range(len(candidates[name]))}
+    failed = {name: np.zeros(len(candidates[name]), dtype=bool) for name in families}
+    failures = {name: [] for name in families}
+    partial_oof, best_oof = {}, {}
+
+    def collect(task, result):
+        """작업 결과를 기록하고, 모든 fold가 끝난 후보의 OOF 예측은 최적 후보일 때만 남깁니다"""
+        name, i, fold = task
+        split_scores[name][i, fold] = result[0]
+        fit_times[name][i, fold] = result[1]
+        if _failed(result):
+            failed[name][i] = True
+            failures[name].append(result[-1].message)
+        if not return_oof:
+            return
+        if not failed[name][i]:
+            oof = partial_oof.get((name, i))
+            if oof is None:
+                oof = partial_oof[(name, i)] = np.zeros((len(y), result[2].shape[1]), dtype=np.float32)
+            oof[splits[fold][1]] = result[2]
+        remaining_folds[(name, i)] -= 1
+        if remaining_folds[(name, i)] == 0:
+            oof = partial_oof.pop((name, i), None)
+            if failed[name][i]:
+                # 실패한 fold가 있는 후보는 최적 후보가 될 수 없음
+                return
+            mean_score = split_scores[name][i].mean()
+            best = best_oof.get(name)
+            # argmax와 같은 규칙: 점수가 같으면 먼저 샘플링된 후보
+            if best is None or mean_score > best[0] or (mean_score == best[0] and i < best[1]):
+                best_oof[name] = (mean_score, i, oof)
+
+    for task, result in cached_outputs.items():
+        collect(task, result)
+    pending = [task for task in tasks if task not in cached_outputs]
+    pending.sort(key=lambda task: _estimated_cost(families[task[0]][0], candidates[task[0]][task[1]]), reverse=True)
+
+    if task_queue is not None:
+        # 작업마다 데이터를 보내지 않도록 학습 데이터와 fold 인덱스는 큐 디렉토리에 한 번만 저장 (워커는 mmap으로 읽음)
+        task_arrays = {name: task_queue.share(f"X{k}", arrays[name]) for k, name in enumerate(families)}
+        refit_data = {name: task_queue.share(f"X{k}_refit", families[name][2]) for k, name in enumerate(families)}
+        task_y = task_queue.share("y", y)
+        task_splits = [(task_queue.share(f"train{fold}", train), task_queue.share(f"test{fold}", test))
+                       for fold, (train, test) in enumerate(splits)]
+    else:
+        task_arrays, task_y, task_splits = arrays, y, splits
+        refit_data = {name: families[name][2] for name in families}
+
+    with (Parallel(n_jobs=n_jobs, return_as="generator") if task_queue is None else nullcontext()) as parallel:
+        def run(func, arg_list):
+            """작업들을 로컬 풀 또는 분산 큐에서 실행하고 결과를 순서대로 반환하는 생성기"""
+            if task_queue is not None:
+                return task_queue.map(func, arg_list)
+            return parallel(delayed(func)(*args) for args in arg_list)
+
+        # 결과를 순서대로 하나씩 받아 OOF 버퍼를 바로 정리
+        results = run(_fit_and_score_task, [
+            (families[name][0], candidates[name][i], task_arrays[name], task_y,
+             task_splits[fold][0], task_splits[fold][1], scoring, return_oof, error_score)
+            for name, i, fold in pending
+        ])
+        for task, result in zip(pending, results):
+            collect(task, result)
+            # 실패한 작업은 캐시하지 않음 (다음 실행에서 다시 시도)
+            if task in task_keys and not _failed(result):
+                fit_cache.put(task_keys[task], result)
+        # 생성기 참조가 남아 있으면 같은 Parallel에 다음 작업을 제출할 수 없음
+        del results
+
+        for name in families:
+            if not failures[name]:
+                continue
+            n_tasks = len(candidates[name]) * len(splits)
+            if failed[name].all():
+                raise ValueError(
+                    f"{name}: 모든 후보의 학습이 실패했습니다 ({len(failures[name])}/{n_tasks} fits).\n"
+                    f"첫 번째 오류:\n{failures[name][0]}"
+                )
+            warnings.warn(
+                f"{name}: {len(failures[name])}/{n_tasks} fits가 실패하여 점수를 {error_score}(으)로 기록했습니다 "
+                f"(실패한 후보 {int(failed[name].sum())}개는 최적 후보에서 제외).\n첫 번째 오류:\n{failures[name][0]}",
+                FitFailedWarning
+            )
+
+        # 계열별 최적 후보 재학습도 같은 풀에서 동시에 실행 (특성 이름 유지를 위해 원본 X 사용)
+        best_index = {name: _best_index(split_scores[name], failed[name]) for name in families}
+        refitted, refit_keys = {}, {}
+        if fit_cache.enabled:
+            for name in families:
+                refit_keys[name] = fit_cache.make_key(
+                    candidate(name, best_index[name]), data_fingerprint(families[name][2], y), kind="fit"
+                )
+                cached = fit_cache.get(refit_keys[name])
+                if cached is not None:
+                    refitted[name] = cached
+        pending_refits = [name for name in families if name not in refitted]
+        results = run(_refit_task, [
+            (families[name][0], candidates[name][best_index[name]], refit_data[name], task_y)
+            for name in pending_refits
+        ])
+        for name, estimator in zip(pending_refits, results):
+            refitted[name] = estimator
+            if name in refit_keys:
+                fit_cache.put(refit_keys[name], estimator)
+
+    n_fits = {name: sum(task[0] == name for task in pending) + (name in pending_refits) for name in families}
+    fit_cache.fits += sum(n_fits.values())
+
+    return {
+        name: SharedSearchResult(
+            refitted[name], candidates[name], split_scores[name], fit_times[name], best_index[name],
+            oof_proba=best_oof[name][2] if return_oof else None,
+            n_fits=n_fits[name]
+        )
+        for name in families
+    }
+
+
+class OOFRandomSearchCV(BaseEstimator):
+    """
+    최적 후보의 out-of-fold 예측도 제공하는 랜덤 탐색
+
+    RandomizedSearchCV와 같은 후보 샘플링 / fold 분할로 모델 하나에 대해 tune_models_shared를 실행하고,
+    후보 학습 중에 모은 최적 후보의 검증 fold predict_proba를 oof_proba_로 제공합니다.
+    스태킹 메타 모델용 OOF 예측을 얻으려고 최적 모델로 CV를 다시 실행하지 않아도 됩니다.
+    학습에 실패한 후보는 RandomizedSearchCV처럼 error_score로 기록하고 탐색을 계속합니다.
+    """
+
+    def __init__(self, estimator, param_distributions, n_iter=50, cv=5, scoring='accuracy',
+                 random_state=42, n_jobs=-1, error_score=np.nan):
+        self.estimator = estimator
+        self.param_distributions = param_distributions
+        self.n_iter = n_iter
+        self.cv = cv
+        self.scoring = scoring
+        self.random_state = random_state
+        self.n_jobs = n_jobs
+        self.error_score = error_score
+
+    def fit(self, X, y):
+        result = tune_models_shared(
+            {'model': (self.estimator, self.param_distributions, X)},
+            y,
+            n_iter=self.n_iter,
+            cv=self.cv,
+            scoring=self.scoring,
+            random_state=self.random_state,
+            n_jobs=self.n_jobs,
+            return_oof=True,
+            error_score=self.error_score
+        )['model']
+        self.cv_results_ = result.cv_results_
+        self.best_index_ = result.best_index_
+        self.best_params_ = result.best_params_
+        self.best_score_ = result.best_score_
+        self.best_estimator_ = result.best_estimator_
+        self.oof_proba_ = result.oof_proba_
+        self.n_fits_ = result.n_fits_
+        return self
+
+    def score(self, X, y):
+        return self.best_estimator_.score(X, y)
@@ -0,0 +1,60 @@
+"""
+Slack API 요청 지연 시간 벤치마크
+
+연결 풀 없이 요청마다 새 연결을 여는 방식(pool_size=0)과 keep-alive 연결 풀을 재사용하는 방식의
+auth.test 요청 지연 시간을 비교합니다.
+
+사용법:
+    python latency_benchmark.py
+    python latency_benchmark.py --requests 50 --pool-size 10
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+from dotenv import load_dotenv
+
+from slack_api import SlackAPIClient
+
+
+def measure(client: SlackAPIClient, n_requests: int) -> list:
+    """auth.test를 n_requests번 보내고 요청별 지연 시간(ms) 목록을 반환합니다."""
+    latencies = []
+    for _ in range(n_requests):
+        start = time.perf_counter()
+        client.test_connection()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def report(label: str, latencies: list):
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(f"{label:<16} 첫 요청 {latencies[0]:8.1f}ms | 중앙값 {statistics.median(latencies):8.1f}ms | "
+          f"p95 {p95:8.1f}ms | 합계 {sum(latencies):9.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Slack API 요청 지연 시간 비교 (연결 풀 사용 전/후)")
+    parser.add_argument("--requests", type=int, default=20, help="방식별 요청 수")
+    parser.add_argument("--pool-size", type=int, default=10, help="연결 풀 크기")
+    parser.add_argument("--base-url", default=SlackAPIClient.BASE_URL, help="API 기본 URL")
+    args = parser.parse_args()
+
+    load_dotenv()
+    token = os.getenv("SLACK_BOT_TOKEN")
+    if not token:
+        print("SLACK_BOT_TOKEN 환경 변수가 설정되지 않았습니다.", file=sys.stderr)
+        sys.exit(1)
+
+    for label, pool_size in [("연결 풀 없음", 0), (f"연결 풀({args.pool_size})", args.pool_size)]:
+        with SlackAPIClient(token, pool_size=pool_size) as client:
+            client.BASE_URL = args.base_url
+            report(label, measure(client, args.requests))
+
+
+if __name__ == "__main__":
+    main()
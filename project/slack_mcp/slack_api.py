@@ -3,15 +3,25 @@ Slack API 클라이언트 모듈
 
 이 모듈은 Slack Web API와의 상호작용을 위한 클라이언트 클래스를 제공합니다.
 UTF-8 인코딩을 지원하며, 모든 주요 Slack API 기능을 구현합니다.
+
+- SlackAPIClient: requests 기반 동기 클라이언트 (스크립트, 벤치마크용)
+- AsyncSlackAPIClient: httpx 기반 비동기 클라이언트 (MCP 서버의 async 도구용, 이벤트 루프를 막지 않음)
 """
 
+import asyncio
 import json
+import logging
 import os
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass
 import time
 
+# 디버그 로그는 stderr 로깅으로만 보냅니다 (stdio MCP 서버에서 stdout은 JSON-RPC 채널)
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class SlackMessage:
@@ -56,6 +66,62 @@ class SlackAPIError(Exception):
         super().__init__(f"Slack API Error: {error}")
 
 
+def _parse_channel(channel_data: Dict[str, Any]) -> SlackChannel:
+    """conversations.list 응답의 채널 항목을 SlackChannel로 변환합니다."""
+    return SlackChannel(
+        id=channel_data['id'],
+        name=channel_data['name'],
+        is_private=channel_data.get('is_private', False),
+        is_member=channel_data.get('is_member', False),
+        topic=channel_data.get('topic', {}).get('value'),
+        purpose=channel_data.get('purpose', {}).get('value'),
+        num_members=channel_data.get('num_members')
+    )
+
+
+def _parse_message(msg_data: Dict[str, Any], channel: str, default_user: str = '') -> SlackMessage:
+    """메시지 응답 항목을 SlackMessage로 변환합니다."""
+    return SlackMessage(
+        text=msg_data.get('text', ''),
+        user=msg_data.get('user', default_user),
+        timestamp=msg_data.get('ts', ''),
+        channel=channel,
+        thread_ts=msg_data.get('thread_ts')
+    )
+
+
+def _parse_user(user_data: Dict[str, Any]) -> SlackUser:
+    """users.list / users.info 응답의 사용자 항목을 SlackUser로 변환합니다."""
+    return SlackUser(
+        id=user_data['id'],
+        name=user_data['name'],
+        real_name=user_data.get('real_name', ''),
+        email=user_data.get('profile', {}).get('email'),
+        is_bot=user_data.get('is_bot', False),
+        is_admin=user_data.get('is_admin', False),
+        status=user_data.get('profile', {}).get('status_text')
+    )
+
+
+def _check_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Slack 응답의 ok 필드를 확인하고, 실패면 SlackAPIError를 발생시킵니다."""
+    if not result.get('ok', False):
+        error_msg = result.get('error', 'Unknown error')
+        logger.debug(f"Slack API 오류: {error_msg}")
+        logger.debug(f"전체 응답: {result}")
+        raise SlackAPIError(error_msg, result)
+    
+    logger.debug(f"API 요청 성공")
+    return result
+
+
+# 채널 히스토리에서 건너뛸 메시지 종류 (봇 메시지, 시스템 메시지)
+SKIPPED_MESSAGE_SUBTYPES = ['bot_message', 'channel_join', 'channel_leave']
+
+# 비동기 파일 업로드 시 한 번에 읽어 보내는 크기 (바이트)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
 class SlackAPIClient:
     """
     Slack API 클라이언트 클래스
@@ -66,12 +132,24 @@ class SlackAPIClient:
     
     BASE_URL = "https://slack.com/api"
     
-    def __init__(self, token: str):
+    def __init__(
+        self, 
+        token: str, 
+        pool_size: int = 10, 
+        connect_timeout: float = 5.0, 
+        read_timeout: float = 30.0
+    ):
         """
         Slack API 클라이언트 초기화
         
+        요청은 keep-alive 연결 풀(requests.Session)을 재사용하므로 두 번째 요청부터는
+        TCP/TLS 핸드셰이크 없이 바로 전송됩니다.
+        
         Args:
             token: Slack Bot User OAuth Token
+            pool_size: 호스트별로 유지할 keep-alive 연결 수 (0이면 연결 풀 없이 요청마다 새 연결)
+            connect_timeout: 연결 제한 시간 (초)
+            read_timeout: 응답 대기 제한 시간 (초)
         """
         self.token = token
         self.headers = {
@@ -79,6 +157,37 @@ class SlackAPIClient:
             'Content-Type': 'application/json; charset=utf-8',
             'User-Agent': 'SlackMCP/1.0'
         }
+        self.pool_size = pool_size
+        self.timeout = (connect_timeout, read_timeout)
+        self.session = self._create_session() if pool_size > 0 else None
+    
+    def _create_session(self) -> requests.Session:
+        """
+        연결 풀을 사용하는 HTTP 세션을 만듭니다.
+        
+        인증 헤더는 Slack API 요청에만 붙이고 파일 업로드 URL에는 보내지 않도록
+        세션 기본 헤더가 아니라 요청마다 전달합니다.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    def _http(self):
+        """요청에 사용할 HTTP 클라이언트 (연결 풀 세션 또는 requests 모듈)"""
+        return self.session if self.session is not None else requests
+    
+    def close(self):
+        """연결 풀의 keep-alive 연결을 닫습니다."""
+        if self.session is not None:
+            self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
     
     def _make_request(
         self, 
@@ -104,46 +213,37 @@ class SlackAPIClient:
         """
         url = f"{self.BASE_URL}/{endpoint}"
         
-        print(f"DEBUG: API 요청 - {method} {endpoint}")
+        logger.debug(f"API 요청 - {method} {endpoint}")
         if data:
-            print(f"DEBUG: 요청 데이터: {data}")
+            logger.debug(f"요청 데이터: {data}")
         if params:
-            print(f"DEBUG: 요청 파라미터: {params}")
+            logger.debug(f"요청 파라미터: {params}")
         
         try:
             if method.upper() == 'GET':
-                response = requests.get(
+                response = self._http().get(
                     url, 
                     headers=self.headers, 
                     params=params,
-                    timeout=30
+                    timeout=self.timeout
                 )
             else:
-                response = requests.post(
+                response = self._http().post(
                     url, 
                     headers=self.headers, 
                     json=data,
-                    timeout=30
+                    timeout=self.timeout
                 )
             
-            print(f"DEBUG: HTTP 응답 상태: {response.status_code}")
+            logger.debug(f"HTTP 응답 상태: {response.status_code}")
             response.raise_for_status()
-            result = response.json()
-            
-            if not result.get('ok', False):
-                error_msg = result.get('error', 'Unknown error')
-                print(f"DEBUG: Slack API 오류: {error_msg}")
-                print(f"DEBUG: 전체 응답: {result}")
-                raise SlackAPIError(error_msg, result)
-            
-            print(f"DEBUG: API 요청 성공")
-            return result
+            return _check_result(response.json())
             
         except requests.exceptions.RequestException as e:
-            print(f"DEBUG: 네트워크 오류: {str(e)}")
+            logger.debug(f"네트워크 오류: {str(e)}")
             raise SlackAPIError(f"Network error: {str(e)}")
         except json.JSONDecodeError as e:
-            print(f"DEBUG: JSON 파싱 오류: {str(e)}")
+            logger.debug(f"JSON 파싱 오류: {str(e)}")
             raise SlackAPIError(f"JSON decode error: {str(e)}")
     
     def send_message(self, channel: str, text: str, thread_ts: Optional[str] = None) -> Dict[str, Any]:
@@ -201,16 +301,7 @@ class SlackAPIClient:
             channels = []
             
             for channel_data in result.get('channels', []):
-                channel = SlackChannel(
-                    id=channel_data['id'],
-                    name=channel_data['name'],
-                    is_private=channel_data.get('is_private', False),
-                    is_member=channel_data.get('is_member', False),
-                    topic=channel_data.get('topic', {}).get('value'),
-                    purpose=channel_data.get('purpose', {}).get('value'),
-                    num_members=channel_data.get('num_members')
-                )
-                channels.append(channel)
+                channels.append(_parse_channel(channel_data))
             
             return channels
             
@@ -260,17 +351,10 @@ class SlackAPIClient:
             
             for msg_data in result.get('messages', []):
                 # 봇 메시지나 시스템 메시지 건너뛰기
-                if msg_data.get('subtype') in ['bot_message', 'channel_join', 'channel_leave']:
+                if msg_data.get('subtype') in SKIPPED_MESSAGE_SUBTYPES:
                     continue
                 
-                message = SlackMessage(
-                    text=msg_data.get('text', ''),
-                    user=msg_data.get('user', ''),
-                    timestamp=msg_data.get('ts', ''),
-                    channel=channel_id,
-                    thread_ts=msg_data.get('thread_ts')
-                )
-                messages.append(message)
+                messages.append(_parse_message(msg_data, channel_id))
             
             return messages
             
@@ -296,7 +380,7 @@ class SlackAPIClient:
         Raises:
             SlackAPIError: DM 전송 실패 시
         """
-        print(f"DEBUG: DM 전송 시작 - 사용자 ID: {user_id}")
+        logger.debug(f"DM 전송 시작 - 사용자 ID: {user_id}")
         
         try:
             # 먼저 DM 채널을 열어야 함
@@ -304,26 +388,26 @@ class SlackAPIClient:
                 'users': user_id
             }
             
-            print(f"DEBUG: DM 채널 열기 시도...")
+            logger.debug(f"DM 채널 열기 시도...")
             dm_result = self._make_request('POST', 'conversations.open', dm_data)
             dm_channel_id = dm_result['channel']['id']
             
-            print(f"DEBUG: DM 채널 ID 획득: {dm_channel_id}")
+            logger.debug(f"DM 채널 ID 획득: {dm_channel_id}")
             
             # DM 채널에 메시지 전송
-            print(f"DEBUG: DM 채널에 메시지 전송 중...")
+            logger.debug(f"DM 채널에 메시지 전송 중...")
             result = self.send_message(dm_channel_id, text)
             
-            print(f"DEBUG: DM 전송 성공!")
+            logger.debug(f"DM 전송 성공!")
             return result
             
         except SlackAPIError as e:
-            print(f"DEBUG: DM 전송 실패 - 오류: {e.error}")
+            logger.debug(f"DM 전송 실패 - 오류: {e.error}")
             # 사용자 ID가 잘못되었을 수 있으므로 추가 정보 제공
             if 'user_not_found' in str(e.error):
-                print(f"DEBUG: 사용자를 찾을 수 없음. 올바른 사용자 ID인지 확인 필요")
+                logger.debug(f"사용자를 찾을 수 없음. 올바른 사용자 ID인지 확인 필요")
             elif 'channel_not_found' in str(e.error):
-                print(f"DEBUG: DM 채널을 열 수 없음. 봇 권한 확인 필요")
+                logger.debug(f"DM 채널을 열 수 없음. 봇 권한 확인 필요")
             raise e
     
     def get_users(self, limit: int = 1000) -> List[SlackUser]:
@@ -350,16 +434,7 @@ class SlackAPIClient:
             if user_data.get('deleted', False):
                 continue
                 
-            user = SlackUser(
-                id=user_data['id'],
-                name=user_data['name'],
-                real_name=user_data.get('real_name', ''),
-                email=user_data.get('profile', {}).get('email'),
-                is_bot=user_data.get('is_bot', False),
-                is_admin=user_data.get('is_admin', False),
-                status=user_data.get('profile', {}).get('status_text')
-            )
-            users.append(user)
+            users.append(_parse_user(user_data))
         
         return users
     
@@ -381,17 +456,7 @@ class SlackAPIClient:
         }
         
         result = self._make_request('GET', 'users.info', params=params)
-        user_data = result['user']
-        
-        return SlackUser(
-            id=user_data['id'],
-            name=user_data['name'],
-            real_name=user_data.get('real_name', ''),
-            email=user_data.get('profile', {}).get('email'),
-            is_bot=user_data.get('is_bot', False),
-            is_admin=user_data.get('is_admin', False),
-            status=user_data.get('profile', {}).get('status_text')
-        )
+        return _parse_user(result['user'])
     
     def search_messages(
         self, 
@@ -487,7 +552,7 @@ class SlackAPIClient:
             # 2단계: 파일 업로드
             with open(file_path, 'rb') as f:
                 files = {'file': (file_name, f, 'application/octet-stream')}
-                response = requests.post(upload_url, files=files)
+                response = self._http().post(upload_url, files=files, timeout=self.timeout)
                 
                 if response.status_code != 200:
                     raise SlackAPIError(f"파일 업로드 실패: HTTP {response.status_code}")
@@ -559,14 +624,7 @@ class SlackAPIClient:
         messages = []
         
         for msg_data in result.get('messages', []):
-            message = SlackMessage(
-                text=msg_data.get('text', ''),
-                user=msg_data.get('user', 'unknown'),
-                timestamp=msg_data.get('ts', ''),
-                channel=channel,
-                thread_ts=msg_data.get('thread_ts')
-            )
-            messages.append(message)
+            messages.append(_parse_message(msg_data, channel, default_user='unknown'))
         
         return messages
     
@@ -580,4 +638,458 @@ class SlackAPIClient:
         Raises:
             SlackAPIError: 연결 테스트 실패 시
         """
-        return self._make_request('GET', 'auth.test') 
\ No newline at end of file
+        return self._make_request('GET', 'auth.test') 
+
+
+class AsyncSlackAPIClient:
+    """
+    비동기 Slack API 클라이언트 클래스
+    
+    SlackAPIClient와 같은 기능을 httpx.AsyncClient 연결 풀로 제공합니다.
+    요청을 기다리는 동안 이벤트 루프가 다른 도구 호출을 처리할 수 있고,
+    서로 의존하지 않는 요청은 asyncio.gather로 동시에 보낼 수 있습니다.
+    
+    httpx 연결은 처음 사용한 이벤트 루프에 묶이므로 하나의 이벤트 루프 안에서만 사용합니다.
+    """
+    
+    BASE_URL = SlackAPIClient.BASE_URL
+    
+    def __init__(
+        self, 
+        token: str, 
+        pool_size: int = 10, 
+        connect_timeout: float = 5.0, 
+        read_timeout: float = 30.0
+    ):
+        """
+        비동기 Slack API 클라이언트 초기화
+        
+        Args:
+            token: Slack Bot User OAuth Token
+            pool_size: 동시에 열 수 있는 연결 수이자 유지할 keep-alive 연결 수 (0이면 제한 없이 매번 새 연결)
+            connect_timeout: 연결 제한 시간 (초)
+            read_timeout: 응답 대기 제한 시간 (초)
+        """
+        self.token = token
+        self.headers = {
+            'Authorization': f'Bearer {token}',
+            'Content-Type': 'application/json; charset=utf-8',
+            'User-Agent': 'SlackMCP/1.0'
+        }
+        self.pool_size = pool_size
+        limits = httpx.Limits(
+            max_connections=pool_size or None,
+            max_keepalive_connections=pool_size
+        )
+        # 인증 헤더는 파일 업로드 URL에 보내지 않도록 요청마다 전달
+        self.client = httpx.AsyncClient(
+            limits=limits,
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout)
+        )
+    
+    async def aclose(self):
+        """연결 풀의 keep-alive 연결을 닫습니다."""
+        await self.client.aclose()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        await self.aclose()
+    
+    async def _make_request(
+        self, 
+        method: str, 
+        endpoint: str, 
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """
+        Slack API에 비동기 HTTP 요청을 보냅니다.
+        
+        Args:
+            method: HTTP 메서드 (GET, POST 등)
+            endpoint: API 엔드포인트
+            data: 요청 본문 데이터
+            params: URL 쿼리 파라미터
+            
+        Returns:
+            API 응답 딕셔너리
+            
+        Raises:
+            SlackAPIError: API 요청 실패 시
+        """
+        url = f"{self.BASE_URL}/{endpoint}"
+        
+        logger.debug(f"API 요청 - {method} {endpoint}")
+        if data:
+            logger.debug(f"요청 데이터: {data}")
+        if params:
+            logger.debug(f"요청 파라미터: {params}")
+        
+        # requests와 같이 bool 파라미터는 'True'/'False' 문자열로 전송
+        if params:
+            params = {key: str(value) if isinstance(value, bool) else value for key, value in params.items()}
+        
+        try:
+            if method.upper() == 'GET':
+                response = await self.client.get(url, headers=self.headers, params=params)
+            else:
+                response = await self.client.post(url, headers=self.headers, json=data)
+            
+            logger.debug(f"HTTP 응답 상태: {response.status_code}")
+            response.raise_for_status()
+            return _check_result(response.json())
+            
+        except httpx.HTTPError as e:
+            logger.debug(f"네트워크 오류: {str(e)}")
+            raise SlackAPIError(f"Network error: {str(e)}")
+        except json.JSONDecodeError as e:
+            logger.debug(f"JSON 파싱 오류: {str(e)}")
+            raise SlackAPIError(f"JSON decode error: {str(e)}")
+    
+    async def send_message(self, channel: str, text: str, thread_ts: Optional[str] = None) -> Dict[str, Any]:
+        """
+        채널에 메시지를 전송합니다.
+        
+        Args:
+            channel: 채널 ID 또는 채널명 (예: #general, C1234567890)
+            text: 전송할 메시지 내용 (UTF-8 지원)
+            thread_ts: 스레드 타임스탬프 (스레드 답글인 경우)
+            
+        Returns:
+            전송된 메시지 정보
+        """
+        # 채널명이 #으로 시작하면 제거
+        if channel.startswith('#'):
+            channel = channel[1:]
+        
+        data = {
+            'channel': channel,
+            'text': text,
+            'unfurl_links': True,
+            'unfurl_media': True
+        }
+        
+        if thread_ts:
+            data['thread_ts'] = thread_ts
+        
+        return await self._make_request('POST', 'chat.postMessage', data)
+    
+    async def get_channels(self, exclude_archived: bool = True) -> List[SlackChannel]:
+        """
+        접근 가능한 모든 채널 목록을 조회합니다.
+        
+        Args:
+            exclude_archived: 아카이브된 채널 제외 여부
+            
+        Returns:
+            채널 목록
+        """
+        try:
+            params = {
+                'types': 'public_channel',  # 공개 채널만 조회
+                'exclude_archived': exclude_archived,
+                'limit': 1000
+            }
+            
+            result = await self._make_request('GET', 'conversations.list', params=params)
+            return [_parse_channel(channel_data) for channel_data in result.get('channels', [])]
+            
+        except SlackAPIError as e:
+            if 'missing_scope' in str(e.error):
+                raise SlackAPIError(
+                    "채널 목록 조회 권한이 없습니다. 'channels:read' 스코프가 필요합니다."
+                )
+            else:
+                raise e
+    
+    async def get_channel_history(
+        self, 
+        channel_id: str, 
+        limit: int = 10, 
+        oldest: Optional[str] = None,
+        latest: Optional[str] = None
+    ) -> List[SlackMessage]:
+        """
+        채널의 메시지 히스토리를 조회합니다.
+        
+        Args:
+            channel_id: 채널 ID
+            limit: 조회할 메시지 수 (기본값: 10)
+            oldest: 가장 오래된 메시지 타임스탬프
+            latest: 가장 최근 메시지 타임스탬프
+            
+        Returns:
+            메시지 목록
+        """
+        try:
+            params = {
+                'channel': channel_id,
+                'limit': min(limit, 100)  # 최대 100개로 제한
+            }
+            
+            if oldest:
+                params['oldest'] = oldest
+            if latest:
+                params['latest'] = latest
+            
+            result = await self._make_request('GET', 'conversations.history', params=params)
+            return [
+                _parse_message(msg_data, channel_id)
+                for msg_data in result.get('messages', [])
+                if msg_data.get('subtype') not in SKIPPED_MESSAGE_SUBTYPES
+            ]
+            
+        except SlackAPIError as e:
+            if 'missing_scope' in str(e.error):
+                raise SlackAPIError(
+                    "채널 히스토리 조회 권한이 없습니다. 'channels:history' 스코프가 필요합니다."
+                )
+            else:
+                raise e
+    
+    async def send_direct_message(self, user_id: str, text: str) -> Dict[str, Any]:
+        """
+        특정 사용자에게 다이렉트 메시지를 전송합니다.
+        
+        DM 채널 열기(conversations.open)와 메시지 전송(chat.postMessage)은 순서대로 실행해야 하므로,
+        수신자 정보 조회 등 독립적인 요청은 호출하는 쪽에서 이 코루틴과 함께 gather합니다.
+        
+        Args:
+            user_id: 메시지를 받을 사용자의 ID
+            text: 전송할 메시지 내용
+            
+        Returns:
+            전송된 메시지 정보
+        """
+        logger.debug(f"DM 전송 시작 - 사용자 ID: {user_id}")
+        
+        try:
+            dm_result = await self._make_request('POST', 'conversations.open', {'users': user_id})
+            dm_channel_id = dm_result['channel']['id']
+            logger.debug(f"DM 채널 ID 획득: {dm_channel_id}")
+            
+            result = await self.send_message(dm_channel_id, text)
+            logger.debug(f"DM 전송 성공!")
+            return result
+            
+        except SlackAPIError as e:
+            logger.debug(f"DM 전송 실패 - 오류: {e.error}")
+            raise e
+    
+    async def get_users(self, limit: int = 1000) -> List[SlackUser]:
+        """
+        워크스페이스의 모든 사용자 목록을 조회합니다.
+        
+        Args:
+            limit: 조회할 사용자 수 (최대: 1000)
+            
+        Returns:
+            사용자 목록
+        """
+        params = {
+            'limit': min(limit, 1000)
+        }
+        
+        result = await self._make_request('GET', 'users.list', params=params)
+        return [
+            _parse_user(user_data)
+            for user_data in result.get('members', [])
+            if not user_data.get('deleted', False)
+        ]
+    
+    async def get_user_info(self, user_id: str) -> SlackUser:
+        """
+        특정 사용자의 상세 정보를 조회합니다.
+        
+        Args:
+            user_id: 조회할 사용자의 ID
+            
+        Returns:
+            사용자 정보
+        """
+        result = await self._make_request('GET', 'users.info', params={'user': user_id})
+        return _parse_user(result['user'])
+    
+    async def search_messages(
+        self, 
+        query: str, 
+        count: int = 20,
+        sort: str = 'timestamp'
+    ) -> List[Dict[str, Any]]:
+        """
+        메시지를 검색합니다.
+        
+        Args:
+            query: 검색 쿼리 (예: "hello", "in:#general hello")
+            count: 반환할 결과 수 (기본값: 20, 최대: 100)
+            sort: 정렬 방식 (timestamp, score)
+            
+        Returns:
+            검색 결과 목록
+        """
+        try:
+            params = {
+                'query': query,
+                'count': min(count, 100),
+                'sort': sort
+            }
+            
+            result = await self._make_request('GET', 'search.messages', params=params)
+            return result.get('messages', {}).get('matches', [])
+            
+        except SlackAPIError as e:
+            if e.error in ['not_allowed_token_type', 'missing_scope']:
+                raise SlackAPIError(
+                    f"메시지 검색 권한이 없습니다. Slack 앱의 OAuth 스코프에 'search:read'를 추가해주세요. "
+                    f"현재 오류: {e.error}"
+                )
+            else:
+                raise e
+    
+    async def _resolve_channel_id(self, channels: Union[str, List[str]]) -> Union[str, List[str]]:
+        """채널명이 주어진 경우 채널 ID로 변환합니다."""
+        if isinstance(channels, str) and not channels.startswith('C'):
+            for channel in await self.get_channels():
+                if channel.name == channels:
+                    return channel.id
+            raise SlackAPIError(f"채널을 찾을 수 없습니다: {channels}")
+        return channels
+    
+    async def upload_file(
+        self, 
+        channels: Union[str, List[str]], 
+        file_path: str,
+        title: Optional[str] = None,
+        initial_comment: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        채널에 파일을 업로드합니다.
+        
+        채널명 → ID 변환(conversations.list)과 업로드 URL 요청(files.getUploadURLExternal)은
+        서로 독립적이므로 동시에 보냅니다.
+        
+        Args:
+            channels: 채널 ID 또는 채널명
+            file_path: 업로드할 파일 경로
+            title: 파일 제목 (선택사항)
+            initial_comment: 초기 코멘트 (선택사항)
+            
+        Returns:
+            업로드 결과
+        """
+        if not os.path.exists(file_path):
+            raise SlackAPIError(f"파일을 찾을 수 없습니다: {file_path}")
+        
+        try:
+            file_size = os.path.getsize(file_path)
+            file_name = os.path.basename(file_path)
+            
+            # 1단계: 채널 ID 확인과 업로드 URL 요청을 동시에
+            upload_data = {
+                'filename': file_name,
+                'length': file_size
+            }
+            channels, upload_result = await asyncio.gather(
+                self._resolve_channel_id(channels),
+                self._make_request('GET', 'files.getUploadURLExternal', params=upload_data)
+            )
+            upload_url = upload_result['upload_url']
+            file_id = upload_result['file_id']
+            
+            # 2단계: 파일 업로드 (파일 전체를 메모리에 올리지 않고 조각 단위로 스트리밍, 읽기는 스레드에서)
+            # 업로드 URL은 multipart 외에 원본 바이트 본문도 받으므로 Content-Length를 지정해 그대로 전송
+            response = await self.client.post(
+                upload_url,
+                content=_iter_file_chunks(file_path),
+                headers={'Content-Type': 'application/octet-stream', 'Content-Length': str(file_size)}
+            )
+            
+            if response.status_code != 200:
+                raise SlackAPIError(f"파일 업로드 실패: HTTP {response.status_code}")
+            
+            # 3단계: 업로드 완료 처리
+            complete_data = {
+                'files': [
+                    {
+                        'id': file_id,
+                        'title': title or file_name
+                    }
+                ],
+                'channel_id': channels if isinstance(channels, str) else channels[0]
+            }
+            
+            if initial_comment:
+                complete_data['initial_comment'] = initial_comment
+            
+            return await self._make_request('POST', 'files.completeUploadExternal', data=complete_data)
+            
+        except httpx.HTTPError as e:
+            raise SlackAPIError(f"파일 업로드 중 네트워크 오류: {str(e)}")
+        except Exception as e:
+            raise SlackAPIError(f"파일 업로드 실패: {str(e)}")
+    
+    async def add_reaction(self, channel: str, timestamp: str, name: str) -> Dict[str, Any]:
+        """
+        메시지에 이모지 반응을 추가합니다.
+        
+        Args:
+            channel: 채널 ID
+            timestamp: 메시지 타임스탬프
+            name: 이모지 이름 (예: thumbsup, heart)
+            
+        Returns:
+            반응 추가 결과
+        """
+        data = {
+            'channel': channel,
+            'timestamp': timestamp,
+            'name': name
+        }
+        
+        return await self._make_request('POST', 'reactions.add', data)
+    
+    async def get_thread_replies(self, channel: str, thread_ts: str) -> List[SlackMessage]:
+        """
+        스레드의 모든 답글을 조회합니다.
+        
+        Args:
+            channel: 채널 ID
+            thread_ts: 스레드 타임스탬프
+            
+        Returns:
+            스레드 답글 목록
+        """
+        params = {
+            'channel': channel,
+            'ts': thread_ts
+        }
+        
+        result = await self._make_request('GET', 'conversations.replies', params=params)
+        return [
+            _parse_message(msg_data, channel, default_user='unknown')
+            for msg_data in result.get('messages', [])
+        ]
+    
+    async def test_connection(self) -> Dict[str, Any]:
+        """
+        API 연결을 테스트합니다.
+        
+        Returns:
+            연결 테스트 결과
+        """
+        return await self._make_request('GET', 'auth.test')
+
+
+async def _iter_file_chunks(file_path: str, chunk_size: int = UPLOAD_CHUNK_SIZE):
+    """파일을 chunk_size 바이트씩 읽어 내보내는 비동기 생성기 (블로킹 파일 I/O는 스레드에서 실행)"""
+    f = await asyncio.to_thread(open, file_path, 'rb')
+    try:
+        while True:
+            chunk = await asyncio.to_thread(f.read, chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        await asyncio.to_thread(f.close)
@@ -18,7 +18,7 @@ load_dotenv()
 
 # FastMCP 및 Slack API 클라이언트 임포트
 from fastmcp import FastMCP
-from slack_api import SlackAPIClient, SlackAPIError, SlackMessage, SlackChannel, SlackUser
+from slack_api import SlackAPIClient, AsyncSlackAPIClient, SlackAPIError, SlackMessage, SlackChannel, SlackUser
 
 # MCP 서버 인스턴스 생성
 mcp = FastMCP("Slack MCP Server")
@@ -28,7 +28,15 @@ slack_token = os.getenv("SLACK_BOT_TOKEN")
 if not slack_token:
     raise ValueError("SLACK_BOT_TOKEN 환경 변수가 설정되지 않았습니다.")
 
-slack_client = SlackAPIClient(slack_token)
+# HTTP 연결 풀 설정 (선택, 기본값: 연결 10개, 연결 제한 5초, 응답 제한 30초)
+client_options = dict(
+    pool_size=int(os.getenv("SLACK_HTTP_POOL_SIZE", "10")),
+    connect_timeout=float(os.getenv("SLACK_CONNECT_TIMEOUT", "5")),
+    read_timeout=float(os.getenv("SLACK_READ_TIMEOUT", "30"))
+)
+
+# 도구는 비동기 클라이언트를 사용하므로 Slack 응답을 기다리는 동안 다른 도구 호출이 막히지 않음
+slack_client = AsyncSlackAPIClient(slack_token, **client_options)
 
 
 def format_timestamp(timestamp: str) -> str:
@@ -164,7 +172,7 @@ async def send_slack_message(channel: str, text: str) -> str:
         전송 결과 메시지
     """
     try:
-        result = slack_client.send_message(channel, text)
+        result = await slack_client.send_message(channel, text)
         
         # 전송된 메시지 정보 추출
         message_ts = result.get('ts', '')
@@ -192,7 +200,7 @@ async def get_slack_channels() -> str:
         채널 목록 정보 (ID, 이름, 공개/비공개 여부, 멤버십 상태 포함)
     """
     try:
-        channels = slack_client.get_channels()
+        channels = await slack_client.get_channels()
         
         if not channels:
             return "접근 가능한 채널이 없습니다."
@@ -235,7 +243,7 @@ async def get_slack_channel_history(channel_id: str, limit: int = 10) -> str:
         # limit 값 검증
         limit = max(1, min(limit, 100))
         
-        messages = slack_client.get_channel_history(channel_id, limit)
+        messages = await slack_client.get_channel_history(channel_id, limit)
         
         if not messages:
             return f"채널 {channel_id}에 메시지가 없습니다."
@@ -267,17 +275,23 @@ async def send_slack_direct_message(user_id: str, text: str) -> str:
         전송 결과 메시지
     """
     try:
-        result = slack_client.send_direct_message(user_id, text)
+        # DM 전송(conversations.open → chat.postMessage)과 수신자 정보 조회(users.info)를 동시에 실행
+        result, user_info = await asyncio.gather(
+            slack_client.send_direct_message(user_id, text),
+            slack_client.get_user_info(user_id),
+            return_exceptions=True
+        )
+        if isinstance(result, BaseException):
+            raise result
         
         # 전송된 메시지 정보 추출
         message_ts = result.get('ts', '')
         
-        # 사용자 정보 조회
-        try:
-            user_info = slack_client.get_user_info(user_id)
-            user_display = f"{user_info.real_name} (@{user_info.name})"
-        except:
+        # 사용자 정보 조회에 실패하면 사용자 ID로 표시
+        if isinstance(user_info, BaseException):
             user_display = user_id
+        else:
+            user_display = f"{user_info.real_name} (@{user_info.name})"
         
         return f"✅ 다이렉트 메시지가 성공적으로 전송되었습니다!\n" \
                f"수신자: {user_display}\n" \
@@ -311,7 +325,7 @@ async def get_slack_users(limit: int = 50) -> str:
         # limit 값 검증
         limit = max(1, min(limit, 1000))
         
-        users = slack_client.get_users(limit)
+        users = await slack_client.get_users(limit)
         
         if not users:
             return "사용자를 찾을 수 없습니다."
@@ -354,7 +368,7 @@ async def search_slack_messages(query: str, count: int = 20) -> str:
         # count 값 검증
         count = max(1, min(count, 100))
         
-        results = slack_client.search_messages(query, count)
+        results = await slack_client.search_messages(query, count)
         
         if not results:
             return f"'{query}' 키워드로 검색된 메시지가 없습니다."
@@ -412,7 +426,7 @@ async def upload_slack_file(
             # 채널 ID들인 경우 리스트로 변환
             channel_param = [ch.strip() for ch in channels.split(',')]
         
-        result = slack_client.upload_file(
+        result = await slack_client.upload_file(
             channels=channel_param,
             file_path=file_path,
             title=title,
@@ -455,7 +469,7 @@ async def add_slack_reaction(channel: str, timestamp: str, emoji: str) -> str:
         # 이모지 이름에서 콜론 제거
         emoji = emoji.strip(':')
         
-        result = slack_client.add_reaction(channel, timestamp, emoji)
+        result = await slack_client.add_reaction(channel, timestamp, emoji)
         
         return f"✅ 이모지 반응이 성공적으로 추가되었습니다!\n" \
                f"채널: {channel}\n" \
@@ -484,7 +498,7 @@ async def get_slack_thread_replies(channel: str, thread_ts: str) -> str:
         스레드 답글 목록
     """
     try:
-        replies = slack_client.get_thread_replies(channel, thread_ts)
+        replies = await slack_client.get_thread_replies(channel, thread_ts)
         
         if not replies:
             return f"스레드에 답글이 없습니다.\n채널: {channel}\n스레드: {format_timestamp(thread_ts)}"
@@ -524,7 +538,7 @@ async def send_slack_thread_reply(channel: str, thread_ts: str, text: str) -> st
         답글 전송 결과
     """
     try:
-        result = slack_client.send_message(channel, text, thread_ts)
+        result = await slack_client.send_message(channel, text, thread_ts)
         
         message_ts = result.get('ts', '')
         
@@ -552,7 +566,7 @@ async def test_slack_connection() -> str:
         연결 테스트 결과
     """
     try:
-        result = slack_client.test_connection()
+        result = await slack_client.test_connection()
         
         team_name = result.get('team', 'Unknown')
         user_name = result.get('user', 'Unknown')
@@ -578,18 +592,28 @@ async def test_slack_connection() -> str:
 
 
 
+async def _serve():
+    """stdio로 MCP 서버를 실행하고, 끝나면(취소 포함) 비동기 Slack 클라이언트를 닫습니다."""
+    try:
+        # run()은 자체 이벤트 루프를 시작하므로 이미 실행 중인 루프 안에서는 run_async()를 사용
+        await mcp.run_async(transport="stdio")
+    finally:
+        await slack_client.aclose()
+
+
 def run_server():
     """서버를 실행합니다."""
     try:
         # 연결 테스트
         print("🚀 Slack MCP 서버를 시작합니다...", file=sys.stderr)
         
-        # Slack API 연결 테스트
-        test_result = slack_client.test_connection()
+        # Slack API 연결 테스트 (비동기 클라이언트의 연결은 서버 이벤트 루프에서 열리도록 동기 클라이언트 사용)
+        with SlackAPIClient(slack_token, **client_options) as startup_client:
+            test_result = startup_client.test_connection()
         print(f"✅ Slack API 연결 성공: {test_result.get('team', 'Unknown')}", file=sys.stderr)
         
-        # MCP 서버 실행
-        asyncio.run(mcp.run(transport="stdio"))
+        # MCP 서버 실행 (종료 시 비동기 클라이언트의 연결 풀을 같은 이벤트 루프에서 닫음)
+        asyncio.run(_serve())
         
     except Exception as e:
         print(f"❌ 서버 시작 실패: {str(e)}", file=sys.stderr)